@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
+from functools import lru_cache
 
 from telethon.errors import SessionPasswordNeededError
 
@@ -22,6 +23,7 @@ DB_PATH = Path(__file__).parent.parent / "accounts.db"
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
 def normalize_phone(phone: str) -> str:
     """
     Normalize phone number to consistent format (digits only, no + prefix).
@@ -535,6 +537,21 @@ def init_backups_table():
                 FOREIGN KEY (phone) REFERENCES accounts(phone)
             )
         ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_backups_phone_created ON backups(phone, created_at DESC)')
+
+        # Aggregate tag counts for each account's latest backup (lets /api/stats skip the CSV)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS backup_stats (
+                phone TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                total INTEGER NOT NULL,
+                dev_blue INTEGER NOT NULL,
+                dev_yellow INTEGER NOT NULL,
+                kol_blue INTEGER NOT NULL,
+                kol_yellow INTEGER NOT NULL
+            )
+        ''')
 
         conn.commit()
         conn.close()
@@ -630,6 +647,66 @@ def get_backup_history(phone: str = None, limit: int = 10) -> List[Dict]:
         return []
 
 
+def save_backup_stats(phone: str, path: str, mtime: float, counts: Tuple[int, int, int, int, int]) -> bool:
+    """
+    Store tag counts for an account's latest backup file
+
+    Args:
+        phone: Phone number of account (will be normalized)
+        path: Path to the backup file the counts were taken from
+        mtime: Modification time of that file
+        counts: (total, dev_blue, dev_yellow, kol_blue, kol_yellow)
+
+    Returns:
+        True if stored successfully, False otherwise
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            INSERT OR REPLACE INTO backup_stats
+                (phone, path, mtime, total, dev_blue, dev_yellow, kol_blue, kol_yellow)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (normalize_phone(phone), path, mtime, *counts))
+
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        logger.error(f"❌ Error saving backup stats: {str(e)}")
+        return False
+
+
+def get_backup_stats(phone: str, mtime: float) -> Optional[Tuple[int, int, int, int, int]]:
+    """
+    Get stored tag counts for an account's latest backup
+
+    Args:
+        phone: Phone number of account (will be normalized)
+        mtime: Current modification time of the backup file
+
+    Returns:
+        (total, dev_blue, dev_yellow, kol_blue, kol_yellow), or None if missing or stale
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT total, dev_blue, dev_yellow, kol_blue, kol_yellow
+            FROM backup_stats
+            WHERE phone = ? AND mtime = ?
+        ''', (normalize_phone(phone), mtime))
+
+        row = cursor.fetchone()
+        conn.close()
+        return tuple(row) if row else None
+    except Exception as e:
+        logger.error(f"❌ Error getting backup stats: {str(e)}")
+        return None
+
+
 # ============================================================================
 # OPERATIONS DATABASE FUNCTIONS
 # ============================================================================
@@ -9,22 +9,30 @@ import json
 import logging
 import sys
 import io
+import time
 import uuid
 import os
 import csv
 from pathlib import Path
-from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_file
+from datetime import datetime, timedelta, timezone
+from flask import Flask, request, jsonify, send_file, g, has_app_context
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from werkzeug.utils import secure_filename
 import threading
-from typing import Dict, Any, Optional, List, Tuple, Set
+from typing import Dict, Any, Optional, List, Tuple, Set, Union, Callable, Iterator
+from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
 import traceback
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache, cached_property, partial
 import random
+import re
+import hashlib
 import glob
-import math
+import itertools
+import queue
 
 # Telethon imports (previously in matrix.py)
 from telethon import TelegramClient
@@ -43,6 +51,13 @@ from telethon.tl.types import User, Chat, Channel
 
 # Import TGClient for StringSession-based connections (eliminates SQLite locking)
 from tg_client import TGClient, get_session_path, session_exists, delete_session
+from async_loop import AsyncEventLoopThread, run_coroutine_sync
+
+# Optional: orjson for faster JSON encoding of large responses (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Fix Windows encoding
 if sys.platform == 'win32':
@@ -52,17 +67,94 @@ if sys.platform == 'win32':
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider, DefaultJSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (used by every jsonify call)."""
+
+        @staticmethod
+        def _dumpb(obj) -> bytes:
+            # Match Flask's DefaultJSONProvider output: dates/datetimes are passed through to
+            # its default hook (HTTP date strings, not orjson's ISO 8601), keys are sorted.
+            # Other types orjson can't encode natively (Decimal, UUID subclasses, ...) use the same hook
+            return orjson.dumps(obj, default=DefaultJSONProvider.default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+                                | orjson.OPT_PASSTHROUGH_DATETIME)
+
+        def dumps(self, obj, **kwargs):
+            return self._dumpb(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            # Hand orjson's bytes straight to the response (skips the str decode/re-encode round trip)
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(self._dumpb(obj), mimetype='application/json')
+
+    app.json = OrjsonProvider(app)
+
+    class _OrjsonSocketJSON:
+        """json-module stand-in for Socket.IO packets (orjson is faster than Flask's stdlib-based json)."""
+
+        @staticmethod
+        def dumps(obj, *args, **kwargs):
+            return app.json.dumps(obj)
+
+        @staticmethod
+        def loads(s, *args, **kwargs):
+            return orjson.loads(s)
+
+    _socketio_json = {'json': _OrjsonSocketJSON}
+else:
+    _socketio_json = {}
+
 # Initialize Socket.IO for real-time progress updates
 socketio = SocketIO(
     app,
     cors_allowed_origins="*",
     async_mode='threading',  # Use threading mode for compatibility with sync code
     logger=False,
-    engineio_logger=False
+    engineio_logger=False,
+    **_socketio_json
 )
 
-# Thread pool for parallel operations (max 5 concurrent account operations)
-operation_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="matrix_op")
+class BoundedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor that caps running + queued work.
+
+    submit() raises queue.Full instead of queueing without limit, so callers
+    can shed load (HTTP 503) rather than pile up operations.
+    """
+
+    def __init__(self, max_workers: int, queue_size: int, thread_name_prefix: str = ""):
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise queue.Full("Operation queue is full")
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+# Thread pool for parallel operations (max 5 running, 32 waiting; more -> 503)
+operation_executor = BoundedThreadPoolExecutor(max_workers=5, queue_size=32, thread_name_prefix="matrix_op")
+
+# Worker pool for single-account import operations (reused threads, bounded concurrency)
+_IMPORT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="import")
+
+# Thread pool for multi-account /api/stats (backup CSV reads overlap on disk IO)
+_STATS_POOL = ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 4) * 2), thread_name_prefix="stats")
+
+# Thread pool for endpoint disk writes that can overlap with Telegram RPCs (CSV exports)
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="matrix_io")
 
 # Setup logging for API server
 LOG_DIR = Path(__file__).parent.parent / "logs"
@@ -96,6 +188,79 @@ operation_state = {
 
 operation_lock = threading.Lock()
 
+# Strips '+', '-' and spaces from phone numbers in a single pass
+_PHONE_STRIP_TABLE = str.maketrans('', '', '+- ')
+
+
+@lru_cache(maxsize=1024)
+def _clean_phone(phone: str) -> str:
+    """Phone number without '+', '-' or spaces (the same few phones recur on every poll)."""
+    return phone.translate(_PHONE_STRIP_TABLE)
+
+
+# (epoch seconds, ISO string) - response timestamps only need ~1s resolution
+_ts_cache: Tuple[float, str] = (0.0, '')
+
+
+def _now_iso() -> str:
+    """Current local time as ISO string, recomputed at most twice a second (for poll responses)."""
+    global _ts_cache
+    t = time.time()
+    cached_t, cached_iso = _ts_cache
+    if t - cached_t > 0.5:
+        cached_iso = datetime.fromtimestamp(t).isoformat()
+        _ts_cache = (t, cached_iso)
+    return cached_iso
+
+
+def _error_json(error: str):
+    """
+    JSON body for a 500 response.
+
+    The traceback is only formatted in debug mode (it walks every frame and
+    reads source lines from disk); otherwise it goes to the debug log, which
+    formats it lazily.
+    """
+    if app.debug:
+        return jsonify({'error': error, 'traceback': traceback.format_exc()})
+    logger.debug("Request failed", exc_info=True)
+    return jsonify({'error': error})
+
+# Wait time in a FloodWait / rate-limit error message ("... wait 345 seconds ...")
+_FLOODWAIT_RE = re.compile(r'(\d+)\s*(?:seconds?|s)')
+
+# scan_replies log lines worth forwarding to the frontend (only "blue contacts" is case-insensitive)
+_LOG_KEEP_RE = re.compile(r'✅ REPLY DETECTED|📧 Dialog|📊|(?i:blue contacts)')
+
+# Contact tag emojis, combined tags first so they are removed as a unit
+_EMOJI_STRIP_RE = re.compile('🔵💻|🟡💻|🔵📢|🟡📢|🔵|🟡|💻|📢')
+
+
+def _classify_contact(first_name: str) -> Tuple[str, str]:
+    """
+    Contact type and status from its name tags.
+
+    Returns:
+        (type, status) - type in {'dev', 'kol', ''}, status in {'blue', 'yellow', ''}
+    """
+    if '💻' in first_name:
+        c_type = 'dev'
+    elif '📢' in first_name:
+        c_type = 'kol'
+    else:
+        return ('', '')
+
+    if '🔵' in first_name:
+        return (c_type, 'blue')
+    if '🟡' in first_name:
+        return (c_type, 'yellow')
+    return (c_type, '')
+
+# Section banners for console/operation logs
+_BANNER = "=" * 70
+_BANNER_LINE = "\n" + _BANNER
+_BANNER_END = _BANNER + "\n"
+
 
 def update_operation_state(operation: str, progress: int, total: int, status: str, message: str = ''):
     """Thread-safe operation state update"""
@@ -176,6 +341,111 @@ class TelegramRateLimitError(Exception):
         super().__init__(self.message)
 
 
+# ============================================================================
+# TELEGRAM RATE LIMITER (token bucket + shared FloodWait fence)
+# ============================================================================
+
+class TelegramRateLimiter:
+    """
+    Per-account token bucket with a FloodWait fence shared by every caller.
+
+    When Telegram answers with FloodWaitError, trip() moves `flood_until`
+    forward and every coroutine calling acquire() for the same account waits
+    until the fence has passed instead of hammering the API and collecting
+    another flood wait.
+
+    Uses a monotonic deadline (not asyncio.Event) because callers run on
+    different event loops (the shared operation loop, the inbox loop), and an
+    asyncio primitive would be bound to whichever loop touched it first.
+
+    Usage:
+        limiter = get_rate_limiter(phone)
+        await limiter.acquire()
+        await client(AddContactRequest(...))
+    """
+
+    def __init__(self, rate_per_second: float = 1.0, burst: int = 3):
+        """
+        Args:
+            rate_per_second: Sustained request rate (tokens refilled per second)
+            burst: Bucket capacity (max requests allowed back-to-back)
+        """
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens: float = float(burst)
+        self.last_refill: float = time.monotonic()
+        self.flood_until: float = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        """Wait for the flood fence to pass, then take one token from the bucket."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.flood_until:
+                    wait = self.flood_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                    self.last_refill = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    async def trip(self, seconds: float, wait: bool = True):
+        """
+        Raise the flood fence for `seconds` (never shortens an existing fence).
+
+        Args:
+            seconds: How long Telegram asked us to back off
+            wait: If True, sleep until the fence passes before returning
+        """
+        with self._lock:
+            self.flood_until = max(self.flood_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+            remaining = self.flood_until - time.monotonic()
+        if wait and remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def remaining(self) -> float:
+        """Seconds left on the flood fence (0 if not rate limited)."""
+        return max(0.0, self.flood_until - time.monotonic())
+
+
+_rate_limiters: Dict[str, TelegramRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(phone: str) -> TelegramRateLimiter:
+    """Get or create the shared rate limiter for an account (FloodWait is per account)."""
+    clean_phone = _clean_phone(phone) if phone else ''
+    with _rate_limiters_lock:
+        if clean_phone not in _rate_limiters:
+            _rate_limiters[clean_phone] = TelegramRateLimiter()
+        return _rate_limiters[clean_phone]
+
+
+def _link_latest(src: Path, latest: Path) -> None:
+    """
+    Point a "latest" backup file at `src` without copying its data.
+
+    Hard-links `src` to a temp name and atomically renames it over `latest`,
+    so readers never see a missing or half-written file, and the previous
+    inode (shared with an older timestamped backup) is never rewritten in place.
+    Falls back to a full copy if hard links aren't supported (e.g. cross-device).
+    """
+    tmp = latest.with_name(latest.name + '.tmp')
+    try:
+        if tmp.exists():
+            tmp.unlink()
+        os.link(src, tmp)
+        os.replace(tmp, latest)
+    except OSError:
+        import shutil
+        shutil.copy2(src, latest)
+
+
 # ============================================================================
 # CONTACT CACHE WITH AUTO-BACKUP
 # Reduces API calls AND keeps per-account backup CSVs fresh automatically
@@ -211,6 +481,7 @@ class ContactCache:
         self._fetch_count = 0
         self._cache_hits = 0
         self._backup_count = 0
+        self._dirty = False  # In-memory contacts changed since the last backup
 
         # Backup directory will be set after LOGS_DIR is defined
         self._backup_dir = None
@@ -247,7 +518,7 @@ class ContactCache:
 
             # Update phone if provided
             if phone:
-                self._current_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+                self._current_phone = _clean_phone(phone)
 
             cache_valid = (
                 self._contacts is not None and
@@ -300,32 +571,33 @@ class ContactCache:
             # Extract contact data
             contacts_data = []
             for user in contacts_result.users:
+                first_name = user.first_name or ''
+                c_type, c_status = _classify_contact(first_name)
                 contacts_data.append({
                     'user_id': user.id,
                     'username': user.username or '',
-                    'first_name': user.first_name or '',
+                    'first_name': first_name,
                     'last_name': user.last_name or '',
                     'phone': user.phone or '',
                     'is_bot': getattr(user, 'bot', False),
                     'is_contact': getattr(user, 'contact', False),
                     'is_mutual_contact': getattr(user, 'mutual_contact', False),
                     'backup_date': timestamp,
+                    'type': c_type,
+                    'status': c_status,
                 })
 
             fieldnames = ['user_id', 'username', 'first_name', 'last_name', 'phone',
-                         'is_bot', 'is_contact', 'is_mutual_contact', 'backup_date']
+                         'is_bot', 'is_contact', 'is_mutual_contact', 'backup_date', 'type', 'status']
 
             # Write timestamped backup
-            with open(backup_path, 'w', newline='', encoding='utf-8') as f:
+            with open(backup_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(contacts_data)
 
-            # Write/overwrite "latest" file (for dashboard to read)
-            with open(latest_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(contacts_data)
+            # Point "latest" file at the new backup (for dashboard to read)
+            _link_latest(backup_path, latest_path)
 
             self._last_backup_path = latest_path
 
@@ -367,9 +639,47 @@ class ContactCache:
 
             conn.commit()
             conn.close()
+            _resolve_latest_backup.cache_clear()
         except Exception as e:
             logger.warning(f"Could not register backup in DB: {e}")
 
+    def append(self, new_users) -> bool:
+        """
+        Merge newly added/updated users into the cached contacts without refetching.
+
+        Users already in the cache (same id) are replaced, so renamed contacts
+        don't show up twice. Call persist() afterwards to refresh the backup CSV.
+
+        Args:
+            new_users: Telegram User objects returned by AddContactRequest
+
+        Returns:
+            True if the cache was updated, False if nothing is cached yet
+            (caller should fall back to a full refresh)
+        """
+        if self._contacts is None:
+            return False
+        if not new_users:
+            return True
+
+        new_by_id = {u.id: u for u in new_users}
+        users = self._contacts.users
+        users[:] = [u for u in users if u.id not in new_by_id]
+        users.extend(new_by_id.values())
+        self._dirty = True
+        logger.debug(f"Contact cache updated in place (+{len(new_by_id)} users)")
+        return True
+
+    async def persist(self) -> Optional[Path]:
+        """Write the backup CSV for in-memory changes made via append()."""
+        if not self._dirty or self._contacts is None or not self._current_phone:
+            return None
+        backup_path = await self._save_backup(self._contacts, self._current_phone)
+        if backup_path:
+            self._dirty = False
+            self._backup_count += 1
+        return backup_path
+
     def invalidate(self):
         """Force cache to refresh on next get_contacts() call."""
         self._last_fetch = 0
@@ -379,7 +689,7 @@ class ContactCache:
         """Get path to the latest backup file for a phone number."""
         self._ensure_backup_dir()
         if phone:
-            clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(phone)
             return self._backup_dir / f"contacts_{clean_phone}_latest.csv"
         return self._last_backup_path
 
@@ -407,7 +717,7 @@ class PerAccountCacheManager:
 
     def get_cache(self, phone: str) -> ContactCache:
         """Get or create cache for a specific account"""
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
         with self._lock:
             if clean_phone not in self._caches:
                 self._caches[clean_phone] = ContactCache(ttl_seconds=self._ttl)
@@ -417,7 +727,7 @@ class PerAccountCacheManager:
         """Invalidate cache for specific account or all caches"""
         with self._lock:
             if phone:
-                clean = phone.replace('+', '').replace('-', '').replace(' ', '')
+                clean = _clean_phone(phone)
                 if clean in self._caches:
                     self._caches[clean].invalidate()
             else:
@@ -446,6 +756,9 @@ SESSIONS_DIR = Path(__file__).parent.parent / "sessions"
 SESSIONS_DIR.mkdir(exist_ok=True)
 LOGS_DIR = Path(__file__).parent.parent / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
+CSV_WRITE_BUFFER = 1 << 20  # 1 MiB write buffer for CSV exports (fewer write() syscalls)
+CSV_READ_BUFFER = 1 << 20  # 1 MiB read buffer for backup CSV scans (fewer read() syscalls)
+AUTO_BACKUP_MIN_ADDED = 50  # Full contact backup after an import only once this many contacts were added
 
 
 def cleanup_session_locks():
@@ -491,6 +804,7 @@ def save_config(config: Dict):
         with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
         logger.info("✅ Saved config to config.json")
+        invalidate_manager()  # Global API credentials may have changed
     except Exception as e:
         logger.error(f"❌ Error saving config: {str(e)}")
 
@@ -506,9 +820,9 @@ def get_api_credentials() -> Tuple[int, str]:
         return config['api_id'], config['api_hash']
 
     # First run: ask for credentials
-    print("\n" + "="*70)
+    print(_BANNER_LINE)
     print("🔐 FIRST-TIME SETUP: Telegram API Credentials")
-    print("="*70)
+    print(_BANNER)
     print("\nGo to https://my.telegram.org/apps and get your API credentials:")
     print("\n")
 
@@ -550,7 +864,7 @@ def get_default_session() -> Optional[str]:
 def set_default_session(phone_number: str):
     """Set default session in database"""
     try:
-        clean_phone = phone_number.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone_number)
         set_default_account(clean_phone)
     except Exception:
         # Fallback to config.json for backward compatibility
@@ -643,8 +957,9 @@ from account_manager import (
     get_default_account, set_default_account, get_db_connection,
     normalize_phone, init_operations_tables, update_account_proxy,
     db_create_operation, db_get_operation, db_update_account_progress,
-    db_add_operation_log, db_complete_operation, db_get_active_operations,
-    db_get_recent_operations,
+    db_add_operation_log, db_complete_operation, db_get_active_operations, db_update_operation_status,
+    db_get_recent_operations, init_backups_table, log_backup, get_backup_history,
+    save_backup_stats, get_backup_stats,
     # Inbox management functions
     init_inbox_tables, inbox_get_or_create_conversation, inbox_update_conversation,
     inbox_get_conversations, inbox_insert_message, inbox_get_messages,
@@ -657,6 +972,46 @@ from account_manager import (
 )
 logger.info("✅ Successfully imported account_manager")
 
+
+@lru_cache(maxsize=512)
+def _cached_account_by_phone(phone: str) -> Optional[Dict]:
+    """
+    Memoized get_account_by_phone for hot paths (exports, multi-account imports).
+    Cleared via _cached_account_by_phone.cache_clear() whenever accounts change.
+    """
+    return get_account_by_phone(phone)
+
+
+# Read connections reused within a request (flask.g) or a background thread (thread-local)
+_db_local = threading.local()
+
+
+def _get_pooled_conn():
+    """
+    Get a SQLite connection that is reused for the rest of the request/thread.
+
+    Callers must NOT close it - request connections are closed on app-context
+    teardown, thread-local ones live as long as their thread.
+    """
+    if has_app_context():
+        conn = g.get('db')
+        if conn is None:
+            conn = g.db = get_db_connection()
+        return conn
+
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        conn = _db_local.conn = get_db_connection()
+    return conn
+
+
+@app.teardown_appcontext
+def _close_pooled_conn(exc):
+    """Close the request's pooled DB connection, if one was opened."""
+    conn = g.pop('db', None)
+    if conn is not None:
+        conn.close()
+
 # Import inbox manager
 from inbox_manager import InboxManager
 logger.info("✅ Successfully imported inbox_manager")
@@ -669,6 +1024,23 @@ logger.info("✅ Successfully imported GlobalConnectionManager")
 manager = None
 manager_lock = threading.Lock()
 
+# Resolved per-account manager settings: clean_phone -> (api_id, api_hash, proxy)
+# Managers themselves are not shared - each operation connects its own client or
+# borrows an idle one from client_pool
+_MANAGER_CACHE: Dict[str, Tuple[Any, str, Optional[str]]] = {}
+_MANAGER_LOCK = threading.Lock()
+
+
+def invalidate_manager(phone: Optional[str] = None):
+    """Drop cached manager settings for one account (or all accounts when phone is None)."""
+    with _MANAGER_LOCK:
+        if phone is None:
+            _MANAGER_CACHE.clear()
+        else:
+            _MANAGER_CACHE.pop(_clean_phone(phone), None)
+    # Pooled clients were built from the old settings
+    client_pool.evict(phone)
+
 # Global inbox manager instance (for real-time messaging)
 inbox_manager: Optional[InboxManager] = None
 inbox_manager_thread: Optional[threading.Thread] = None
@@ -679,19 +1051,22 @@ class AccountLockManager:
     Per-account lock manager for parallel operations.
     Allows different accounts to run operations simultaneously while
     preventing multiple operations on the same account.
+
+    Lock state is a single int bitmask (one bit per phone, indexes handed out
+    on first use) guarded by one Condition, instead of a Lock object per phone.
     """
 
     def __init__(self):
-        self._locks: Dict[str, threading.Lock] = {}
-        self._master_lock = threading.Lock()
+        self._phone_idx: Dict[str, int] = {}  # clean_phone -> bit index
+        self._locked_mask = 0
+        self._cond = threading.Condition()
 
-    def get_lock(self, phone: str) -> threading.Lock:
-        """Get or create a lock for a specific account"""
-        clean_phone = normalize_phone(phone)
-        with self._master_lock:
-            if clean_phone not in self._locks:
-                self._locks[clean_phone] = threading.Lock()
-            return self._locks[clean_phone]
+    def _bit(self, clean_phone: str) -> int:
+        """Bit for an account (caller holds self._cond)"""
+        idx = self._phone_idx.get(clean_phone)
+        if idx is None:
+            idx = self._phone_idx[clean_phone] = len(self._phone_idx)
+        return 1 << idx
 
     def acquire(self, phone: str, blocking: bool = True, timeout: float = -1) -> bool:
         """
@@ -705,53 +1080,366 @@ class AccountLockManager:
         Returns:
             True if lock acquired, False otherwise
         """
-        lock = self.get_lock(phone)
-        return lock.acquire(blocking=blocking, timeout=timeout)
+        clean_phone = normalize_phone(phone)
+        with self._cond:
+            bit = self._bit(clean_phone)
+            if self._locked_mask & bit:
+                if not blocking:
+                    return False
+                if not self._cond.wait_for(lambda: not self._locked_mask & bit,
+                                           None if timeout < 0 else timeout):
+                    return False
+            self._locked_mask |= bit
+            return True
 
     def release(self, phone: str) -> None:
-        """Release lock for an account"""
+        """Release lock for an account (no-op if it was not held)"""
         clean_phone = normalize_phone(phone)
-        with self._master_lock:
-            if clean_phone in self._locks:
-                try:
-                    self._locks[clean_phone].release()
-                except RuntimeError:
-                    pass  # Lock was not held
+        with self._cond:
+            idx = self._phone_idx.get(clean_phone)
+            if idx is not None and (self._locked_mask >> idx) & 1:
+                self._locked_mask &= ~(1 << idx)
+                self._cond.notify_all()
 
     def is_locked(self, phone: str) -> bool:
-        """Check if an account is currently locked"""
-        clean_phone = normalize_phone(phone)
-        with self._master_lock:
-            if clean_phone not in self._locks:
-                return False
-            # Try to acquire without blocking
-            lock = self._locks[clean_phone]
-            acquired = lock.acquire(blocking=False)
-            if acquired:
-                lock.release()
-                return False
-            return True
+        """Check if an account is currently locked (read-only, no lock taken)"""
+        idx = self._phone_idx.get(normalize_phone(phone))
+        return idx is not None and bool((self._locked_mask >> idx) & 1)
 
     def get_locked_accounts(self) -> list:
         """Get list of currently locked account phone numbers"""
-        locked = []
-        with self._master_lock:
-            for phone, lock in self._locks.items():
-                acquired = lock.acquire(blocking=False)
-                if acquired:
-                    lock.release()
-                else:
-                    locked.append(phone)
-        return locked
+        with self._cond:
+            mask = self._locked_mask
+            indexes = list(self._phone_idx.items())
+        return [phone for phone, idx in indexes if (mask >> idx) & 1]
 
 
 # Per-account lock manager for parallel operations
 account_locks = AccountLockManager()
 
+
+@dataclass
+class _PooledClient:
+    """Connected client parked in (or being closed by) ClientPool"""
+    tg_client: Any
+    client: Any
+
+
+class ClientPool:
+    """
+    Operation clients per account, kept connected between requests instead of
+    disconnecting after every call.
+
+    Every path that connects an operation client goes through checkout() /
+    acheckout() and hands the client back with checkin() (clean exit) or
+    discard() (error or failed connect). TGClient instances are shared per
+    session, so all users of an account hold the same TelegramClient; the pool
+    counts those users and only disconnects once none are left:
+    - checkin() by the last user parks the client; a timer closes it after idle_ttl
+    - discard() by the last user disconnects it right away
+    - evict() closes a parked client (account settings changed, inbox took the account)
+
+    Reconnecting costs an MTProto handshake per request, so a parked client is
+    handed to the next request for the same account. Clients live on the
+    shared loop (async_loop.py).
+    """
+
+    IDLE_TTL = 300  # seconds
+
+    def __init__(self, idle_ttl: float = IDLE_TTL):
+        self._idle_ttl = idle_ttl
+        self._idle: Dict[str, _PooledClient] = {}  # clean_phone -> parked client
+        self._users: Counter = Counter()  # clean_phone -> callers between checkout and checkin/discard
+        self._closing: Dict[str, Future] = {}  # clean_phone -> disconnect still running on the shared loop
+        self._lock = threading.Lock()
+
+    def checkout(self, mgr: 'UnifiedContactManager') -> bool:
+        """acheckout() for endpoint / worker threads (must not be called on the shared loop)"""
+        return run_coroutine_sync(self.acheckout(mgr))
+
+    async def acheckout(self, mgr: 'UnifiedContactManager') -> bool:
+        """
+        Attach a connected client to mgr, reusing a parked one when possible.
+
+        Once this returns (True or False) the caller is counted as a user and
+        must hand mgr back with checkin() or discard().
+
+        Args:
+            mgr: Manager for the account (mgr.client / mgr._tg_client are set on success)
+
+        Returns:
+            True if mgr has a connected client, False otherwise
+        """
+        phone = mgr.normalized_phone
+        with self._lock:
+            self._users[phone] += 1
+            entry = self._idle.pop(phone, None)
+            closing = self._closing.get(phone)
+
+        try:
+            if entry and entry.client.is_connected():
+                mgr._tg_client, mgr.client = entry.tg_client, entry.client
+                logger.info(f"♻️  Reusing connected client for {mgr.phone_number}")
+                return True
+
+            # A disconnect of the same (shared) TGClient must finish before it is reconnected
+            if closing is not None:
+                try:
+                    await asyncio.wrap_future(closing)
+                except Exception:
+                    pass
+            return await mgr.init_client(mgr.phone_number)
+        except BaseException:
+            with self._lock:
+                self._release_user(phone)
+            raise
+
+    def checkin(self, mgr: 'UnifiedContactManager') -> None:
+        """
+        Hand mgr's client back after a clean exit (the last user parks it for reuse).
+
+        Args:
+            mgr: Manager returned from checkout()
+        """
+        entry = self._detach(mgr)
+        phone = mgr.normalized_phone
+        with self._lock:
+            park = self._release_user(phone) == 0 and entry is not None and entry.client.is_connected()
+            previous = self._idle.get(phone) if park else None
+            if park:
+                self._idle[phone] = entry
+        if not park:
+            return
+        if previous and previous.client is not entry.client:
+            self._disconnect(phone, previous)
+
+        timer = threading.Timer(self._idle_ttl, self._evict_if_idle, args=(phone, entry))
+        timer.daemon = True
+        timer.start()
+
+    def discard(self, mgr: 'UnifiedContactManager') -> None:
+        """
+        Hand mgr's client back after an error or failed connect (the last user disconnects it).
+
+        Args:
+            mgr: Manager returned from checkout()
+        """
+        entry = self._detach(mgr)
+        phone = mgr.normalized_phone
+        with self._lock:
+            last_user = self._release_user(phone) == 0
+        if last_user and entry is not None:
+            self._disconnect(phone, entry)
+
+    def evict(self, phone: Optional[str] = None) -> None:
+        """Disconnect the parked client for one account (or all accounts when phone is None)"""
+        with self._lock:
+            if phone is None:
+                entries = list(self._idle.items())
+                self._idle.clear()
+            else:
+                clean_phone = normalize_phone(phone)
+                entry = self._idle.pop(clean_phone, None)
+                entries = [(clean_phone, entry)] if entry else []
+        # Parked clients have no users (checkout takes them out of _idle first)
+        for clean_phone, entry in entries:
+            self._disconnect(clean_phone, entry)
+
+    def _release_user(self, phone: str) -> int:
+        """Drop one user of an account and return how many remain (caller holds self._lock)"""
+        remaining = self._users[phone] - 1
+        if remaining > 0:
+            self._users[phone] = remaining
+        else:
+            self._users.pop(phone, None)
+        return max(remaining, 0)
+
+    @staticmethod
+    def _detach(mgr: 'UnifiedContactManager') -> Optional[_PooledClient]:
+        """Take the client off mgr (mgr no longer owns it)"""
+        client, mgr.client = mgr.client, None
+        return _PooledClient(getattr(mgr, '_tg_client', None), client) if client else None
+
+    def _evict_if_idle(self, phone: str, entry: _PooledClient) -> None:
+        """Timer callback: drop the entry unless it was checked out since"""
+        with self._lock:
+            if self._idle.get(phone) is not entry:
+                return
+            del self._idle[phone]
+        logger.info(f"🔌 Closing idle client for {phone}")
+        self._disconnect(phone, entry)
+
+    def _disconnect(self, phone: str, entry: _PooledClient) -> None:
+        """Schedule a disconnect on the shared loop (does not wait, safe from any thread)"""
+        if entry.tg_client is not None:
+            coro = entry.tg_client.disconnect(force=True)
+        else:
+            coro = entry.client.disconnect()
+        if not asyncio.iscoroutine(coro):
+            return
+        future = AsyncEventLoopThread.instance().run_coroutine(coro)
+        with self._lock:
+            self._closing[phone] = future
+
+        def _done(_):
+            with self._lock:
+                if self._closing.get(phone) is future:
+                    del self._closing[phone]
+
+        future.add_done_callback(_done)
+
+
+# Operation clients shared by imports, multi-account operations and the scan / folders / backup endpoints
+client_pool = ClientPool()
+# A parked client must not stay connected once the inbox takes the account back
+GlobalConnectionManager.get_instance().add_acquire_listener(client_pool.evict)
+
+
+@contextmanager
+def prepared_client(mgr: 'UnifiedContactManager') -> Iterator[bool]:
+    """
+    Connect mgr for a sync endpoint and hand its client back on exit.
+
+    Disconnects the account from GlobalConnectionManager first (InboxManager may
+    hold it), then borrows a client from client_pool. The client is parked for
+    reuse only on a clean exit; after an exception or a failed connect it is
+    discarded (disconnected once no other operation uses it).
+
+    Args:
+        mgr: Manager for the account
+
+    Yields:
+        True if mgr.client is connected, False otherwise
+    """
+    clean_phone = mgr.normalized_phone
+    global_conn_manager = GlobalConnectionManager.get_instance()
+    if global_conn_manager.is_connected(clean_phone):
+        logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager...")
+        try:
+            run_coroutine_sync(global_conn_manager.disconnect_account(clean_phone))
+        except Exception as e:
+            logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
+
+    connected = client_pool.checkout(mgr)
+    try:
+        yield connected
+    except BaseException:
+        client_pool.discard(mgr)
+        raise
+    (client_pool.checkin if connected else client_pool.discard)(mgr)
+
+
 # Active operations tracking for WebSocket updates
 active_operations: Dict[str, Dict[str, Any]] = {}
 operations_lock = threading.Lock()
 
+# Futures of pooled operations, kept apart from active_operations (which is JSON-serialized)
+_operation_futures: Dict[str, Future] = {}
+
+
+def track_operation_future(operation_id: str, future: Future):
+    """Remember an operation's future so cancel_operation can drop it if it hasn't started."""
+    with operations_lock:
+        _operation_futures[operation_id] = future
+
+    def _forget(_):
+        with operations_lock:
+            _operation_futures.pop(operation_id, None)
+
+    future.add_done_callback(_forget)
+
+
+# Per-operation cancel flags, set by cancel_operation (threading.Event - created on request
+# threads, which have no event loop)
+_cancel_events: Dict[str, threading.Event] = {}
+
+# asyncio mirrors of the cancel flags for _cancellable(), created lazily on the shared loop
+_cancel_waiters: Dict[str, asyncio.Event] = {}
+
+# /api/operations/history results: limit -> (fetched_at, operations)
+# Short TTL collapses frontend polling; cleared whenever an operation is created or completed
+_HISTORY_TTL = 2.0  # seconds
+_history_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+
+
+def _get_recent_operations_cached(limit: int) -> List[Dict]:
+    """db_get_recent_operations(limit), reusing a result fetched within _HISTORY_TTL"""
+    cached = _history_cache.get(limit)
+    if cached and time.monotonic() - cached[0] < _HISTORY_TTL:
+        return cached[1]
+    operations = db_get_recent_operations(limit)
+    _history_cache[limit] = (time.monotonic(), operations)
+    return operations
+
+
+class OperationCancelled(Exception):
+    """Raised inside an operation's coroutine when the operation was cancelled."""
+
+
+def _cancel_requested(operation_id: str) -> bool:
+    """True once cancel_operation has fired the operation's cancel event."""
+    event = _cancel_events.get(operation_id)
+    return event is not None and event.is_set()
+
+
+def _wake_cancel_waiter(operation_id: str) -> None:
+    """Shared-loop callback: release coroutines awaiting the operation in _cancellable()"""
+    waiter = _cancel_waiters.get(operation_id)
+    if waiter is not None:
+        waiter.set()
+
+
+def _forget_cancel_event(operation_id: str) -> None:
+    """Drop an operation's cancel flag and its loop-side waiter"""
+    _cancel_events.pop(operation_id, None)
+    _cancel_waiters.pop(operation_id, None)
+
+
+async def _cancellable(operation_id: str, coro):
+    """
+    Await `coro` on the shared loop, cancelling it as soon as the operation is cancelled.
+
+    Args:
+        operation_id: Operation whose cancel event to watch
+        coro: Coroutine doing the actual work
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        OperationCancelled: If the operation was cancelled first
+    """
+    event = _cancel_events.get(operation_id)
+    if event is None:
+        return await coro
+
+    # Created here, on the shared loop (no await between this and the flag check, so a
+    # cancel either set the flag already or its _wake_cancel_waiter callback runs later)
+    loop_event = _cancel_waiters.get(operation_id)
+    if loop_event is None:
+        loop_event = _cancel_waiters[operation_id] = asyncio.Event()
+    if event.is_set():
+        coro.close()
+        raise OperationCancelled(operation_id)
+
+    task = asyncio.ensure_future(coro)
+    waiter = asyncio.ensure_future(loop_event.wait())
+    await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    if task.done():
+        waiter.cancel()
+        return task.result()
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    raise OperationCancelled(operation_id)
+
+# Single-account imports in flight: (account_phone, csv realpath) -> operation_id
+_IN_FLIGHT_IMPORTS: Dict[Tuple[str, str], str] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
 # Batched database write system for performance
 # Progress updates are queued and flushed to DB every N seconds
 _progress_write_queue: Dict[Tuple[str, str], Dict] = {}  # (op_id, phone) -> data
@@ -865,12 +1553,14 @@ def create_operation(operation_type: str, phones: List[str], params: Dict = None
             },
             'results': {}
         }
+        _cancel_events[operation_id] = threading.Event()
 
     # Persist to database (fire-and-forget)
     try:
         db_create_operation(operation_id, operation_type, normalized_phones, params)
     except Exception as e:
         logger.warning(f"⚠️ Failed to persist operation to DB: {e}")
+    _history_cache.clear()
 
     logger.info(f"📋 Created operation {operation_id}: {operation_type} for {len(phones)} accounts")
     return operation_id
@@ -881,10 +1571,11 @@ def get_operation(operation_id: str) -> Optional[Dict]:
     Get operation details by ID.
     Tries in-memory first (fast), falls back to database (for reconnection).
     """
-    # Try in-memory first (fast path for active operations)
-    with operations_lock:
-        if operation_id in active_operations:
-            return active_operations[operation_id]
+    # Try in-memory first (fast path for active operations; a single dict.get is
+    # atomic, so readers don't queue behind writers on operations_lock)
+    op = active_operations.get(operation_id)
+    if op is not None:
+        return op
 
     # Fall back to database (reconnection scenario)
     try:
@@ -901,39 +1592,135 @@ def get_operation(operation_id: str) -> Optional[Dict]:
     return None
 
 
-def update_account_progress(operation_id: str, phone: str, progress: int, total: int,
-                           status: str, message: str = '', error: str = None,
-                           stats: Dict = None) -> None:
+class WSBatcher:
     """
-    Update progress for an account in an operation and emit via WebSocket.
-    Also queues update for batched database write.
+    Time-window batching for per-operation WebSocket events.
 
-    Args:
-        operation_id: Operation ID
-        phone: Phone number of the account
-        progress: Current progress count
-        total: Total count
-        status: Status (pending, running, completed, error)
-        message: Progress message
-        error: Error message if status is 'error'
-        stats: Structured stats dict (added, skipped, failed, success_rate, speed, eta_seconds, etc.)
+    Progress/log events are queued per operation and sent every FLUSH_INTERVAL
+    as a single 'operation_batch' message ({'operation_id', 'events': [{'event', 'data'}, ...]}).
+    Within a window only the latest 'operation_progress' per account is kept.
+
+    Other events are capped at MAX_QUEUED per operation: beyond that the oldest
+    are dropped and the batch carries 'dropped' (count) so the client can warn.
     """
-    clean_phone = normalize_phone(phone)
 
-    # Update in-memory immediately (for WebSocket responsiveness)
-    with operations_lock:
-        if operation_id not in active_operations:
-            return
+    FLUSH_INTERVAL = 0.05  # seconds
+    MAX_QUEUED = 5000  # queued non-progress events per operation
 
-        op = active_operations[operation_id]
-        if clean_phone in op['accounts']:
-            op['accounts'][clean_phone].update({
-                'progress': progress,
-                'total': total,
-                'status': status,
-                'message': message,
-                'error': error,
-                'stats': stats or {}
+    def __init__(self):
+        self._events: Dict[str, deque] = {}  # operation_id -> queued log events (bounded)
+        self._progress: Dict[str, Dict[str, Dict]] = {}  # operation_id -> {phone: latest progress event}
+        self._dropped: Counter = Counter()  # operation_id -> events dropped since last flush
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def emit(self, operation_id: str, event: str, data: Dict) -> None:
+        """Queue an event for the operation's room (sent within FLUSH_INTERVAL)"""
+        with self._lock:
+            if event == 'operation_progress':
+                # Progress is cumulative - latest wins
+                self._progress.setdefault(operation_id, {})[data['phone']] = {'event': event, 'data': data}
+            else:
+                events = self._events.get(operation_id)
+                if events is None:
+                    events = self._events[operation_id] = deque(maxlen=self.MAX_QUEUED)
+                elif len(events) == self.MAX_QUEUED:
+                    self._dropped[operation_id] += 1  # append() below evicts the oldest
+                events.append({'event': event, 'data': data})
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="ws_batcher")
+                self._thread.start()
+        self._wakeup.set()
+
+    def flush(self, operation_id: Optional[str] = None) -> None:
+        """Send queued events now (one operation, or all)"""
+        with self._lock:
+            op_ids = (self._events.keys() | self._progress.keys()) if operation_id is None else (operation_id,)
+            pending = []
+            for op_id in op_ids:
+                events = list(self._progress.pop(op_id, {}).values())
+                events.extend(self._events.pop(op_id, ()))
+                dropped = self._dropped.pop(op_id, 0)
+                if events:
+                    pending.append((op_id, events, dropped))
+
+        for op_id, events, dropped in pending:
+            payload = {'operation_id': op_id, 'events': events}
+            if dropped:
+                payload['dropped'] = dropped
+                logger.warning(f"⚠️ WebSocket queue for {op_id} overflowed: dropped {dropped} oldest events")
+            socketio.emit('operation_batch', payload, room=op_id)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"⚠️ WebSocket batch flush failed: {e}")
+
+
+_ws_batcher = WSBatcher()
+
+
+def get_account_state(operation_id: str, phone: str) -> Optional[Dict]:
+    """
+    Get the live per-account dict of an active operation.
+
+    Hot progress callbacks look this up once and pass it back as account_state
+    instead of re-resolving operation -> account on every update.
+
+    Args:
+        operation_id: Operation ID
+        phone: Phone number of the account
+
+    Returns:
+        The account's state dict, or None if the operation/account is unknown
+    """
+    with operations_lock:
+        op = active_operations.get(operation_id)
+        return op['accounts'].get(normalize_phone(phone)) if op else None
+
+
+def update_account_progress(operation_id: str, phone: str, progress: int, total: int,
+                           status: str, message: str = '', error: str = None,
+                           stats: Dict = None, account_state: Dict = None) -> None:
+    """
+    Update progress for an account in an operation and emit via WebSocket.
+    Also queues update for batched database write.
+
+    Args:
+        operation_id: Operation ID
+        phone: Phone number of the account
+        progress: Current progress count
+        total: Total count
+        status: Status (pending, running, completed, error)
+        message: Progress message
+        error: Error message if status is 'error'
+        stats: Structured stats dict (added, skipped, failed, success_rate, speed, eta_seconds, etc.)
+        account_state: Optional account dict from get_account_state() (skips the lookup)
+    """
+    clean_phone = normalize_phone(phone)
+
+    # Update in-memory immediately (for WebSocket responsiveness)
+    with operations_lock:
+        if account_state is None:
+            op = active_operations.get(operation_id)
+            if op is None:
+                return
+            account_state = op['accounts'].get(clean_phone)
+        if account_state is not None:
+            account_state.update({
+                'progress': progress,
+                'total': total,
+                'status': status,
+                'message': message,
+                'error': error,
+                'stats': stats or {}
             })
 
     # Queue for batched DB write (non-blocking)
@@ -947,8 +1734,8 @@ def update_account_progress(operation_id: str, phone: str, progress: int, total:
             'stats': stats
         }
 
-    # Emit progress via WebSocket (immediate)
-    socketio.emit('operation_progress', {
+    # Emit progress via WebSocket (batched, latest per account wins)
+    _ws_batcher.emit(operation_id, 'operation_progress', {
         'operation_id': operation_id,
         'phone': clean_phone,
         'progress': progress,
@@ -957,11 +1744,18 @@ def update_account_progress(operation_id: str, phone: str, progress: int, total:
         'message': message,
         'error': error,
         'stats': stats or {}
-    }, room=operation_id)
+    })
 
     logger.debug(f"📊 [{operation_id}] {clean_phone}: {progress}/{total} - {status} - {message}")
 
 
+# WebSocket subscriber counts per operation room (log emits are skipped when nobody is watching;
+# logs are still kept in memory/DB and replayed via 'operation_state' on subscribe)
+_log_subscribers: Counter = Counter()
+_sid_operations: Dict[str, set] = defaultdict(set)  # sid -> operation_ids it joined
+_subscribers_lock = threading.Lock()
+
+
 def add_account_log(operation_id: str, phone: str, message: str, level: str = 'info') -> None:
     """
     Add a log message for an account and emit via WebSocket.
@@ -991,12 +1785,145 @@ def add_account_log(operation_id: str, phone: str, message: str, level: str = 'i
     with _log_write_lock:
         _log_write_queue.append((operation_id, clean_phone, message, level))
 
-    # Emit log via WebSocket (immediate)
-    socketio.emit('operation_log', {
+    # Emit log via WebSocket (batched)
+    if not _log_subscribers[operation_id]:
+        return
+    _ws_batcher.emit(operation_id, 'operation_log', {
         'operation_id': operation_id,
         'phone': clean_phone,
         'log': log_entry
-    }, room=operation_id)
+    })
+
+
+def add_account_logs(operation_id: str, phone: str, entries: List[tuple],
+                     account_state: Dict = None) -> None:
+    """
+    Add several log messages for an account with a single WebSocket emit.
+
+    Args:
+        operation_id: Operation ID
+        phone: Phone number of the account
+        entries: List of (message, level) tuples
+        account_state: Optional account dict from get_account_state() (skips the lookup)
+    """
+    if not entries:
+        return
+
+    clean_phone = normalize_phone(phone)
+    timestamp = datetime.now().isoformat()
+    log_entries = [
+        {'timestamp': timestamp, 'level': level, 'message': message}
+        for message, level in entries
+    ]
+
+    with operations_lock:
+        if account_state is None:
+            op = active_operations.get(operation_id)
+            account_state = op['accounts'].get(clean_phone) if op else None
+        if account_state is not None:
+            account_state['logs'].extend(log_entries)
+
+    with _log_write_lock:
+        _log_write_queue.extend((operation_id, clean_phone, message, level) for message, level in entries)
+
+    if not _log_subscribers[operation_id]:
+        return
+    _ws_batcher.emit(operation_id, 'operation_log_batch', {
+        'operation_id': operation_id,
+        'phone': clean_phone,
+        'logs': log_entries
+    })
+
+
+# Per-contact import status -> log level (anything else logs as 'info')
+_STATUS_TO_LEVEL = {'added': 'success'}
+
+
+class ProgressCoalescer:
+    """
+    Coalesces per-contact progress events into batched WebSocket emits.
+
+    Events are flushed at most every `interval` seconds (via a one-shot
+    timer, so the last event before a long batch delay is never held back)
+    or as soon as `max_events` are pending, whichever comes first.
+
+    Wait heartbeats ("rate limited - waiting Ns") only schedule a slower
+    `heartbeat_interval` flush, and several pending heartbeats collapse into
+    the most recent one. Failures flush right away so they are never held
+    back. Nothing is emitted when nothing is pending.
+
+    Usage:
+        progress = ProgressCoalescer(flush_fn)
+        mgr.import_dev_contacts(..., progress_callback=progress.submit)
+        progress.flush()  # before completing the operation
+    """
+
+    HEARTBEAT_STATUSES = frozenset({'rate_limited', 'flood_wait'})
+    FLUSH_NOW_STATUSES = frozenset({'failed'})
+
+    def __init__(self, flush_fn, interval: float = 0.1, max_events: int = 32,
+                 heartbeat_interval: float = 1.0):
+        """
+        Args:
+            flush_fn: Callable receiving a list of (processed, total, message, contact_info) tuples
+            interval: Maximum time an event may wait before being emitted (seconds)
+            max_events: Flush immediately once this many events are pending
+            heartbeat_interval: Maximum wait when only heartbeats are pending (seconds)
+        """
+        self.flush_fn = flush_fn
+        self.interval = interval
+        self.max_events = max_events
+        self.heartbeat_interval = heartbeat_interval
+        self.pending: List[tuple] = []
+        self._timer = None
+        self._deadline = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _is_heartbeat(cls, event: tuple) -> bool:
+        contact_info = event[3]
+        return bool(contact_info) and contact_info.get('status') in cls.HEARTBEAT_STATUSES
+
+    def submit(self, processed, total, message, contact_info=None):
+        """Queue a progress event (same signature as progress_callback)."""
+        event = (processed, total, message, contact_info)
+        delay = self.heartbeat_interval if self._is_heartbeat(event) else self.interval
+        with self._lock:
+            self.pending.append(event)
+            flush_now = (len(self.pending) >= self.max_events
+                         or (bool(contact_info) and contact_info.get('status') in self.FLUSH_NOW_STATUSES))
+            deadline = time.monotonic() + delay
+            if not flush_now and (self._timer is None or deadline < self._deadline):
+                # Only (re)arm the timer if this event needs an earlier flush
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._deadline = deadline
+                self._timer = threading.Timer(delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+
+    def flush(self):
+        """Emit all pending events in one batch (no-op when nothing is pending)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.pending:
+                return
+            events, self.pending = self.pending, []
+
+        # Collapse repeated wait heartbeats into the latest one
+        heartbeats = [e for e in events if self._is_heartbeat(e)]
+        if len(heartbeats) > 1:
+            latest = heartbeats[-1]
+            events = [e for e in events if e is latest or not self._is_heartbeat(e)]
+
+        try:
+            self.flush_fn(events)
+        except Exception as e:
+            logger.warning(f"⚠️  Error flushing progress events: {e}")
 
 
 def emit_batch_delay(operation_id: str, phone: str, batch_number: int,
@@ -1016,6 +1943,9 @@ def emit_batch_delay(operation_id: str, phone: str, batch_number: int,
     """
     clean_phone = normalize_phone(phone)
 
+    # Sent directly, not through _ws_batcher: send the queued progress/logs first
+    # so the countdown doesn't arrive ahead of the batch it follows
+    _ws_batcher.flush(operation_id)
     socketio.emit('batch_delay_start', {
         'operation_id': operation_id,
         'phone': clean_phone,
@@ -1047,6 +1977,7 @@ def complete_operation(operation_id: str, results: Dict = None, error: str = Non
         if operation_id not in active_operations:
             return
 
+        _forget_cancel_event(operation_id)
         op = active_operations[operation_id]
         op['status'] = 'error' if error else 'completed'
         op['completed_at'] = datetime.now().isoformat()
@@ -1059,8 +1990,10 @@ def complete_operation(operation_id: str, results: Dict = None, error: str = Non
         db_complete_operation(operation_id, results, error)
     except Exception as e:
         logger.warning(f"⚠️ Failed to persist completion to DB: {e}")
+    _history_cache.clear()
 
-    # Emit completion via WebSocket
+    # Emit completion via WebSocket (after any batched progress/logs)
+    _ws_batcher.flush(operation_id)
     socketio.emit('operation_complete', {
         'operation_id': operation_id,
         'status': 'error' if error else 'completed',
@@ -1106,6 +2039,11 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection"""
     logger.info(f"🔌 WebSocket client disconnected: {request.sid}")
+    with _subscribers_lock:
+        for operation_id in _sid_operations.pop(request.sid, ()):
+            _log_subscribers[operation_id] -= 1
+            if _log_subscribers[operation_id] <= 0:
+                del _log_subscribers[operation_id]
 
 
 @socketio.on('subscribe_operation')
@@ -1118,6 +2056,10 @@ def handle_subscribe(data):
 
     # Join the operation's room
     join_room(operation_id)
+    with _subscribers_lock:
+        if operation_id not in _sid_operations[request.sid]:
+            _sid_operations[request.sid].add(operation_id)
+            _log_subscribers[operation_id] += 1
     logger.info(f"📺 Client {request.sid} subscribed to operation {operation_id}")
 
     # Send current operation state
@@ -1134,6 +2076,13 @@ def handle_unsubscribe(data):
     operation_id = data.get('operation_id')
     if operation_id:
         leave_room(operation_id)
+        with _subscribers_lock:
+            joined = _sid_operations.get(request.sid)
+            if joined and operation_id in joined:
+                joined.discard(operation_id)
+                _log_subscribers[operation_id] -= 1
+                if _log_subscribers[operation_id] <= 0:
+                    del _log_subscribers[operation_id]
         logger.info(f"📺 Client {request.sid} unsubscribed from operation {operation_id}")
 
 
@@ -1205,6 +2154,91 @@ def parse_proxy_url(proxy_url: str) -> Optional[Tuple]:
         return None
 
 
+# Loaded organize_combined module (see _load_organize_module)
+_ORGANIZE_MODULE: Optional[Any] = None
+
+
+def _load_organize_module():
+    """
+    Load organize_combined.py once and cache it.
+
+    Also registers it in sys.modules so a plain `import organize_combined`
+    reuses the same module object. A failed load is not cached.
+    """
+    global _ORGANIZE_MODULE
+    if _ORGANIZE_MODULE is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("organize_combined",
+                                                      Path(__file__).parent / "organize_combined.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules['organize_combined'] = module
+        _ORGANIZE_MODULE = module
+    return _ORGANIZE_MODULE
+
+
+# ============================================================================
+# MULTI-ACCOUNT IMPORT SPECS
+# ============================================================================
+
+@dataclass
+class ImportSpec:
+    """What differs between the DEV and KOL imports."""
+    label: str  # 'DEV' or 'KOL' (for logs)
+    operation: str  # Single-account operation type ('import_devs' / 'import_kols')
+    stats_prefix: str  # 'dev' or 'kol' (UnifiedContactManager.stats keys)
+    required_columns: List[str]
+    parse_row: Callable[[Dict], Optional[Dict]]  # CSV row -> entry dict (None to skip)
+    temp_fields: Tuple[str, ...]  # Header of the per-account chunk CSV
+    row_to_tuple: Callable[[Dict], Tuple]  # Entry dict -> chunk CSV row
+    import_fn_name: str  # UnifiedContactManager method importing one chunk
+    result_username_key: str  # Entry key reported as 'username' in results
+
+
+def _parse_dev_row(row: Dict) -> Optional[Dict]:
+    if row.get('owner') and row['owner'].strip():
+        return {
+            'group_title': row['group_title'].strip(),
+            'dex_chain': row['dex_chain'].strip(),
+            'owner': row['owner'].strip().lstrip('@'),
+        }
+    return None
+
+
+def _parse_kol_row(row: Dict) -> Optional[Dict]:
+    if row.get('TG Usernames') and row['TG Usernames'].strip():
+        return {
+            'twitter': row['Twitter Username'].strip().lstrip('@'),
+            'telegram': row['TG Usernames'].strip().lstrip('@')
+        }
+    return None
+
+
+DEV_IMPORT_SPEC = ImportSpec(
+    label='DEV',
+    operation='import_devs',
+    stats_prefix='dev',
+    required_columns=['group_title', 'dex_chain', 'owner'],
+    parse_row=_parse_dev_row,
+    temp_fields=('group_title', 'dex_chain', 'owner'),
+    row_to_tuple=lambda e: (e['group_title'], e['dex_chain'], e['owner']),
+    import_fn_name='import_dev_contacts',
+    result_username_key='owner',
+)
+
+KOL_IMPORT_SPEC = ImportSpec(
+    label='KOL',
+    operation='import_kols',
+    stats_prefix='kol',
+    required_columns=['Twitter Username', 'TG Usernames'],
+    parse_row=_parse_kol_row,
+    temp_fields=('Twitter Username', 'TG Usernames'),
+    row_to_tuple=lambda e: (e['twitter'], e['telegram']),
+    import_fn_name='import_kol_contacts',
+    result_username_key='telegram',
+)
+
+
 # ============================================================================
 # UNIFIED CONTACT MANAGER CLASS (previously in matrix.py)
 # ============================================================================
@@ -1237,7 +2271,7 @@ class UnifiedContactManager:
         # Create phone-number-specific session filename
         if phone_number:
             # Clean phone number for filename (remove +, -, spaces)
-            clean_phone = phone_number.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(phone_number)
             self.session_name = f"session_{clean_phone}"
         else:
             self.session_name = 'session_temp'
@@ -1247,7 +2281,7 @@ class UnifiedContactManager:
         self.client: Optional[TelegramClient] = None
 
         # Statistics
-        self.stats = {
+        self.stats = Counter({
             'dev_added': 0,
             'dev_skipped': 0,
             'dev_failed': 0,
@@ -1257,7 +2291,7 @@ class UnifiedContactManager:
             'contacts_updated': 0,
             'contacts_checked': 0,
             'yellow_replied': 0,  # For data gathering
-        }
+        })
 
         # Advanced anti-rate-limit configuration (based on labeler.py approach)
         self.BATCH_SIZE_MIN = 3  # Variable batch size min
@@ -1268,6 +2302,22 @@ class UnifiedContactManager:
         self.BATCH_DELAY_MAX = 90  # Batch delay max (seconds)
         self.BATCH_DELAY_SLOWDOWN = 1.5  # Multiplier if success rate < 50%
         self.GENERIC_FLOOD_WAIT = 300  # Wait 5 minutes for generic FLOOD errors
+        self.GENERIC_FLOOD_WAIT_MAX = 1800  # Backoff cap for repeated generic FLOOD errors
+        self.MULTI_ACCOUNT_CONCURRENCY = 5  # Max accounts importing at once in multi-account imports
+        self.STALE_DIALOG_STREAK = 20  # Stop dialog scans after this many consecutive out-of-window dialogs
+        self.RECONNECT_DELAY_BASE = 5  # First reconnect backoff (seconds)
+        self.RECONNECT_DELAY_MAX = 120  # Reconnect backoff cap (seconds)
+
+        # Consecutive error counters per error class (reset on a successful add)
+        self._backoff = {'flood': 0, 'conn': 0}
+
+        # Users added by add_contact() during the current import (for cache patching)
+        self._added_users: List = []
+
+        # Precomputed per-contact delays (filled lazily by _get_random_delay)
+        self._delay_ring: List[float] = []
+        self._delay_ring_bounds = None
+        self._delay_idx = 0
 
         # Resume tracking
         self.progress_file = LOGS_DIR / f"progress_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -1276,6 +2326,9 @@ class UnifiedContactManager:
         # Contact cache with auto-backup (use per-account cache for scalability)
         self._contact_cache = _account_cache_manager.get_cache(self.phone_number)
 
+        # Shared per-account rate limiter (FloodWait fence applies to all callers)
+        self._rate_limiter = get_rate_limiter(self.phone_number)
+
     def set_rate_limit_config(self, batch_min: int = 3, batch_max: int = 7,
                               batch_delay_min: int = 45, batch_delay_max: int = 90):
         """Configure anti-rate-limit settings"""
@@ -1334,6 +2387,11 @@ class UnifiedContactManager:
     def batch_pause_max(self, value: int):
         self.BATCH_DELAY_MAX = value
 
+    @cached_property
+    def normalized_phone(self) -> str:
+        """Account phone in DB form (digits only) - phone_number never changes after init"""
+        return normalize_phone(self.phone_number)
+
     def log(self, message: str, level: str = "INFO"):
         """Log message with timestamp"""
         if level == "ERROR":
@@ -1349,7 +2407,7 @@ class UnifiedContactManager:
             return  # account_manager not available
 
         try:
-            clean_phone = phone_number.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(phone_number)
             session_path = str(self.session_path)
 
             # Get account name from user info if available
@@ -1376,12 +2434,12 @@ class UnifiedContactManager:
                     status='active',
                     proxy=self.proxy_url  # Include proxy if configured
                 )
+                _cached_account_by_phone.cache_clear()
                 if success:
                     self.log(f"   💾 Saved session to database: {clean_phone}" + (f" with proxy: {self.proxy_url}" if self.proxy_url else ""))
 
                     # If this is the first account (no default exists), set it as default
                     try:
-                        from account_manager import get_default_account, set_default_account
                         default = get_default_account()
                         if not default:
                             set_default_account(clean_phone)
@@ -1393,9 +2451,51 @@ class UnifiedContactManager:
         except Exception as e:
             self.log(f"   ⚠️  Failed to save session to database: {str(e)}", level="WARNING")
 
+    def _backoff_delay(self, kind: str, base: float, cap: float, retry_after: Optional[float] = None) -> float:
+        """
+        Exponential backoff with jitter for repeated errors of the same class.
+
+        Never returns less than `base`, so the first wait is at least as long
+        as the old fixed delay.
+
+        Args:
+            kind: Error class key in self._backoff ('flood' or 'conn')
+            base: Delay for the first attempt
+            cap: Maximum delay before jitter
+            retry_after: Explicit wait requested by Telegram (preferred when set)
+
+        Returns:
+            Delay in seconds
+        """
+        attempt = self._backoff[kind]
+        self._backoff[kind] = attempt + 1
+        if retry_after:
+            return float(retry_after)
+        return max(base, min(cap, base * (2 ** attempt)) * random.uniform(0.7, 1.3))
+
+    def _reset_backoff(self):
+        """Reset error backoff counters after a successful request."""
+        self._backoff['flood'] = 0
+        self._backoff['conn'] = 0
+
+    _DELAY_RING_SIZE = 4096
+
     def _get_random_delay(self) -> float:
-        """Get random delay for contacts (2-6 seconds)"""
-        return random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX)
+        """
+        Get random delay for contacts (2-6 seconds).
+
+        Draws from a precomputed ring of delays, refilled when exhausted or
+        when PER_CONTACT_DELAY_MIN/MAX have changed since the last fill.
+        """
+        bounds = (self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX)
+        if self._delay_idx >= self._DELAY_RING_SIZE or self._delay_ring_bounds != bounds:
+            uniform = random.uniform
+            self._delay_ring = [uniform(*bounds) for _ in range(self._DELAY_RING_SIZE)]
+            self._delay_ring_bounds = bounds
+            self._delay_idx = 0
+        delay = self._delay_ring[self._delay_idx]
+        self._delay_idx += 1
+        return delay
 
     async def init_client(self, phone_number: str, force_new: bool = False) -> bool:
         """
@@ -1435,7 +2535,7 @@ class UnifiedContactManager:
             # Uses StringSession - no more SQLite database locks!
             # ========================================
 
-            clean_phone = phone_number.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(phone_number)
             session_name = f"session_{clean_phone}"
 
             # Check if session exists
@@ -1531,7 +2631,7 @@ class UnifiedContactManager:
         """
         try:
             # IMPORTANT: First disconnect from GlobalConnectionManager if connected
-            clean_phone = phone_number.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(phone_number)
             session_name = f"session_{clean_phone}"
 
             conn_manager = GlobalConnectionManager.get_instance()
@@ -1732,7 +2832,7 @@ class UnifiedContactManager:
             return ("", "Invalid username format", None)
         except FloodWaitError as e:
             self.log(f"⚠️  FLOOD WAIT for {e.seconds}s", level="WARNING")
-            await asyncio.sleep(e.seconds)
+            await self._rate_limiter.trip(e.seconds)
             return ("", f"Rate limited - retrying next contact", None)
         except Exception as e:
             return ("", str(e), None)
@@ -1750,7 +2850,8 @@ class UnifiedContactManager:
 
             for contact in result.users:
                 if contact.username:
-                    username = contact.username.lower()
+                    # Interned so the three sets share one string per username
+                    username = sys.intern(contact.username.lower())
                     existing.add(username)
 
                     if contact.first_name:
@@ -1820,36 +2921,61 @@ class UnifiedContactManager:
         """Add contact to Telegram"""
         try:
             user = await self.client.get_entity(username)
-            await self.client(AddContactRequest(
+            await self._rate_limiter.acquire()
+            result = await self.client(AddContactRequest(
                 id=user.id,
                 first_name=first_name,
                 last_name=last_name,
                 phone="",
                 add_phone_privacy_exception=False
             ))
+
+            # Keep the updated user so the contact cache can be patched in place
+            added = next((u for u in getattr(result, 'users', []) if u.id == user.id), None)
+            if added is None:
+                user.first_name = first_name
+                user.last_name = last_name
+                added = user
+            self._added_users.append(added)
             return True
         except Exception as e:
             self.log(f"   ⚠️  Error adding contact: {str(e)}", level="WARNING")
             return False
 
-    async def import_dev_contacts(self, csv_path: str, dry_run: bool = False, interactive: bool = True,
+    @staticmethod
+    def _open_csv_source(source):
+        """
+        Open a CSV source for reading.
+
+        Args:
+            source: Path to a CSV file, or an already-open text file-like object
+                    (e.g. io.StringIO) which is used as-is and not closed
+
+        Returns:
+            Context manager yielding a text file object
+        """
+        if hasattr(source, 'read'):
+            return nullcontext(source)
+        return open(source, 'r', encoding='utf-8-sig', newline='', buffering=CSV_READ_BUFFER)
+
+    async def import_dev_contacts(self, csv_path: Union[str, Path, io.TextIOBase], dry_run: bool = False, interactive: bool = True,
                                    operation_id: str = None, progress_callback = None):
         """Import developer contacts with advanced anti-rate-limit system
 
         Args:
-            csv_path: Path to CSV file
+            csv_path: Path to CSV file, or an open text file-like object (e.g. io.StringIO)
             dry_run: If True, don't actually add contacts
             interactive: If True, prompt for confirmation
             operation_id: Optional operation ID for WebSocket progress
             progress_callback: Optional callback(progress, total, message, contact_info) for real-time updates
         """
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("📥 DEV CONTACT IMPORT (ANTI-RATE-LIMIT MODE)")
-        self.log("="*70)
+        self.log(_BANNER)
 
         # Read CSV (with utf-8-sig to handle BOM)
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            with self._open_csv_source(csv_path) as f:
                 reader = csv.DictReader(f)
 
                 # Validate required columns
@@ -1866,9 +2992,16 @@ class UnifiedContactManager:
                     return
 
                 entries = []
+                seen = set()  # Lowercased owners already queued - drop repeated CSV rows
+                duplicate_rows = 0
                 for row in reader:
                     if row.get('owner') and row['owner'].strip():
                         owner = row['owner'].strip().lstrip('@')
+                        key = owner.lower()
+                        if key in seen:
+                            duplicate_rows += 1
+                            continue
+                        seen.add(key)
                         entries.append({
                             'group_title': row['group_title'].strip(),
                             'dex_chain': row['dex_chain'].strip(),
@@ -1882,16 +3015,20 @@ class UnifiedContactManager:
             return
 
         self.log(f"\n📊 Found {len(entries)} valid dev entries")
+        if duplicate_rows:
+            self.log(f"   🔁 Dropped {duplicate_rows} duplicate CSV rows")
         self.log(f"📦 Variable batch sizes: {self.BATCH_SIZE_MIN}-{self.BATCH_SIZE_MAX} contacts")
         self.log(f"⏳ Batch delays: {self.BATCH_DELAY_MIN}-{self.BATCH_DELAY_MAX} seconds\n")
 
         # Tracking variables for stats (initialized early for emit_progress closure)
         import_start_time = None  # Set when actual import starts
+        self._added_users = []
+        counts = self.stats  # Local alias - touched on every contact in the loops below
         success_count = 0
         failed_count = 0
         processed_count = 0
         current_batch_number = 1
-        avg_batch_size = (self.BATCH_SIZE_MIN + self.BATCH_SIZE_MAX) / 2
+        avg_batch_size = max(1, (self.BATCH_SIZE_MIN + self.BATCH_SIZE_MAX) // 2)  # int, >= 1
 
         # Helper to emit progress with structured stats
         def emit_progress(processed, total, message, contact_info=None):
@@ -1906,11 +3043,11 @@ class UnifiedContactManager:
                 speed = 0
                 eta_seconds = 0
 
-            total_batches_est = max(1, math.ceil(total / avg_batch_size)) if avg_batch_size > 0 else 1
+            total_batches_est = max(1, (total + avg_batch_size - 1) // avg_batch_size)
 
             stats = {
                 'added': success_count,
-                'skipped': self.stats.get('dev_skipped', 0),
+                'skipped': counts.get('dev_skipped', 0),
                 'failed': failed_count,
                 'success_rate': success_count / max(1, processed) if processed > 0 else 0,
                 'speed': round(speed, 2),
@@ -1938,7 +3075,7 @@ class UnifiedContactManager:
 
         # Count pre-filtered as skipped in stats
         pre_filtered_count = len(already_dev) + len(already_in_contacts)
-        self.stats['dev_skipped'] = pre_filtered_count  # Initialize with pre-filtered count
+        counts['dev_skipped'] = pre_filtered_count  # Initialize with pre-filtered count
 
         # Show preview
         self.log("📋 Preview:")
@@ -1974,9 +3111,9 @@ class UnifiedContactManager:
             # API mode: auto-approve if not dry_run
             self.log(f"\n✅ Auto-approved in non-interactive mode")
 
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log("🔄 Starting anti-rate-limit import...")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
         # Set import start time for speed/ETA calculations (variables defined earlier)
         import_start_time = datetime.now()
@@ -1994,19 +3131,19 @@ class UnifiedContactManager:
             self.log(f"{'─'*70}")
 
             for entry in batch_entries:
-                username = entry['owner'].lower()
+                username = sys.intern(entry['owner'].lower())
 
                 # Skip usernames that previously failed in this session
                 if username in session_failed_usernames:
                     self.log(f"   ⏭️  @{entry['owner']} - previously failed (username doesn't exist)")
-                    self.stats['dev_skipped'] += 1
+                    counts['dev_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"⏭️ @{entry['owner']} - previously failed", {
                         'username': entry['owner'],
                         'status': 'skipped',
                         'reason': 'previously_failed',
                         'added': success_count,
-                        'skipped': self.stats['dev_skipped'],
+                        'skipped': counts['dev_skipped'],
                         'failed': failed_count
                     })
                     continue
@@ -2014,32 +3151,32 @@ class UnifiedContactManager:
                 # Check if already added
                 if username in dev_contacts:
                     self.log(f"   ⏭️  @{entry['owner']} - already marked as dev")
-                    self.stats['dev_skipped'] += 1
+                    counts['dev_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"Skipped @{entry['owner']} (already dev)", {
                         'username': entry['owner'],
                         'status': 'skipped',
                         'reason': 'already_dev',
                         'added': success_count,
-                        'skipped': self.stats['dev_skipped'],
+                        'skipped': counts['dev_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                    await asyncio.sleep(self._get_random_delay())
                     continue
 
                 if username in existing_contacts:
                     self.log(f"   ⏭️  @{entry['owner']} - already in contacts")
-                    self.stats['dev_skipped'] += 1
+                    counts['dev_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"Skipped @{entry['owner']} (in contacts)", {
                         'username': entry['owner'],
                         'status': 'skipped',
                         'reason': 'already_contact',
                         'added': success_count,
-                        'skipped': self.stats['dev_skipped'],
+                        'skipped': counts['dev_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                    await asyncio.sleep(self._get_random_delay())
                     continue
 
                 self.log(f"   🔵💻 @{entry['owner']} ({entry['dex_chain']})")
@@ -2048,7 +3185,7 @@ class UnifiedContactManager:
                     'status': 'processing',
                     'chain': entry['dex_chain'],
                     'added': success_count,
-                    'skipped': self.stats['dev_skipped'],
+                    'skipped': counts['dev_skipped'],
                     'failed': failed_count
                 })
 
@@ -2061,7 +3198,7 @@ class UnifiedContactManager:
                         # Track usernames that don't exist on Telegram
                         if "No user has" in status:
                             session_failed_usernames.add(username)
-                        self.stats['dev_failed'] += 1
+                        counts['dev_failed'] += 1
                         failed_count += 1
                         processed_count += 1
                         emit_progress(processed_count, total_to_process, f"Failed @{entry['owner']}: {status}", {
@@ -2069,10 +3206,10 @@ class UnifiedContactManager:
                             'status': 'failed',
                             'reason': status,
                             'added': success_count,
-                            'skipped': self.stats['dev_skipped'],
+                            'skipped': counts['dev_skipped'],
                             'failed': failed_count
                         })
-                        await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                        await asyncio.sleep(self._get_random_delay())
                         continue
 
                     # Format contact
@@ -2080,7 +3217,7 @@ class UnifiedContactManager:
 
                     if dry_run:
                         self.log(f"✅ Would add")
-                        self.stats['dev_added'] += 1
+                        counts['dev_added'] += 1
                         success_count += 1
                         processed_count += 1
                         emit_progress(processed_count, total_to_process, f"Would add @{entry['owner']}", {
@@ -2088,14 +3225,15 @@ class UnifiedContactManager:
                             'status': 'would_add',
                             'display_name': display_name,
                             'added': success_count,
-                            'skipped': self.stats['dev_skipped'],
+                            'skipped': counts['dev_skipped'],
                             'failed': failed_count
                         })
                     else:
                         success = await self.add_contact(entry['owner'], formatted_name)
                         if success:
                             self.log(f"✅ Added")
-                            self.stats['dev_added'] += 1
+                            counts['dev_added'] += 1
+                            self._reset_backoff()
                             existing_contacts.add(username)
                             dev_contacts.add(username)
                             success_count += 1
@@ -2106,7 +3244,7 @@ class UnifiedContactManager:
                                 'display_name': display_name,
                                 'formatted_name': formatted_name,
                                 'added': success_count,
-                                'skipped': self.stats['dev_skipped'],
+                                'skipped': counts['dev_skipped'],
                                 'failed': failed_count
                             })
 
@@ -2127,7 +3265,7 @@ class UnifiedContactManager:
                                     self.log(f"   ⚠️ Failed to link to inbox: {str(link_err)}", level="WARNING")
                         else:
                             self.log(f"❌ Failed")
-                            self.stats['dev_failed'] += 1
+                            counts['dev_failed'] += 1
                             failed_count += 1
                             processed_count += 1
                             emit_progress(processed_count, total_to_process, f"❌ Failed @{entry['owner']}", {
@@ -2135,7 +3273,7 @@ class UnifiedContactManager:
                                 'status': 'failed',
                                 'reason': 'add_failed',
                                 'added': success_count,
-                                'skipped': self.stats['dev_skipped'],
+                                'skipped': counts['dev_skipped'],
                                 'failed': failed_count
                             })
 
@@ -2143,7 +3281,7 @@ class UnifiedContactManager:
                     # Telegram's explicit rate limit
                     wait_time = e.seconds + 10
                     self.log(f"⚠️  FLOOD WAIT for {wait_time}s")
-                    self.stats['dev_failed'] += 1
+                    counts['dev_failed'] += 1
                     failed_count += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"⚠️ Rate limited - waiting {wait_time}s", {
@@ -2151,41 +3289,45 @@ class UnifiedContactManager:
                         'status': 'rate_limited',
                         'wait_time': wait_time,
                         'added': success_count,
-                        'skipped': self.stats['dev_skipped'],
+                        'skipped': counts['dev_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(wait_time)
+                    await self._rate_limiter.trip(wait_time)
                     continue
 
                 except Exception as e:
                     # Check for generic FLOOD errors
                     if "FLOOD" in str(e):
-                        self.log(f"⚠️  Generic FLOOD error - waiting {self.GENERIC_FLOOD_WAIT}s")
-                        emit_progress(processed_count, total_to_process, f"⚠️ Flood error - waiting {self.GENERIC_FLOOD_WAIT}s", {
+                        flood_wait = int(self._backoff_delay(
+                            'flood', self.GENERIC_FLOOD_WAIT, self.GENERIC_FLOOD_WAIT_MAX,
+                            retry_after=getattr(e, 'seconds', None)
+                        ))
+                        self.log(f"⚠️  Generic FLOOD error - waiting {flood_wait}s")
+                        emit_progress(processed_count, total_to_process, f"⚠️ Flood error - waiting {flood_wait}s", {
                             'username': entry['owner'],
                             'status': 'flood_wait',
-                            'wait_time': self.GENERIC_FLOOD_WAIT,
+                            'wait_time': flood_wait,
                             'added': success_count,
-                            'skipped': self.stats['dev_skipped'],
+                            'skipped': counts['dev_skipped'],
                             'failed': failed_count
                         })
-                        await asyncio.sleep(self.GENERIC_FLOOD_WAIT)
+                        await self._rate_limiter.trip(flood_wait)
                     else:
                         self.log(f"❌ Error: {str(e)}")
-                    self.stats['dev_failed'] += 1
+                    counts['dev_failed'] += 1
                     failed_count += 1
                     processed_count += 1
                     continue
 
                 # Per-contact delay
-                await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                await asyncio.sleep(self._get_random_delay())
 
             # After batch, check if we need to wait
             if i + batch_size < len(new_entries):
                 # Calculate success rate and estimated batches remaining
                 current_success_rate = success_count / max(1, processed_count) if processed_count > 0 else 0
                 remaining_contacts = len(new_entries) - processed_count
-                total_batches_estimate = current_batch_number + math.ceil(remaining_contacts / avg_batch_size)
+                total_batches_estimate = current_batch_number + (remaining_contacts + avg_batch_size - 1) // avg_batch_size
 
                 # Determine batch delay with adaptive slowdown
                 batch_delay = random.uniform(self.BATCH_DELAY_MIN, self.BATCH_DELAY_MAX)
@@ -2216,42 +3358,48 @@ class UnifiedContactManager:
 
         # Summary
         success_rate = (success_count / max(1, processed_count) * 100) if processed_count > 0 else 0
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log(f"✅ Dev import completed!")
-        self.log(f"   ✅ Added: {self.stats['dev_added']}")
-        self.log(f"   ⏭️  Skipped: {self.stats['dev_skipped']}")
-        self.log(f"   ❌ Failed: {self.stats['dev_failed']}")
+        self.log(f"   ✅ Added: {counts['dev_added']}")
+        self.log(f"   ⏭️  Skipped: {counts['dev_skipped']}")
+        self.log(f"   ❌ Failed: {counts['dev_failed']}")
         self.log(f"   📊 Total success rate: {success_rate:.1f}%")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
-        # Invalidate cache and trigger fresh backup after import
-        if not dry_run and self.stats['dev_added'] > 0:
-            self._contact_cache.invalidate()
-            await self._contact_cache.get_contacts(self.client, phone=self.phone_number, force_refresh=True)
+        # Update cache and trigger fresh backup after import
+        if not dry_run and counts['dev_added'] > 0:
+            # We know exactly who was added - patch the cache instead of refetching all contacts
+            if self._contact_cache.append(self._added_users):
+                await self._contact_cache.persist()
+            else:
+                self._contact_cache.invalidate()
+                await self._contact_cache.get_contacts(self.client, phone=self.phone_number, force_refresh=True)
             self.log(f"💾 Backup automatically refreshed")
 
-    async def import_kol_contacts(self, csv_path: str, dry_run: bool = False, interactive: bool = True,
+    async def import_kol_contacts(self, csv_path: Union[str, Path, io.TextIOBase], dry_run: bool = False, interactive: bool = True,
                                    operation_id: str = None, progress_callback = None):
         """Import KOL contacts with advanced anti-rate-limit system
 
         Args:
-            csv_path: Path to CSV file
+            csv_path: Path to CSV file, or an open text file-like object (e.g. io.StringIO)
             dry_run: If True, don't actually add contacts
             interactive: If True, prompt for confirmation
             operation_id: Optional operation ID for WebSocket progress
             progress_callback: Optional callback(progress, total, message, contact_info) for real-time updates
         """
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("📥 KOL CONTACT IMPORT (ANTI-RATE-LIMIT MODE)")
-        self.log("="*70)
+        self.log(_BANNER)
 
         # Tracking variables for stats (initialized early for emit_progress closure)
         import_start_time = None  # Set when actual import starts
+        self._added_users = []
+        counts = self.stats  # Local alias - touched on every contact in the loops below
         success_count = 0
         failed_count = 0
         processed_count = 0
         current_batch_number = 1
-        avg_batch_size = (self.BATCH_SIZE_MIN + self.BATCH_SIZE_MAX) / 2
+        avg_batch_size = max(1, (self.BATCH_SIZE_MIN + self.BATCH_SIZE_MAX) // 2)  # int, >= 1
 
         # Helper to emit progress with structured stats
         def emit_progress(processed, total, message, contact_info=None):
@@ -2266,11 +3414,11 @@ class UnifiedContactManager:
                 speed = 0
                 eta_seconds = 0
 
-            total_batches_est = max(1, math.ceil(total / avg_batch_size)) if avg_batch_size > 0 else 1
+            total_batches_est = max(1, (total + avg_batch_size - 1) // avg_batch_size)
 
             stats = {
                 'added': success_count,
-                'skipped': self.stats.get('kol_skipped', 0),
+                'skipped': counts.get('kol_skipped', 0),
                 'failed': failed_count,
                 'success_rate': success_count / max(1, processed) if processed > 0 else 0,
                 'speed': round(speed, 2),
@@ -2290,7 +3438,7 @@ class UnifiedContactManager:
 
         # Read CSV (with utf-8-sig to handle BOM)
         try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            with self._open_csv_source(csv_path) as f:
                 reader = csv.DictReader(f)
 
                 # Validate required columns
@@ -2307,11 +3455,19 @@ class UnifiedContactManager:
                     return
 
                 entries = []
+                seen = set()  # Lowercased usernames already queued - drop repeated CSV rows
+                duplicate_rows = 0
                 for row in reader:
                     if row.get('TG Usernames') and row['TG Usernames'].strip():
+                        telegram = row['TG Usernames'].strip().lstrip('@')
+                        key = telegram.lower()
+                        if key in seen:
+                            duplicate_rows += 1
+                            continue
+                        seen.add(key)
                         entries.append({
                             'twitter': row['Twitter Username'].strip().lstrip('@'),
-                            'telegram': row['TG Usernames'].strip().lstrip('@')
+                            'telegram': telegram
                         })
         except FileNotFoundError:
             self.log(f"❌ CSV file not found: {csv_path}", level="ERROR")
@@ -2321,6 +3477,8 @@ class UnifiedContactManager:
             return
 
         self.log(f"\n📊 Found {len(entries)} valid KOL entries")
+        if duplicate_rows:
+            self.log(f"   🔁 Dropped {duplicate_rows} duplicate CSV rows")
         self.log(f"📦 Variable batch sizes: {self.BATCH_SIZE_MIN}-{self.BATCH_SIZE_MAX} contacts")
         self.log(f"⏳ Batch delays: {self.BATCH_DELAY_MIN}-{self.BATCH_DELAY_MAX} seconds\n")
 
@@ -2333,7 +3491,7 @@ class UnifiedContactManager:
 
         # Count pre-filtered as skipped in stats
         pre_filtered_count = len(already_kol) + len(already_in_contacts)
-        self.stats['kol_skipped'] = pre_filtered_count  # Initialize with pre-filtered count
+        counts['kol_skipped'] = pre_filtered_count  # Initialize with pre-filtered count
 
         # Show preview
         self.log("📋 Preview:")
@@ -2354,9 +3512,9 @@ class UnifiedContactManager:
             # API mode: auto-approve if not dry_run
             self.log(f"\n✅ Auto-approved in non-interactive mode")
 
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log("🔄 Starting anti-rate-limit import...")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
         # Set import start time for speed/ETA calculations (variables defined earlier)
         import_start_time = datetime.now()
@@ -2381,19 +3539,19 @@ class UnifiedContactManager:
             self.log(f"{'─'*70}")
 
             for entry in batch_entries:
-                username = entry['telegram'].lower()
+                username = sys.intern(entry['telegram'].lower())
 
                 # Skip usernames that previously failed in this session
                 if username in session_failed_usernames:
                     self.log(f"   ⏭️  @{entry['telegram']} - previously failed (username doesn't exist)")
-                    self.stats['kol_skipped'] += 1
+                    counts['kol_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"⏭️ @{entry['telegram']} - previously failed", {
                         'username': entry['telegram'],
                         'status': 'skipped',
                         'reason': 'previously_failed',
                         'added': success_count,
-                        'skipped': self.stats['kol_skipped'],
+                        'skipped': counts['kol_skipped'],
                         'failed': failed_count
                     })
                     continue
@@ -2401,32 +3559,32 @@ class UnifiedContactManager:
                 # Check if already added
                 if username in kol_contacts:
                     self.log(f"   ⏭️  @{entry['telegram']} - already marked as KOL")
-                    self.stats['kol_skipped'] += 1
+                    counts['kol_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"Skipped @{entry['telegram']} (already KOL)", {
                         'username': entry['telegram'],
                         'status': 'skipped',
                         'reason': 'already_kol',
                         'added': success_count,
-                        'skipped': self.stats['kol_skipped'],
+                        'skipped': counts['kol_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                    await asyncio.sleep(self._get_random_delay())
                     continue
 
                 if username in existing_contacts:
                     self.log(f"   ⏭️  @{entry['telegram']} - already in contacts")
-                    self.stats['kol_skipped'] += 1
+                    counts['kol_skipped'] += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"Skipped @{entry['telegram']} (in contacts)", {
                         'username': entry['telegram'],
                         'status': 'skipped',
                         'reason': 'already_contact',
                         'added': success_count,
-                        'skipped': self.stats['kol_skipped'],
+                        'skipped': counts['kol_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                    await asyncio.sleep(self._get_random_delay())
                     continue
 
                 self.log(f"   🔵📢 @{entry['telegram']} (@{entry['twitter']})")
@@ -2434,14 +3592,16 @@ class UnifiedContactManager:
                     'username': entry['telegram'],
                     'status': 'processing',
                     'added': success_count,
-                    'skipped': self.stats['kol_skipped'],
+                    'skipped': counts['kol_skipped'],
                     'failed': failed_count
                 })
 
                 try:
                     # Check if client is still connected before each contact
                     if not self.client or not self.client.is_connected():
-                        self.log(f"   ⚠️  Client disconnected, attempting to reconnect...")
+                        reconnect_delay = self._backoff_delay('conn', self.RECONNECT_DELAY_BASE, self.RECONNECT_DELAY_MAX)
+                        self.log(f"   ⚠️  Client disconnected, reconnecting in {reconnect_delay:.0f}s...")
+                        await asyncio.sleep(reconnect_delay)
                         try:
                             await self.init_client(self.phone_number)
                             self.log(f"   ✅ Reconnected successfully")
@@ -2449,12 +3609,12 @@ class UnifiedContactManager:
                             self.log(f"   ❌ Failed to reconnect: {str(reconnect_error)}", level="ERROR")
                             # Mark remaining as failed and exit
                             remaining = total_to_process - processed_count
-                            self.stats['kol_failed'] += remaining
+                            counts['kol_failed'] += remaining
                             emit_progress(total_to_process, total_to_process, f"❌ Import stopped: connection lost", {
                                 'status': 'connection_lost',
                                 'added': success_count,
-                                'skipped': self.stats['kol_skipped'],
-                                'failed': self.stats['kol_failed']
+                                'skipped': counts['kol_skipped'],
+                                'failed': counts['kol_failed']
                             })
                             return
                     
@@ -2467,7 +3627,7 @@ class UnifiedContactManager:
                         # Track usernames that don't exist on Telegram
                         if "No user has" in status:
                             session_failed_usernames.add(username)
-                        self.stats['kol_failed'] += 1
+                        counts['kol_failed'] += 1
                         failed_count += 1
                         processed_count += 1
                         emit_progress(processed_count, total_to_process, f"Failed @{entry['telegram']}: {status}", {
@@ -2475,10 +3635,10 @@ class UnifiedContactManager:
                             'status': 'failed',
                             'reason': status,
                             'added': success_count,
-                            'skipped': self.stats['kol_skipped'],
+                            'skipped': counts['kol_skipped'],
                             'failed': failed_count
                         })
-                        await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                        await asyncio.sleep(self._get_random_delay())
                         continue
 
                     # Format contact: 🔵📢Telegram Username | @Twitter Username
@@ -2487,7 +3647,7 @@ class UnifiedContactManager:
                     if dry_run:
                         self.log(f"   📝 {formatted_name}")
                         self.log(f"✅ Would add")
-                        self.stats['kol_added'] += 1
+                        counts['kol_added'] += 1
                         success_count += 1
                         processed_count += 1
                         emit_progress(processed_count, total_to_process, f"Would add @{entry['telegram']}", {
@@ -2496,7 +3656,7 @@ class UnifiedContactManager:
                             'display_name': display_name,
                             'formatted_name': formatted_name,
                             'added': success_count,
-                            'skipped': self.stats['kol_skipped'],
+                            'skipped': counts['kol_skipped'],
                             'failed': failed_count
                         })
                     else:
@@ -2504,7 +3664,8 @@ class UnifiedContactManager:
                         if success:
                             self.log(f"   📝 {formatted_name}")
                             self.log(f"✅ Added")
-                            self.stats['kol_added'] += 1
+                            counts['kol_added'] += 1
+                            self._reset_backoff()
                             existing_contacts.add(username)
                             kol_contacts.add(username)
                             success_count += 1
@@ -2515,7 +3676,7 @@ class UnifiedContactManager:
                                 'display_name': display_name,
                                 'formatted_name': formatted_name,
                                 'added': success_count,
-                                'skipped': self.stats['kol_skipped'],
+                                'skipped': counts['kol_skipped'],
                                 'failed': failed_count
                             })
 
@@ -2537,7 +3698,7 @@ class UnifiedContactManager:
                         else:
                             self.log(f"   📝 {formatted_name}")
                             self.log(f"❌ Failed")
-                            self.stats['kol_failed'] += 1
+                            counts['kol_failed'] += 1
                             failed_count += 1
                             processed_count += 1
                             emit_progress(processed_count, total_to_process, f"❌ Failed @{entry['telegram']}", {
@@ -2545,7 +3706,7 @@ class UnifiedContactManager:
                                 'status': 'failed',
                                 'reason': 'add_failed',
                                 'added': success_count,
-                                'skipped': self.stats['kol_skipped'],
+                                'skipped': counts['kol_skipped'],
                                 'failed': failed_count
                             })
 
@@ -2555,7 +3716,7 @@ class UnifiedContactManager:
                     # Telegram's explicit rate limit
                     wait_time = e.seconds + 10
                     self.log(f"⚠️  FLOOD WAIT for {wait_time}s")
-                    self.stats['kol_failed'] += 1
+                    counts['kol_failed'] += 1
                     failed_count += 1
                     processed_count += 1
                     emit_progress(processed_count, total_to_process, f"⚠️ Rate limited - waiting {wait_time}s", {
@@ -2563,10 +3724,10 @@ class UnifiedContactManager:
                         'status': 'rate_limited',
                         'wait_time': wait_time,
                         'added': success_count,
-                        'skipped': self.stats['kol_skipped'],
+                        'skipped': counts['kol_skipped'],
                         'failed': failed_count
                     })
-                    await asyncio.sleep(wait_time)
+                    await self._rate_limiter.trip(wait_time)
                     continue
 
                 except Exception as e:
@@ -2574,7 +3735,9 @@ class UnifiedContactManager:
                     # Check for connection-related errors
                     if any(x in error_str for x in ['AUTH_KEY', 'Unauthorized', 'ConnectionError', 'disconnected']):
                         self.log(f"⚠️  Connection error detected: {error_str}", level="ERROR")
-                        self.log(f"   Attempting to reconnect...")
+                        reconnect_delay = self._backoff_delay('conn', self.RECONNECT_DELAY_BASE, self.RECONNECT_DELAY_MAX)
+                        self.log(f"   Attempting to reconnect in {reconnect_delay:.0f}s...")
+                        await asyncio.sleep(reconnect_delay)
                         try:
                             await self.init_client(self.phone_number)
                             self.log(f"   ✅ Reconnected, retrying contact...")
@@ -2583,42 +3746,46 @@ class UnifiedContactManager:
                         except Exception as reconnect_error:
                             self.log(f"   ❌ Reconnection failed: {str(reconnect_error)}", level="ERROR")
                             remaining = total_to_process - processed_count
-                            self.stats['kol_failed'] += remaining
+                            counts['kol_failed'] += remaining
                             emit_progress(total_to_process, total_to_process, f"❌ Import stopped: connection lost", {
                                 'status': 'connection_lost',
                                 'added': success_count,
-                                'skipped': self.stats['kol_skipped'],
-                                'failed': self.stats['kol_failed']
+                                'skipped': counts['kol_skipped'],
+                                'failed': counts['kol_failed']
                             })
                             return
                     # Check for generic FLOOD errors
                     elif "FLOOD" in error_str:
-                        self.log(f"⚠️  Generic FLOOD error - waiting {self.GENERIC_FLOOD_WAIT}s")
-                        emit_progress(processed_count, total_to_process, f"⚠️ Flood error - waiting {self.GENERIC_FLOOD_WAIT}s", {
+                        flood_wait = int(self._backoff_delay(
+                            'flood', self.GENERIC_FLOOD_WAIT, self.GENERIC_FLOOD_WAIT_MAX,
+                            retry_after=getattr(e, 'seconds', None)
+                        ))
+                        self.log(f"⚠️  Generic FLOOD error - waiting {flood_wait}s")
+                        emit_progress(processed_count, total_to_process, f"⚠️ Flood error - waiting {flood_wait}s", {
                             'username': entry['telegram'],
                             'status': 'flood_wait',
-                            'wait_time': self.GENERIC_FLOOD_WAIT,
+                            'wait_time': flood_wait,
                             'added': success_count,
-                            'skipped': self.stats['kol_skipped'],
+                            'skipped': counts['kol_skipped'],
                             'failed': failed_count
                         })
-                        await asyncio.sleep(self.GENERIC_FLOOD_WAIT)
+                        await self._rate_limiter.trip(flood_wait)
                     else:
                         self.log(f"❌ Error: {error_str}")
-                    self.stats['kol_failed'] += 1
+                    counts['kol_failed'] += 1
                     failed_count += 1
                     processed_count += 1
                     continue
 
                 # Per-contact delay
-                await asyncio.sleep(random.uniform(self.PER_CONTACT_DELAY_MIN, self.PER_CONTACT_DELAY_MAX))
+                await asyncio.sleep(self._get_random_delay())
 
             # After batch, check if we need to wait
             if i + batch_size < len(entries):
                 # Calculate success rate and estimated batches remaining
                 current_success_rate = success_count / max(1, processed_count) if processed_count > 0 else 0
                 remaining_contacts = len(entries) - processed_count
-                total_batches_estimate = current_batch_number + math.ceil(remaining_contacts / avg_batch_size)
+                total_batches_estimate = current_batch_number + (remaining_contacts + avg_batch_size - 1) // avg_batch_size
 
                 # Determine batch delay with adaptive slowdown
                 batch_delay = random.uniform(self.BATCH_DELAY_MIN, self.BATCH_DELAY_MAX)
@@ -2649,18 +3816,22 @@ class UnifiedContactManager:
 
         # Summary
         success_rate = (success_count / max(1, processed_count) * 100) if processed_count > 0 else 0
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log(f"✅ KOL import completed!")
-        self.log(f"   ✅ Added: {self.stats['kol_added']}")
-        self.log(f"   ⏭️  Skipped: {self.stats['kol_skipped']}")
-        self.log(f"   ❌ Failed: {self.stats['kol_failed']}")
+        self.log(f"   ✅ Added: {counts['kol_added']}")
+        self.log(f"   ⏭️  Skipped: {counts['kol_skipped']}")
+        self.log(f"   ❌ Failed: {counts['kol_failed']}")
         self.log(f"   📊 Total success rate: {success_rate:.1f}%")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
-        # Invalidate cache and trigger fresh backup after import
-        if not dry_run and self.stats['kol_added'] > 0:
-            self._contact_cache.invalidate()
-            await self._contact_cache.get_contacts(self.client, phone=self.phone_number, force_refresh=True)
+        # Update cache and trigger fresh backup after import
+        if not dry_run and counts['kol_added'] > 0:
+            # We know exactly who was added - patch the cache instead of refetching all contacts
+            if self._contact_cache.append(self._added_users):
+                await self._contact_cache.persist()
+            else:
+                self._contact_cache.invalidate()
+                await self._contact_cache.get_contacts(self.client, phone=self.phone_number, force_refresh=True)
             self.log(f"💾 Backup automatically refreshed")
 
     async def check_reply(self, entity, hours: int = 48) -> bool:
@@ -2669,6 +3840,7 @@ class UnifiedContactManager:
             cutoff_time = datetime.now() - timedelta(hours=hours)
             your_msgs = their_msgs = 0
 
+            await self._rate_limiter.acquire()
             async for msg in self.client.iter_messages(entity, limit=100):
                 msg_time = msg.date.replace(tzinfo=None) if msg.date.tzinfo else msg.date
                 if msg_time < cutoff_time:
@@ -2683,6 +3855,37 @@ class UnifiedContactManager:
             self.log(f"   ⚠️  Error checking replies: {str(e)}", level="WARNING")
             return False
 
+    def _get_blue_contacts(self, users, include_other: bool = True) -> tuple:
+        """
+        Classify blue (🔵) contacts in a single pass.
+
+        Args:
+            users: Telegram User objects (e.g. GetContactsRequest result.users)
+            include_other: Keep blue contacts that are neither dev nor KOL
+
+        Returns:
+            Tuple of (dev_count, kol_count, blue_map) where blue_map is
+            {user_id: (tag, user)} and tag is 'dev', 'kol' or 'other'
+        """
+        dev = kol = 0
+        blue_map = {}
+        for user in users:
+            fn = user.first_name
+            if not fn or '🔵' not in fn or not user.id:
+                continue
+            if '💻' in fn:
+                dev += 1
+                tag = 'dev'
+            elif '📢' in fn:
+                kol += 1
+                tag = 'kol'
+            elif include_other:
+                tag = 'other'
+            else:
+                continue
+            blue_map[user.id] = (tag, user)
+        return dev, kol, blue_map
+
     async def scan_for_replies(self, dialog_limit: int = 100, log_callback=None) -> Dict:
         """
         Scan inbox dialogs to detect replies from BLUE CONTACTS ONLY.
@@ -2704,43 +3907,32 @@ class UnifiedContactManager:
                 if log_callback:
                     log_callback(message)
 
-            self.log("\n" + "="*70)
+            self.log(_BANNER_LINE)
             self.log(f"📱 SCANNING DIALOGS FOR REPLIES (Blue Contacts Only)")
-            self.log("="*70 + "\n")
+            self.log(_BANNER_END)
 
             # Step 1: Get all blue contacts (with 🔵 emoji)
             self.log("Fetching blue contacts...")
             result = await self._contact_cache.get_contacts(self.client, phone=self.phone_number)
 
-            blue_dev_contacts = [
-                u for u in result.users
-                if u.first_name and '🔵💻' in u.first_name
-            ]
-
-            blue_kol_contacts = [
-                u for u in result.users
-                if u.first_name and '🔵📢' in u.first_name
-            ]
-
-            all_blue_contacts = blue_dev_contacts + blue_kol_contacts
-            total_blue = len(all_blue_contacts)
+            # Single pass: counts + {user_id: (tag, user)} - only devs and KOLs are scanned
+            blue_dev_count, blue_kol_count, blue_contact_map = self._get_blue_contacts(
+                result.users, include_other=False
+            )
+            total_blue = len(blue_contact_map)
 
             if total_blue == 0:
                 log_and_callback("No blue contacts found to check.")
                 return {'id_statuses': {}, 'name_statuses': {}}
 
             log_and_callback(f"Found {total_blue} blue contacts:")
-            log_and_callback(f"   🔵💻 Blue Developers: {len(blue_dev_contacts)}")
-            log_and_callback(f"   🔵📢 Blue KOLs: {len(blue_kol_contacts)}")
-
-            # Build mapping of blue contact user IDs for faster lookup
-            blue_contact_map = {}
-            for user in all_blue_contacts:
-                blue_contact_map[user.id] = user
+            log_and_callback(f"   🔵💻 Blue Developers: {blue_dev_count}")
+            log_and_callback(f"   🔵📢 Blue KOLs: {blue_kol_count}")
 
             # Step 2: Scan dialogs for replies from blue contacts
             log_and_callback(f"Scanning {dialog_limit} dialogs for replies...")
-            log_and_callback(f"📊 DEBUG: Blue contacts found: {len(all_blue_contacts)}")
+            log_and_callback(f"📊 DEBUG: Blue contacts found: {total_blue}")
+            await self._rate_limiter.acquire()
             dialogs = await self.client.get_dialogs(limit=dialog_limit)
             log_and_callback(f"📊 DEBUG: Dialogs scanned: {len(dialogs)}")
 
@@ -2764,7 +3956,7 @@ class UnifiedContactManager:
 
                 # Check if this dialog is with a blue contact (by user ID)
                 if isinstance(entity, User) and entity.id in blue_contact_map:
-                    matching_blue_contact = blue_contact_map[entity.id]
+                    tag, matching_blue_contact = blue_contact_map[entity.id]
 
                     # Use dialog.message (already cached) - NO API CALL NEEDED!
                     # This is the same approach used in check_seen_no_reply()
@@ -2791,7 +3983,7 @@ class UnifiedContactManager:
                             name_statuses[matching_blue_contact.first_name] = True
 
                             # Track dev vs KOL
-                            if '🔵💻' in matching_blue_contact.first_name:
+                            if tag == 'dev':
                                 blue_dev_replied += 1
                             else:
                                 blue_kol_replied += 1
@@ -2805,38 +3997,37 @@ class UnifiedContactManager:
             log_and_callback(f"📊 DEBUG: Dialogs checked: {dialogs_checked}")
 
             # Step 3: Calculate stats
-            blue_dev_no_reply = len(blue_dev_contacts) - blue_dev_replied
-            blue_kol_no_reply = len(blue_kol_contacts) - blue_kol_replied
+            blue_dev_no_reply = blue_dev_count - blue_dev_replied
+            blue_kol_no_reply = blue_kol_count - blue_kol_replied
 
             # Update stats
             self.stats['contacts_checked'] += total_blue
 
             # Step 4: Display results
-            self.log(f"{'='*70}")
+            self.log(_BANNER)
             log_and_callback(f"📊 SCAN RESULTS - BY TYPE:")
-            self.log(f"{'='*70}\n")
+            self.log(_BANNER_END)
 
-            log_and_callback(f"🔵💻 BLUE DEVELOPERS: {len(blue_dev_contacts)} total")
+            log_and_callback(f"🔵💻 BLUE DEVELOPERS: {blue_dev_count} total")
             log_and_callback(f"   ✅ Replied: {blue_dev_replied}")
             log_and_callback(f"   ❌ No reply: {blue_dev_no_reply}")
 
-            log_and_callback(f"🔵📢 BLUE KOLs: {len(blue_kol_contacts)} total")
+            log_and_callback(f"🔵📢 BLUE KOLs: {blue_kol_count} total")
             log_and_callback(f"   ✅ Replied: {blue_kol_replied}")
             log_and_callback(f"   ❌ No reply: {blue_kol_no_reply}")
 
             log_and_callback(f"🔵 TOTAL BLUE CONTACTS: {total_blue}")
             log_and_callback(f"   ✅ Total Replied: {blue_dev_replied + blue_kol_replied}")
             log_and_callback(f"   ❌ Total No reply: {blue_dev_no_reply + blue_kol_no_reply}")
-            self.log(f"{'='*70}\n")
-
-            # Step 5: Auto-update statuses if any replied
-            if id_statuses:
-                await self.update_statuses(id_statuses)
+            self.log(_BANNER_END)
 
+            # Statuses are not updated here - callers pass id_statuses to
+            # update_statuses(..., interactive=False) themselves
             return {'id_statuses': id_statuses, 'name_statuses': name_statuses}
 
         except FloodWaitError as e:
             self.log(f"⚠️  RATE LIMITED by Telegram! Wait {e.seconds}s before retrying.", level="ERROR")
+            await self._rate_limiter.trip(e.seconds, wait=False)
             # Raise custom error to stop operation immediately and notify frontend
             raise TelegramRateLimitError(
                 wait_seconds=e.seconds,
@@ -2846,11 +4037,45 @@ class UnifiedContactManager:
             self.log(f"❌ Error scanning dialogs: {str(e)}", level="ERROR")
             return {'id_statuses': {}, 'name_statuses': {}}
 
+    async def _apply_yellow(self, users: List):
+        """
+        Rename blue contacts to yellow (🔵 → 🟡), one AddContactRequest per contact.
+
+        Args:
+            users: Telegram User objects to update
+        """
+        total = len(users)
+        for i, user in enumerate(users, 1):
+            # Replace emoji 🔵 → 🟡 (pure string op - skip before any API call or delay)
+            new_first_name = user.first_name.replace('🔵', '🟡')
+            if new_first_name == user.first_name:
+                continue
+
+            username = user.username or "unknown"
+            self.log(f"[{i}/{total}] Updating @{username}...")
+
+            try:
+                await self._rate_limiter.acquire()
+                await self.client(AddContactRequest(
+                    id=user.id,
+                    first_name=new_first_name,
+                    last_name=user.last_name or "",
+                    phone=user.phone or "",
+                    add_phone_privacy_exception=False
+                ))
+
+                self.log("✅ Updated")
+                self.stats['contacts_updated'] += 1
+            except Exception as e:
+                self.log(f"❌ Error: {str(e)}", level="WARNING")
+
+            await asyncio.sleep(self._get_random_delay())
+
     async def update_statuses(self, reply_statuses: Dict, interactive: bool = True):
         """Update contacts from 🔵 to 🟡 if they replied - with type tracking"""
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("🎨 UPDATING STATUSES (🔵 → 🟡)")
-        self.log("="*70 + "\n")
+        self.log(_BANNER_END)
 
         # Get all contacts
         result = await self._contact_cache.get_contacts(self.client, phone=self.phone_number)
@@ -2888,75 +4113,22 @@ class UnifiedContactManager:
             # API mode: auto-approve
             self.log(f"✅ Auto-approved in non-interactive mode")
 
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log("🔄 Updating contacts...")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
-        # Update developer contacts
+        # Update developer contacts, then KOL contacts
         if dev_contacts_to_update:
             self.log("🔵💻 Updating Developer Contacts:")
-            for i, user in enumerate(dev_contacts_to_update, 1):
-                username = user.username or "unknown"
-                self.log(f"[{i}/{len(dev_contacts_to_update)}] Updating @{username}...")
-
-                try:
-                    # Replace emoji 🔵 → 🟡
-                    new_first_name = user.first_name.replace('🔵', '🟡')
+            await self._apply_yellow(dev_contacts_to_update)
 
-                    if new_first_name == user.first_name:
-                        self.log("⏭️  Already yellow")
-                        await asyncio.sleep(self._get_random_delay())
-                        continue
-
-                    await self.client(AddContactRequest(
-                        id=user.id,
-                        first_name=new_first_name,
-                        last_name=user.last_name or "",
-                        phone=user.phone or "",
-                        add_phone_privacy_exception=False
-                    ))
-
-                    self.log("✅ Updated")
-                    self.stats['contacts_updated'] += 1
-                except Exception as e:
-                    self.log(f"❌ Error: {str(e)}", level="WARNING")
-
-                await asyncio.sleep(self._get_random_delay())
-
-        # Update KOL contacts
         if kol_contacts_to_update:
             self.log(f"\n🔵📢 Updating KOL Contacts:")
-            for i, user in enumerate(kol_contacts_to_update, 1):
-                username = user.username or "unknown"
-                self.log(f"[{i}/{len(kol_contacts_to_update)}] Updating @{username}...")
-
-                try:
-                    # Replace emoji 🔵 → 🟡
-                    new_first_name = user.first_name.replace('🔵', '🟡')
-
-                    if new_first_name == user.first_name:
-                        self.log("⏭️  Already yellow")
-                        await asyncio.sleep(self._get_random_delay())
-                        continue
-
-                    await self.client(AddContactRequest(
-                        id=user.id,
-                        first_name=new_first_name,
-                        last_name=user.last_name or "",
-                        phone=user.phone or "",
-                        add_phone_privacy_exception=False
-                    ))
+            await self._apply_yellow(kol_contacts_to_update)
 
-                    self.log("✅ Updated")
-                    self.stats['contacts_updated'] += 1
-                except Exception as e:
-                    self.log(f"❌ Error: {str(e)}", level="WARNING")
-
-                await asyncio.sleep(self._get_random_delay())
-
-        self.log(f"\n{'='*70}")
+        self.log(_BANNER_LINE)
         self.log(f"✅ Update completed! Updated: {self.stats['contacts_updated']} contacts")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
         # Invalidate cache and trigger fresh backup after status update
         if self.stats['contacts_updated'] > 0:
@@ -2985,25 +4157,16 @@ class UnifiedContactManager:
         Returns:
             List of dicts: {username, display_name, type, message_sent_date, last_seen_date}
         """
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log(f"👀 CHECKING SEEN BUT NO REPLY (Last {hours} hours)")
-        self.log("="*70 + "\n")
+        self.log(_BANNER_END)
 
         try:
             # Step 1: Get all blue contacts (fast - single API call)
             self.log("Fetching blue contacts...")
             result = await self._contact_cache.get_contacts(self.client, phone=self.phone_number)
 
-            blue_contacts = {}
-            for user in result.users:
-                if user.first_name and '🔵' in user.first_name:
-                    if user.id:
-                        contact_type = 'dev' if '💻' in user.first_name else 'kol' if '📢' in user.first_name else 'other'
-                        blue_contacts[user.id] = {
-                            'username': user.username or 'unknown',
-                            'display_name': user.first_name,
-                            'type': contact_type
-                        }
+            _, _, blue_contacts = self._get_blue_contacts(result.users)
             
             if not blue_contacts:
                 self.log("No blue contacts found to check.\n")
@@ -3013,10 +4176,11 @@ class UnifiedContactManager:
             
             # Step 2: Get dialogs with messages (single API call - FAST!)
             self.log(f"Fetching {dialog_limit} dialogs (this is fast)...")
+            await self._rate_limiter.acquire()
             dialogs = await self.client.get_dialogs(limit=dialog_limit)
             
-            # Time cutoff
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            # Time cutoff (tz-aware, computed once - Telegram message dates are UTC)
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             
             seen_no_reply = []
             checked_count = 0
@@ -3024,12 +4188,32 @@ class UnifiedContactManager:
             skipped_no_outgoing = 0
             skipped_not_read = 0
             skipped_replied = 0
+            stale_streak = 0
             
             self.log(f"Processing dialogs...\n")
             
             for dialog in dialogs:
                 entity = dialog.entity
                 
+                # Get the last message in dialog (already available from get_dialogs!)
+                last_msg = dialog.message
+                msg_time = None
+                if last_msg:
+                    msg_time = last_msg.date
+                    if msg_time.tzinfo is None:
+                        msg_time = msg_time.replace(tzinfo=timezone.utc)
+                
+                    # Dialogs come most-recent-first: after a run of stale ones, nothing
+                    # further down can be in the window (pinned dialogs don't count)
+                    if not dialog.pinned:
+                        if msg_time < cutoff_time and not dialog.unread_count:
+                            stale_streak += 1
+                            if stale_streak >= self.STALE_DIALOG_STREAK:
+                                self.log(f"   ⏭️  {stale_streak} consecutive dialogs outside the window - stopping early")
+                                break
+                        else:
+                            stale_streak = 0
+                
                 # Skip if not a user (groups, channels, etc.)
                 if not isinstance(entity, User):
                     continue
@@ -3040,19 +4224,13 @@ class UnifiedContactManager:
                     continue
                 
                 checked_count += 1
-                contact_info = blue_contacts[entity.id]
-                username = contact_info['username']
-                
-                # Get the last message in dialog (already available from get_dialogs!)
-                last_msg = dialog.message
+                contact_type, contact_user = blue_contacts[entity.id]
+                username = contact_user.username or 'unknown'
                 
                 if not last_msg:
                     skipped_no_outgoing += 1
                     continue
                 
-                # Check message time
-                msg_time = last_msg.date.replace(tzinfo=None) if last_msg.date.tzinfo else last_msg.date
-                
                 # If last message is within time window and is OURS (outgoing)
                 if last_msg.out and msg_time >= cutoff_time:
                     # Check if they read our message using read_outbox_max_id
@@ -3081,8 +4259,8 @@ class UnifiedContactManager:
                     
                     seen_no_reply.append({
                         'username': username,
-                        'display_name': contact_info['display_name'],
-                        'type': contact_info['type'],
+                        'display_name': contact_user.first_name,
+                        'type': contact_type,
                         'message_sent_date': msg_time.strftime('%Y-%m-%d %H:%M:%S'),
                         'last_seen_date': last_seen_str
                     })
@@ -3097,9 +4275,9 @@ class UnifiedContactManager:
                     skipped_no_outgoing += 1
             
             # Summary
-            self.log(f"\n{'='*70}")
+            self.log(_BANNER_LINE)
             self.log(f"📊 SCAN RESULTS:")
-            self.log(f"{'='*70}")
+            self.log(_BANNER)
             self.log(f"   Dialogs scanned: {len(dialogs)}")
             self.log(f"   Blue contacts found in dialogs: {checked_count}")
             self.log(f"   Skipped (not blue contact): {skipped_not_blue}")
@@ -3112,11 +4290,14 @@ class UnifiedContactManager:
             kol_count = len([x for x in seen_no_reply if x['type'] == 'kol'])
             self.log(f"      🔵💻 Developers: {dev_count}")
             self.log(f"      🔵📢 KOLs: {kol_count}")
-            self.log(f"{'='*70}\n")
+            self.log(_BANNER_END)
             
             # Export to CSV files by type if requested
             if export_csv and seen_no_reply:
-                csv_files = self.export_noreply_csv_by_type(seen_no_reply, hours)
+                # Write CSVs off the event loop (pure file I/O - no Telethon client access)
+                csv_files = await asyncio.get_running_loop().run_in_executor(
+                    None, self.export_noreply_csv_by_type, seen_no_reply, hours
+                )
                 if csv_files:
                     self.log(f"\n📁 CSV files exported:")
                     for file_type, file_path in csv_files.items():
@@ -3126,6 +4307,7 @@ class UnifiedContactManager:
             
         except FloodWaitError as e:
             self.log(f"⚠️  RATE LIMITED by Telegram! Wait {e.seconds}s before retrying.", level="ERROR")
+            await self._rate_limiter.trip(e.seconds, wait=False)
             # Raise custom error to stop operation immediately and notify frontend
             raise TelegramRateLimitError(
                 wait_seconds=e.seconds,
@@ -3155,16 +4337,13 @@ class UnifiedContactManager:
         csv_path = Path(__file__).parent / csv_filename
         
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['username', 'message_sent_date', 'last_seen_date'])
-                writer.writeheader()
-                
-                for row in results:
-                    writer.writerow({
-                        'username': row['username'],
-                        'message_sent_date': row['message_sent_date'],
-                        'last_seen_date': row['last_seen_date']
-                    })
+            with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(('username', 'message_sent_date', 'last_seen_date'))
+                writer.writerows(
+                    (row['username'], row['message_sent_date'], row['last_seen_date'])
+                    for row in results
+                )
             
             self.log(f"✅ Exported {len(results)} contacts to: {csv_filename}")
             return str(csv_path)
@@ -3185,17 +4364,28 @@ class UnifiedContactManager:
         Returns:
             Dict with file paths: {'dev': path, 'kol': path}
         """
+        if not results:
+            return {}
+        
         if output_dir is None:
             output_dir = LOGS_DIR / "noreply"
-        output_dir.mkdir(parents=True, exist_ok=True)
         
         # Determine timeframe label
         timeframe_map = {24: '24h', 48: '48h', 168: '7d'}
         timeframe = timeframe_map.get(hours, f'{hours}h')
         
-        # Separate by type
-        dev_results = [r for r in results if r.get('type') == 'dev']
-        kol_results = [r for r in results if r.get('type') == 'kol']
+        # Separate by type (single pass - other types are ignored)
+        dev_results, kol_results = [], []
+        for r in results:
+            contact_type = r.get('type')
+            if contact_type == 'dev':
+                dev_results.append(r)
+            elif contact_type == 'kol':
+                kol_results.append(r)
+        
+        if not dev_results and not kol_results:
+            return {}
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         file_paths = {}
         
@@ -3203,16 +4393,13 @@ class UnifiedContactManager:
         if dev_results:
             dev_file = output_dir / f'noreplyDEV_{timeframe}.csv'
             try:
-                with open(dev_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['username', 'display_name', 'message_sent_date', 'last_seen_date'])
-                    writer.writeheader()
-                    for row in dev_results:
-                        writer.writerow({
-                            'username': row['username'],
-                            'display_name': row.get('display_name', ''),
-                            'message_sent_date': row['message_sent_date'],
-                            'last_seen_date': row['last_seen_date']
-                        })
+                with open(dev_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(('username', 'display_name', 'message_sent_date', 'last_seen_date'))
+                    writer.writerows(
+                        (row['username'], row.get('display_name', ''), row['message_sent_date'], row['last_seen_date'])
+                        for row in dev_results
+                    )
                 file_paths['dev'] = str(dev_file)
                 self.log(f"✅ Exported {len(dev_results)} DEV contacts to: noreplyDEV_{timeframe}.csv")
             except Exception as e:
@@ -3222,16 +4409,13 @@ class UnifiedContactManager:
         if kol_results:
             kol_file = output_dir / f'noreplyKOL_{timeframe}.csv'
             try:
-                with open(kol_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['username', 'display_name', 'message_sent_date', 'last_seen_date'])
-                    writer.writeheader()
-                    for row in kol_results:
-                        writer.writerow({
-                            'username': row['username'],
-                            'display_name': row.get('display_name', ''),
-                            'message_sent_date': row['message_sent_date'],
-                            'last_seen_date': row['last_seen_date']
-                        })
+                with open(kol_file, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(('username', 'display_name', 'message_sent_date', 'last_seen_date'))
+                    writer.writerows(
+                        (row['username'], row.get('display_name', ''), row['message_sent_date'], row['last_seen_date'])
+                        for row in kol_results
+                    )
                 file_paths['kol'] = str(kol_file)
                 self.log(f"✅ Exported {len(kol_results)} KOL contacts to: noreplyKOL_{timeframe}.csv")
             except Exception as e:
@@ -3250,9 +4434,9 @@ class UnifiedContactManager:
         Returns:
             Tuple of (path to created CSV file, contact count)
         """
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("💾 BACKING UP ALL TELEGRAM CONTACTS")
-        self.log("="*70 + "\n")
+        self.log(_BANNER_END)
 
         if output_dir is None:
             output_dir = LOGS_DIR
@@ -3268,7 +4452,7 @@ class UnifiedContactManager:
 
             # Generate filename with timestamp and phone number for per-account isolation
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            clean_phone = self.phone_number.replace('+', '').replace('-', '').replace(' ', '')
+            clean_phone = _clean_phone(self.phone_number)
 
             # Create per-account backup directory
             backup_dir = LOGS_DIR / "backups"
@@ -3282,77 +4466,90 @@ class UnifiedContactManager:
             latest_filename = f"contacts_{clean_phone}_latest.csv"
             latest_path = backup_dir / latest_filename
 
-            # Prepare contact data
-            contacts_data = []
-            for user in result.users:
-                contact_info = {
-                    'user_id': user.id,
-                    'username': user.username or '',
-                    'first_name': user.first_name or '',
-                    'last_name': user.last_name or '',
-                    'phone': user.phone or '',
-                    'is_bot': user.bot if hasattr(user, 'bot') else False,
-                    'is_verified': user.verified if hasattr(user, 'verified') else False,
-                    'is_premium': user.premium if hasattr(user, 'premium') else False,
-                    'backup_date': timestamp,
-                }
-                contacts_data.append(contact_info)
+            # Contact rows (tuples in field order), projected lazily while writing
+            contacts_count = len(result.users)
+            contacts_rows = (
+                (
+                    user.id,
+                    user.username or '',
+                    user.first_name or '',
+                    user.last_name or '',
+                    user.phone or '',
+                    getattr(user, 'bot', False),
+                    getattr(user, 'verified', False),
+                    getattr(user, 'premium', False),
+                    timestamp,
+                    *_classify_contact(user.first_name or ''),
+                )
+                for user in result.users
+            )
 
             # Write to CSV
-            fieldnames = ['user_id', 'username', 'first_name', 'last_name', 'phone',
-                         'is_bot', 'is_verified', 'is_premium', 'backup_date']
+            fieldnames = ('user_id', 'username', 'first_name', 'last_name', 'phone',
+                          'is_bot', 'is_verified', 'is_premium', 'backup_date', 'type', 'status')
 
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(contacts_data)
+            with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(contacts_rows)
+
+            # Also create/update "latest" file for stats endpoint (hard link, no data copy)
+            _link_latest(csv_path, latest_path)
+            _parse_stats.cache_clear()
 
-            # Also create/update "latest" file for stats endpoint
-            import shutil
-            shutil.copy2(csv_path, latest_path)
+            # Store tag counts now so /api/stats never has to re-read this CSV
+            save_backup_stats(clean_phone, str(latest_path), latest_path.stat().st_mtime,
+                              _count_tags(user.first_name for user in result.users))
 
-            self.log(f"✅ Successfully backed up {len(contacts_data)} contacts")
+            self.log(f"✅ Successfully backed up {contacts_count} contacts")
             self.log(f"📁 Backup saved to: {csv_filename}")
             self.log(f"📊 Updated latest backup: {latest_filename}")
-            self.log(f"{'='*70}\n")
+            self.log(_BANNER_END)
 
-            return (str(csv_path), len(contacts_data))
+            return (str(csv_path), contacts_count)
 
         except Exception as e:
             self.log(f"❌ Error backing up contacts: {str(e)}", level="ERROR")
             return ("", 0)
 
-    def distribute_contacts(self, contacts: List[Dict], accounts: List[str]) -> List[Tuple[str, List[Dict]]]:
+    @staticmethod
+    def distribute_contact_ranges(total: int, accounts: List[str]) -> List[Tuple[str, int, int]]:
         """
-        Distribute contacts into equal chunks across accounts.
+        Split `total` contacts into equal index ranges across accounts.
         
         Args:
-            contacts: List of contact entries
+            total: Number of contacts to distribute
             accounts: List of account phone numbers
         
         Returns:
-            List of tuples: (account_phone, contact_chunk)
+            List of tuples: (account_phone, start, end) - remainder goes to the first accounts
         """
-        total_contacts = len(contacts)
         num_accounts = len(accounts)
-        
         if num_accounts == 0:
             return []
         
-        chunk_size = total_contacts // num_accounts
-        remainder = total_contacts % num_accounts
-        
-        chunks = []
+        chunk_size, remainder = divmod(total, num_accounts)
+        ranges = []
         start_idx = 0
-        
         for i, account in enumerate(accounts):
-            # Distribute remainder across first accounts
-            size = chunk_size + (1 if i < remainder else 0)
-            end_idx = start_idx + size
-            chunks.append((account, contacts[start_idx:end_idx]))
+            end_idx = start_idx + chunk_size + (1 if i < remainder else 0)
+            ranges.append((account, start_idx, end_idx))
             start_idx = end_idx
+        return ranges
+
+    def distribute_contacts(self, contacts: List[Dict], accounts: List[str]) -> List[Tuple[str, List[Dict]]]:
+        """
+        Distribute contacts into equal chunks across accounts.
+        
+        Args:
+            contacts: List of contact entries
+            accounts: List of account phone numbers
         
-        return chunks
+        Returns:
+            List of tuples: (account_phone, contact_chunk)
+        """
+        return [(account, contacts[start:end])
+                for account, start, end in self.distribute_contact_ranges(len(contacts), accounts)]
 
     def export_import_results_csv(self, results_dict: Dict[str, List[Dict]], output_path: str = None) -> str:
         """
@@ -3363,36 +4560,41 @@ class UnifiedContactManager:
             output_path: Output file path (defaults to logs/import_results_TIMESTAMP.csv)
         
         Returns:
-            Path to created CSV file
+            Path to created CSV file ("" when there is nothing to export)
         """
+        if not any(results_dict.values()):
+            return ""
+        
         if output_path is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = str(LOGS_DIR / f"import_results_{timestamp}.csv")
         
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['account_phone', 'account_name', 'username', 'status', 'timestamp'])
-                writer.writeheader()
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+                writer = csv.writer(f)
+                writer.writerow(('account_phone', 'account_name', 'username', 'status', 'timestamp'))
                 
-                for account_phone, contacts in results_dict.items():
-                    # Get account name from database if available
-                    account_name = account_phone
+                # Get account names from database if available
+                account_names = {}
+                for account_phone in results_dict:
+                    account_names[account_phone] = account_phone
                     try:
-                        from account_manager import get_account_by_phone
-                        account = get_account_by_phone(account_phone)
+                        account = _cached_account_by_phone(account_phone)
                         if account and account.get('name'):
-                            account_name = account['name']
+                            account_names[account_phone] = account['name']
                     except:
                         pass
-                    
-                    for contact in contacts:
-                        writer.writerow({
-                            'account_phone': account_phone,
-                            'account_name': account_name,
-                            'username': contact.get('username', ''),
-                            'status': contact.get('status', 'unknown'),
-                            'timestamp': contact.get('timestamp', datetime.now().isoformat())
-                        })
+                
+                writer.writerows(
+                    (
+                        account_phone,
+                        account_names[account_phone],
+                        contact.get('username', ''),
+                        contact.get('status', 'unknown'),
+                        contact.get('timestamp', datetime.now().isoformat()),
+                    )
+                    for account_phone, contacts in results_dict.items() for contact in contacts
+                )
             
             self.log(f"✅ Exported import results to: {output_path}")
             # Return relative path for frontend URL building (logs/filename.csv)
@@ -3415,133 +4617,7 @@ class UnifiedContactManager:
         Returns:
             Dict mapping account_phone to list of import results
         """
-        self.log("\n" + "="*70)
-        self.log("📥 MULTI-ACCOUNT DEV CONTACT IMPORT")
-        self.log("="*70)
-        
-        # Read CSV
-        try:
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                required_columns = ['group_title', 'dex_chain', 'owner']
-                
-                if not reader.fieldnames:
-                    self.log("❌ CSV file is empty", level="ERROR")
-                    return {}
-                
-                missing_columns = [col for col in required_columns if col not in reader.fieldnames]
-                if missing_columns:
-                    self.log(f"❌ Missing required columns: {', '.join(missing_columns)}", level="ERROR")
-                    return {}
-                
-                entries = []
-                for row in reader:
-                    if row.get('owner') and row['owner'].strip():
-                        owner = row['owner'].strip().lstrip('@')
-                        entries.append({
-                            'group_title': row['group_title'].strip(),
-                            'dex_chain': row['dex_chain'].strip(),
-                            'owner': owner,
-                        })
-        except Exception as e:
-            self.log(f"❌ Error reading CSV: {str(e)}", level="ERROR")
-            return {}
-        
-        if not entries:
-            self.log("❌ No valid entries found in CSV", level="ERROR")
-            return {}
-        
-        # Distribute contacts across accounts
-        account_chunks = self.distribute_contacts(entries, account_phones)
-        
-        self.log(f"\n📊 Distribution:")
-        self.log(f"   Total contacts: {len(entries)}")
-        self.log(f"   Accounts: {len(account_phones)}")
-        for account_phone, chunk in account_chunks:
-            self.log(f"   {account_phone}: {len(chunk)} contacts")
-        
-        if dry_run:
-            self.log("\n🔍 DRY RUN MODE - No changes will be made\n")
-        
-        if not dry_run and interactive:
-            confirm = input(f"\nProceed with multi-account import? (y/n): ").strip().lower()
-            if confirm != 'y':
-                self.log("⏹️  Operation cancelled")
-                return {}
-        
-        # Import to each account
-        all_results = {}
-        
-        for account_phone, chunk in account_chunks:
-            self.log(f"\n{'='*70}")
-            self.log(f"📱 Processing account: {account_phone} ({len(chunk)} contacts)")
-            self.log(f"{'='*70}")
-            
-            # Create manager for this account
-            from account_manager import get_account_by_phone
-            account = get_account_by_phone(account_phone)
-            
-            if not account:
-                self.log(f"❌ Account {account_phone} not found in database", level="ERROR")
-                continue
-            
-            # Create temporary CSV for this chunk
-            import tempfile
-            temp_csv = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8')
-            temp_csv_path = temp_csv.name
-            temp_csv.close()
-            
-            try:
-                # Write chunk to temp CSV
-                with open(temp_csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['group_title', 'dex_chain', 'owner'])
-                    writer.writeheader()
-                    writer.writerows(chunk)
-                
-                # Create manager and import (use shared connection pool)
-                account_manager = UnifiedContactManager(
-                    api_id=account.get('api_id') or self.api_id,
-                    api_hash=account.get('api_hash') or self.api_hash,
-                    phone_number=account_phone,
-                    conn_manager=GlobalConnectionManager.get_instance()
-                )
-
-                # Initialize client
-                clean_phone = account_phone.replace('+', '').replace('-', '').replace(' ', '')
-                if not await account_manager.init_client(account_phone, force_new=False):
-                    self.log(f"❌ Failed to initialize client for {account_phone}", level="ERROR")
-                    continue
-                
-                # Import contacts
-                await account_manager.import_dev_contacts(temp_csv_path, dry_run=dry_run, interactive=False)
-                
-                # Collect results
-                account_results = []
-                for entry in chunk:
-                    account_results.append({
-                        'username': entry['owner'],
-                        'status': 'added' if not dry_run else 'would_add',
-                        'timestamp': datetime.now().isoformat()
-                    })
-                
-                all_results[account_phone] = account_results
-                
-                await account_manager.close()
-                
-            except Exception as e:
-                self.log(f"❌ Error processing account {account_phone}: {str(e)}", level="ERROR")
-            finally:
-                # Clean up temp file
-                try:
-                    Path(temp_csv_path).unlink()
-                except:
-                    pass
-        
-        # Export results CSV
-        if all_results:
-            self.export_import_results_csv(all_results)
-        
-        return all_results
+        return await self._import_contacts_multi_account(csv_path, account_phones, DEV_IMPORT_SPEC, dry_run, interactive)
 
     async def import_kol_contacts_multi_account(self, csv_path: str, account_phones: List[str],
                                                  dry_run: bool = False, interactive: bool = True) -> Dict[str, List[Dict]]:
@@ -3549,48 +4625,76 @@ class UnifiedContactManager:
         Import KOL contacts across multiple accounts with equal distribution.
         Similar to import_dev_contacts_multi_account but for KOL contacts.
         """
-        self.log("\n" + "="*70)
-        self.log("📥 MULTI-ACCOUNT KOL CONTACT IMPORT")
-        self.log("="*70)
+        return await self._import_contacts_multi_account(csv_path, account_phones, KOL_IMPORT_SPEC, dry_run, interactive)
+
+    async def _import_contacts_multi_account(self, csv_path: str, account_phones: List[str], spec: ImportSpec,
+                                             dry_run: bool = False, interactive: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Shared driver for multi-account DEV/KOL imports.
+        
+        Args:
+            csv_path: Path to CSV file
+            account_phones: List of account phone numbers to import to
+            spec: ImportSpec describing the CSV format and per-account import method
+            dry_run: If True, preview only
+            interactive: If True, prompt for confirmation
+        
+        Returns:
+            Dict mapping account_phone to list of import results
+        """
+        self.log(_BANNER_LINE)
+        self.log(f"📥 MULTI-ACCOUNT {spec.label} CONTACT IMPORT")
+        self.log(_BANNER)
         
-        # Read CSV
+        # Pass 1: validate columns and count valid rows (nothing kept in memory)
         try:
             with open(csv_path, 'r', encoding='utf-8-sig') as f:
                 reader = csv.DictReader(f)
-                required_columns = ['Twitter Username', 'TG Usernames']
                 
                 if not reader.fieldnames:
                     self.log("❌ CSV file is empty", level="ERROR")
                     return {}
                 
-                missing_columns = [col for col in required_columns if col not in reader.fieldnames]
+                missing_columns = [col for col in spec.required_columns if col not in reader.fieldnames]
                 if missing_columns:
                     self.log(f"❌ Missing required columns: {', '.join(missing_columns)}", level="ERROR")
                     return {}
                 
-                entries = []
-                for row in reader:
-                    if row.get('TG Usernames') and row['TG Usernames'].strip():
-                        entries.append({
-                            'twitter': row['Twitter Username'].strip().lstrip('@'),
-                            'telegram': row['TG Usernames'].strip().lstrip('@')
-                        })
+                total_entries = sum(1 for row in reader if spec.parse_row(row))
         except Exception as e:
             self.log(f"❌ Error reading CSV: {str(e)}", level="ERROR")
             return {}
         
-        if not entries:
+        if not total_entries:
             self.log("❌ No valid entries found in CSV", level="ERROR")
             return {}
         
-        # Distribute contacts across accounts
-        account_chunks = self.distribute_contacts(entries, account_phones)
+        # Pass 2: stream parsed rows straight into per-account chunk CSVs
+        # (ranges from distribute_contact_ranges, one entry alive at a time)
+        account_chunks = []  # [(account_phone, chunk_csv, usernames)]
+        try:
+            with open(csv_path, 'r', encoding='utf-8-sig') as f:
+                entries = filter(None, map(spec.parse_row, csv.DictReader(f)))
+                for account_phone, start, end in self.distribute_contact_ranges(total_entries, account_phones):
+                    chunk_csv = io.StringIO()
+                    writer = csv.writer(chunk_csv)
+                    writer.writerow(spec.temp_fields)
+                    usernames = []
+                    # Ranges are contiguous, so each chunk is the next (end - start) entries
+                    for entry in itertools.islice(entries, end - start):
+                        writer.writerow(spec.row_to_tuple(entry))
+                        usernames.append(entry[spec.result_username_key])
+                    chunk_csv.seek(0)
+                    account_chunks.append((account_phone, chunk_csv, usernames))
+        except Exception as e:
+            self.log(f"❌ Error reading CSV: {str(e)}", level="ERROR")
+            return {}
         
         self.log(f"\n📊 Distribution:")
-        self.log(f"   Total contacts: {len(entries)}")
+        self.log(f"   Total contacts: {total_entries}")
         self.log(f"   Accounts: {len(account_phones)}")
-        for account_phone, chunk in account_chunks:
-            self.log(f"   {account_phone}: {len(chunk)} contacts")
+        for account_phone, _, usernames in account_chunks:
+            self.log(f"   {account_phone}: {len(usernames)} contacts")
         
         if dry_run:
             self.log("\n🔍 DRY RUN MODE - No changes will be made\n")
@@ -3601,76 +4705,81 @@ class UnifiedContactManager:
                 self.log("⏹️  Operation cancelled")
                 return {}
         
-        # Import to each account
-        all_results = {}
+        # Import to each account concurrently (each account has its own session;
+        # per-account batch/contact delays are unchanged)
+        sem = asyncio.Semaphore(self.MULTI_ACCOUNT_CONCURRENCY)
         
-        for account_phone, chunk in account_chunks:
-            self.log(f"\n{'='*70}")
-            self.log(f"📱 Processing account: {account_phone} ({len(chunk)} contacts)")
-            self.log(f"{'='*70}")
-            
-            # Create manager for this account
-            from account_manager import get_account_by_phone
-            account = get_account_by_phone(account_phone)
-            
-            if not account:
-                self.log(f"❌ Account {account_phone} not found in database", level="ERROR")
-                continue
-            
-            # Create temporary CSV for this chunk
-            import tempfile
-            temp_csv = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8')
-            temp_csv_path = temp_csv.name
-            temp_csv.close()
-            
-            try:
-                # Write chunk to temp CSV
-                with open(temp_csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['Twitter Username', 'TG Usernames'])
-                    writer.writeheader()
-                    for entry in chunk:
-                        writer.writerow({
-                            'Twitter Username': entry['twitter'],
-                            'TG Usernames': entry['telegram']
-                        })
+        async def _process_account(account_phone: str, chunk_csv: io.StringIO,
+                                   usernames: List[str]) -> Optional[Tuple[str, List[Dict]]]:
+            async with sem:
+                self.log(_BANNER_LINE)
+                self.log(f"📱 Processing account: {account_phone} ({len(usernames)} contacts)")
+                self.log(_BANNER)
                 
-                # Create manager and import (use shared connection pool)
-                account_manager = UnifiedContactManager(
-                    api_id=account.get('api_id') or self.api_id,
-                    api_hash=account.get('api_hash') or self.api_hash,
-                    phone_number=account_phone,
-                    conn_manager=GlobalConnectionManager.get_instance()
-                )
-
-                # Initialize client
-                if not await account_manager.init_client(account_phone, force_new=False):
-                    self.log(f"❌ Failed to initialize client for {account_phone}", level="ERROR")
-                    continue
+                # Create manager for this account
+                account = _cached_account_by_phone(account_phone)
                 
-                # Import contacts
-                await account_manager.import_kol_contacts(temp_csv_path, dry_run=dry_run, interactive=False)
-                
-                # Collect results
-                account_results = []
-                for entry in chunk:
-                    account_results.append({
-                        'username': entry['telegram'],
-                        'status': 'added' if not dry_run else 'would_add',
-                        'timestamp': datetime.now().isoformat()
-                    })
-                
-                all_results[account_phone] = account_results
-                
-                await account_manager.close()
+                if not account:
+                    self.log(f"❌ Account {account_phone} not found in database", level="ERROR")
+                    return None
                 
-            except Exception as e:
-                self.log(f"❌ Error processing account {account_phone}: {str(e)}", level="ERROR")
-            finally:
-                # Clean up temp file
+                account_manager = None
+                checked_out = False
                 try:
-                    Path(temp_csv_path).unlink()
-                except:
-                    pass
+                    # Create manager and import. This runs on the shared event loop, so the
+                    # client comes from client_pool, not the inbox's GlobalConnectionManager
+                    account_manager = UnifiedContactManager(
+                        api_id=account.get('api_id') or self.api_id,
+                        api_hash=account.get('api_hash') or self.api_hash,
+                        phone_number=account_phone,
+                        conn_manager=None
+                    )
+
+                    global_conn_manager = GlobalConnectionManager.get_instance()
+                    if global_conn_manager.is_connected(account_manager.normalized_phone):
+                        await global_conn_manager.disconnect_account(account_manager.normalized_phone)
+
+                    # Initialize client
+                    connected = await client_pool.acheckout(account_manager)
+                    checked_out = True
+                    if not connected:
+                        self.log(f"❌ Failed to initialize client for {account_phone}", level="ERROR")
+                        return None
+                    
+                    # Import contacts
+                    import_fn = getattr(account_manager, spec.import_fn_name)
+                    await import_fn(chunk_csv, dry_run=dry_run, interactive=False)
+                    
+                    # Collect results
+                    status = 'added' if not dry_run else 'would_add'
+                    account_results = [{
+                        'username': username,
+                        'status': status,
+                        'timestamp': datetime.now().isoformat()
+                    } for username in usernames]
+                    
+                    client_pool.checkin(account_manager)
+                    checked_out = False
+                    return account_phone, account_results
+                    
+                except Exception as e:
+                    self.log(f"❌ Error processing account {account_phone}: {str(e)}", level="ERROR")
+                    return None
+                finally:
+                    # Failed connect or import: drop the client (unless another operation uses it)
+                    if checked_out:
+                        client_pool.discard(account_manager)
+        
+        results_list = await asyncio.gather(
+            *(_process_account(*chunk) for chunk in account_chunks),
+            return_exceptions=True
+        )
+        all_results = {}
+        for result in results_list:
+            if isinstance(result, BaseException):
+                self.log(f"❌ Error processing account: {str(result)}", level="ERROR")
+            elif result:
+                all_results[result[0]] = result[1]
         
         # Export results CSV
         if all_results:
@@ -3680,22 +4789,18 @@ class UnifiedContactManager:
 
     async def organize_folders(self, interactive: bool = True):
         """Organize contacts to folders using organize_combined.py"""
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("📁 FOLDER ORGANIZATION")
-        self.log("="*70)
+        self.log(_BANNER)
 
         try:
-            # Import organize_combined
-            import importlib.util
-            spec = importlib.util.spec_from_file_location("organize_combined",
-                                                          Path(__file__).parent / "organize_combined.py")
-            organize_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(organize_module)
+            # Import organize_combined (loaded once, then reused)
+            organize_module = _load_organize_module()
 
             # Call organize_combined with current authenticated client and interactive flag
             self.log("\nOrganizing contacts into 4 folders...\n")
             await organize_module.organize_combined(client=self.client, interactive=interactive)
-            self.log(f"{'='*70}\n")
+            self.log(_BANNER_END)
 
         except Exception as e:
             self.log(f"❌ Error organizing folders: {str(e)}", level="ERROR")
@@ -3703,36 +4808,46 @@ class UnifiedContactManager:
 
     async def show_statistics(self):
         """Show contact statistics"""
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("📊 CONTACT STATISTICS")
-        self.log("="*70)
+        self.log(_BANNER)
 
         try:
             result = await self._contact_cache.get_contacts(self.client, phone=self.phone_number)
-            all_contacts = [u for u in result.users if u.first_name]
-
-            blue_devs = [u for u in all_contacts if '🔵💻' in u.first_name]
-            yellow_devs = [u for u in all_contacts if '🟡💻' in u.first_name]
-            blue_kols = [u for u in all_contacts if '🔵📢' in u.first_name]
-            yellow_kols = [u for u in all_contacts if '🟡📢' in u.first_name]
-
-            self.log(f"\n📱 Total contacts: {len(all_contacts)}")
-            self.log(f"\n💻 Developers: {len(blue_devs) + len(yellow_devs)}")
-            self.log(f"   🔵 Blue (no reply): {len(blue_devs)}")
-            self.log(f"   🟡 Yellow (replied): {len(yellow_devs)}")
-            self.log(f"\n📢 KOLs: {len(blue_kols) + len(yellow_kols)}")
-            self.log(f"   🔵 Blue (no reply): {len(blue_kols)}")
-            self.log(f"   🟡 Yellow (replied): {len(yellow_kols)}")
-            self.log(f"\n{'='*70}\n")
+
+            # Single pass - a contact carries at most one tag
+            total = blue_devs = yellow_devs = blue_kols = yellow_kols = 0
+            for u in result.users:
+                name = u.first_name
+                if not name:
+                    continue
+                total += 1
+                if '🔵💻' in name:
+                    blue_devs += 1
+                elif '🟡💻' in name:
+                    yellow_devs += 1
+                elif '🔵📢' in name:
+                    blue_kols += 1
+                elif '🟡📢' in name:
+                    yellow_kols += 1
+
+            self.log(f"\n📱 Total contacts: {total}")
+            self.log(f"\n💻 Developers: {blue_devs + yellow_devs}")
+            self.log(f"   🔵 Blue (no reply): {blue_devs}")
+            self.log(f"   🟡 Yellow (replied): {yellow_devs}")
+            self.log(f"\n📢 KOLs: {blue_kols + yellow_kols}")
+            self.log(f"   🔵 Blue (no reply): {blue_kols}")
+            self.log(f"   🟡 Yellow (replied): {yellow_kols}")
+            self.log(_BANNER_LINE + "\n")
 
         except Exception as e:
             self.log(f"❌ Error getting statistics: {str(e)}", level="ERROR")
 
     def show_dashboard(self):
         """Show final dashboard summary"""
-        self.log("\n" + "="*70)
+        self.log(_BANNER_LINE)
         self.log("📊 UNIFIED MANAGER - DASHBOARD SUMMARY")
-        self.log("="*70)
+        self.log(_BANNER)
 
         self.log(f"\n💻 DEV CONTACTS:")
         self.log(f"   ✅ Added: {self.stats['dev_added']}")
@@ -3756,7 +4871,7 @@ class UnifiedContactManager:
         total_added = self.stats['dev_added'] + self.stats['kol_added']
         self.log(f"\n🎉 TOTAL ADDED: {total_added}")
         self.log(f"\n📁 Logs saved to: {LOGS_DIR}")
-        self.log(f"{'='*70}\n")
+        self.log(_BANNER_END)
 
     async def close(self):
         """Close Telegram connection"""
@@ -3835,31 +4950,40 @@ def get_manager_for_account(phone: str, use_shared_connection: bool = True) -> O
     """
     try:
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
-
-        # Get account from database
-        account = get_account_by_phone(clean_phone)
+        clean_phone = _clean_phone(phone)
 
-        if not account:
-            logger.error(f"❌ Account {clean_phone} not found in database")
-            return None
-
-        # Get API credentials (prefer account-specific, fall back to global)
-        account_api_id = account.get('api_id')
-        account_api_hash = account.get('api_hash')
-        account_proxy = account.get('proxy')  # Get proxy if configured
+        with _MANAGER_LOCK:
+            cached = _MANAGER_CACHE.get(clean_phone)
 
-        if account_api_id and account_api_hash:
-            api_id = account_api_id
-            api_hash = account_api_hash
-            logger.info(f"📱 Using account-specific credentials for {clean_phone}")
+        if cached:
+            api_id, api_hash, account_proxy = cached
         else:
-            # Fall back to global credentials
-            api_id, api_hash = get_api_credentials()
-            if not api_id or not api_hash:
-                logger.error(f"❌ No API credentials available for {clean_phone}")
+            # Get account from database
+            account = _cached_account_by_phone(clean_phone)
+
+            if not account:
+                logger.error(f"❌ Account {clean_phone} not found in database")
                 return None
-            logger.info(f"📱 Using global credentials for {clean_phone}")
+
+            # Get API credentials (prefer account-specific, fall back to global)
+            account_api_id = account.get('api_id')
+            account_api_hash = account.get('api_hash')
+            account_proxy = account.get('proxy')  # Get proxy if configured
+
+            if account_api_id and account_api_hash:
+                api_id = account_api_id
+                api_hash = account_api_hash
+                logger.info(f"📱 Using account-specific credentials for {clean_phone}")
+            else:
+                # Fall back to global credentials
+                api_id, api_hash = get_api_credentials()
+                if not api_id or not api_hash:
+                    logger.error(f"❌ No API credentials available for {clean_phone}")
+                    return None
+                logger.info(f"📱 Using global credentials for {clean_phone}")
+
+            with _MANAGER_LOCK:
+                _MANAGER_CACHE[clean_phone] = (api_id, api_hash, account_proxy)
 
         # Format phone number with + prefix
         phone_number = f"+{clean_phone}"
@@ -3899,7 +5023,7 @@ def health_check():
     
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _now_iso(),
         'version': '1.0.0',
         'manager_status': manager_status,
         'default_account': default_account.get('phone') if default_account else None,
@@ -3940,7 +5064,7 @@ def get_config():
         })
     except Exception as e:
         logger.error(f"❌ Error getting config: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/config/rate-limit', methods=['POST'])
@@ -3981,13 +5105,72 @@ def update_rate_limit():
         })
     except Exception as e:
         logger.error(f"❌ Error updating rate-limit: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
 # STATISTICS & DASHBOARD ENDPOINTS
 # ============================================================================
 
+def _count_tags(first_names) -> Tuple[int, int, int, int, int]:
+    """
+    Count tagged contacts from an iterable of first names.
+
+    Returns:
+        (total_contacts, dev_blue, dev_yellow, kol_blue, kol_yellow)
+    """
+    total = dev_blue = dev_yellow = kol_blue = kol_yellow = 0
+    for first_name in first_names:
+        if first_name:
+            total += 1
+
+            # Check for dev contacts (type emoji first - most names have no tag)
+            if '💻' in first_name:
+                if '🔵💻' in first_name:
+                    dev_blue += 1
+                elif '🟡💻' in first_name:
+                    dev_yellow += 1
+
+            # Check for KOL contacts
+            if '📢' in first_name:
+                if '🔵📢' in first_name:
+                    kol_blue += 1
+                elif '🟡📢' in first_name:
+                    kol_yellow += 1
+
+    return (total, dev_blue, dev_yellow, kol_blue, kol_yellow)
+
+
+@lru_cache(maxsize=256)
+def _parse_stats(phone: str, path: str, mtime: float) -> Tuple[int, int, int, int, int]:
+    """
+    Tag counts for an account's backup CSV.
+
+    Keyed on (phone, path, mtime) so a rewritten backup is re-counted automatically.
+    Uses the backup_stats table when it matches this mtime; otherwise parses the
+    CSV once and stores the result there.
+
+    Returns:
+        (total_contacts, dev_blue, dev_yellow, kol_blue, kol_yellow)
+    """
+    counts = get_backup_stats(phone, mtime)
+    if counts:
+        return counts
+
+    with open(path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or 'first_name' not in header:
+            return (0, 0, 0, 0, 0)
+        name_idx = header.index('first_name')
+
+        # Plain rows + column index: no per-row dict, only first_name is looked at
+        counts = _count_tags(row[name_idx] if len(row) > name_idx else '' for row in reader)
+
+    save_backup_stats(phone, path, mtime, counts)
+    return counts
+
+
 def get_single_account_stats(phone):
     """Helper function to get stats for a single account.
 
@@ -4000,18 +5183,17 @@ def get_single_account_stats(phone):
     Returns:
         dict: Stats dictionary with has_backup flag (never None)
     """
-    import os
-    import csv
-
     try:
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
 
         # ONLY look for this specific account's latest backup file
         # NO FALLBACK to database or global backups (prevents cross-account data leakage)
         backup_dir = LOGS_DIR / "backups"
         latest_backup_path = backup_dir / f"contacts_{clean_phone}_latest.csv"
 
-        if not latest_backup_path.exists():
+        try:
+            mtime = latest_backup_path.stat().st_mtime
+        except FileNotFoundError:
             # No backup for this account - return zeros with flag
             logger.debug(f"No backup found for {clean_phone} - returning zeros")
             return {
@@ -4023,50 +5205,26 @@ def get_single_account_stats(phone):
                 'message': 'No backup yet - run backup to see contacts'
             }
 
-        backup_path = str(latest_backup_path)
         logger.debug(f"Using backup: {latest_backup_path.name}")
 
-        # Read and analyze the backup file
-        stats = {
+        # Analyze the backup file (cached until the file's mtime changes)
+        total, dev_blue, dev_yellow, kol_blue, kol_yellow = _parse_stats(clean_phone, str(latest_backup_path), mtime)
+
+        return {
             'phone': clean_phone,
             'has_backup': True,
-            'total_contacts': 0,
-            'dev_contacts': {'total': 0, 'blue': 0, 'yellow': 0},
-            'kol_contacts': {'total': 0, 'blue': 0, 'yellow': 0},
-            'backup_file': os.path.basename(backup_path),
-            'backup_date': datetime.fromtimestamp(os.path.getmtime(backup_path)).isoformat(),
+            'total_contacts': total,
+            'dev_contacts': {'total': dev_blue + dev_yellow, 'blue': dev_blue, 'yellow': dev_yellow},
+            'kol_contacts': {'total': kol_blue + kol_yellow, 'blue': kol_blue, 'yellow': kol_yellow},
+            'backup_file': latest_backup_path.name,
+            'backup_date': datetime.fromtimestamp(mtime).isoformat(),
         }
 
-        with open(backup_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for contact in reader:
-                first_name = contact.get('first_name', '')
-                if first_name:
-                    stats['total_contacts'] += 1
-
-                    # Check for dev contacts
-                    if '🔵💻' in first_name:
-                        stats['dev_contacts']['total'] += 1
-                        stats['dev_contacts']['blue'] += 1
-                    elif '🟡💻' in first_name:
-                        stats['dev_contacts']['total'] += 1
-                        stats['dev_contacts']['yellow'] += 1
-
-                    # Check for KOL contacts
-                    if '🔵📢' in first_name:
-                        stats['kol_contacts']['total'] += 1
-                        stats['kol_contacts']['blue'] += 1
-                    elif '🟡📢' in first_name:
-                        stats['kol_contacts']['total'] += 1
-                        stats['kol_contacts']['yellow'] += 1
-
-        return stats
-
     except Exception as e:
         logger.error(f"Error getting stats for {phone}: {str(e)}")
         # Return zeros on error instead of None
         return {
-            'phone': phone.replace('+', '').replace('-', '').replace(' ', ''),
+            'phone': _clean_phone(phone),
             'has_backup': False,
             'total_contacts': 0,
             'dev_contacts': {'total': 0, 'blue': 0, 'yellow': 0},
@@ -4075,6 +5233,36 @@ def get_single_account_stats(phone):
         }
 
 
+def _etag(*parts) -> str:
+    """Short ETag for a response derived from its inputs (file stamps, query string)."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+
+
+def _not_modified(tag: str):
+    """Return a 304 response if the client already has `tag`, else None."""
+    if tag in request.if_none_match:
+        resp = app.response_class(status=304)
+        resp.set_etag(tag)
+        return resp
+    return None
+
+
+def _with_etag(resp, tag: str):
+    """Attach ETag + revalidation headers to a JSON response."""
+    resp.set_etag(tag)
+    # no-cache = always revalidate, so a fresh backup shows up on the next poll
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
+
+
+def _backup_stamp(phone: str) -> Optional[int]:
+    """mtime_ns of an account's latest backup file (None if it has no backup)."""
+    try:
+        return (LOGS_DIR / "backups" / f"contacts_{_clean_phone(phone)}_latest.csv").stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 @app.route('/api/stats', methods=['GET'])
 def get_statistics():
     """Get contact statistics with accurate emoji-based counts
@@ -4099,6 +5287,11 @@ def get_statistics():
             if not phone_list:
                 return jsonify({'error': 'No valid phone numbers provided'}), 400
 
+            tag = _etag([_backup_stamp(p) for p in phone_list], request.query_string)
+            cached = _not_modified(tag)
+            if cached:
+                return cached
+
             # Aggregate stats from multiple accounts
             aggregated_stats = {
                 'total_contacts': 0,
@@ -4106,13 +5299,16 @@ def get_statistics():
                 'kol_contacts': {'total': 0, 'blue': 0, 'yellow': 0},
                 'accounts': [],
                 'account_count': len(phone_list),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
-            for phone_num in phone_list:
-                # Get stats for this individual account (always returns dict, never None)
-                account_stats = get_single_account_stats(phone_num)
+            # Get stats for each account in parallel (always returns dict, never None)
+            if len(phone_list) > 1:
+                all_account_stats = _STATS_POOL.map(get_single_account_stats, phone_list)
+            else:
+                all_account_stats = map(get_single_account_stats, phone_list)
 
+            for phone_num, account_stats in zip(phone_list, all_account_stats):
                 # Always add to aggregated totals (zeros if no backup)
                 aggregated_stats['total_contacts'] += account_stats.get('total_contacts', 0)
                 aggregated_stats['dev_contacts']['total'] += account_stats['dev_contacts'].get('total', 0)
@@ -4130,16 +5326,21 @@ def get_statistics():
                 })
 
             logger.info(f"📊 Multi-account stats: {len(phone_list)} accounts, {aggregated_stats['total_contacts']} total contacts")
-            return jsonify(aggregated_stats)
+            return _with_etag(jsonify(aggregated_stats), tag)
 
         # Single account stats (backward compatible)
         if phone:
+            tag = _etag(_backup_stamp(phone), request.query_string)
+            cached = _not_modified(tag)
+            if cached:
+                return cached
+
             # get_single_account_stats always returns a dict (never None)
             # It includes has_backup flag to indicate if backup exists
             stats = get_single_account_stats(phone)
-            stats['timestamp'] = datetime.now().isoformat()
+            stats['timestamp'] = _now_iso()
             logger.info(f"📊 Single account stats for {phone}: {stats['total_contacts']} total contacts (has_backup={stats.get('has_backup', False)})")
-            return jsonify(stats)
+            return _with_etag(jsonify(stats), tag)
         else:
             # Phone parameter is required - no global fallback
             # This prevents accidentally showing wrong account's stats
@@ -4153,7 +5354,110 @@ def get_statistics():
 
     except Exception as e:
         logger.error(f"❌ Error getting statistics: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
+
+
+@lru_cache(maxsize=128)
+def _resolve_latest_backup(clean_phone: Optional[str], logs_mtime_ns: int) -> Optional[str]:
+    """
+    Resolve the latest backup path for an account (memoized, see _latest_backup_cached).
+
+    Prefers the backups table; falls back to the newest legacy contacts_backup_*.csv in LOGS_DIR.
+    """
+    latest_backup = None
+
+    if clean_phone:
+        # Look for account-specific backup (phone is stored with or without '+')
+        cursor = _get_pooled_conn().cursor()
+        cursor.execute(
+            'SELECT filepath FROM backups WHERE phone IN (?, ?) ORDER BY created_at DESC LIMIT 1',
+            (clean_phone, f'+{clean_phone}')
+        )
+        row = cursor.fetchone()
+        if row:
+            latest_backup = row['filepath']
+
+    if not latest_backup:
+        # Fall back to most recent backup file
+        # One directory read; DirEntry caches its stat() result
+        with os.scandir(LOGS_DIR) as it:
+            backup_files = [e for e in it if e.name.startswith('contacts_backup_') and e.name.endswith('.csv')]
+        if backup_files:
+            latest_backup = max(backup_files, key=lambda e: e.stat().st_ctime).path
+
+    return latest_backup
+
+
+def _latest_backup_cached(phone: Optional[str]) -> Optional[str]:
+    """
+    Latest backup path for `phone` (or the newest legacy backup when phone is None).
+
+    Cached on the logs directory mtime, so a new legacy backup file invalidates it;
+    new rows in the backups table are picked up via _resolve_latest_backup.cache_clear()
+    after log_backup().
+    """
+    clean_phone = normalize_phone(phone) if phone else None
+    return _resolve_latest_backup(clean_phone, LOGS_DIR.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_contacts(path: str, mtime: float) -> Tuple[Tuple, ...]:
+    """
+    Parse a backup CSV into contact records for /api/contacts.
+
+    Keyed on (path, mtime) so a rewritten backup is re-parsed automatically.
+
+    Returns:
+        Tuple of (type, status, name, full_name, username, details, search_blob) records
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER) as f:
+        # Plain rows, columns resolved once from the header
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        width = len(header)
+        columns = {name: i for i, name in enumerate(header)}
+        first_idx = columns.get('first_name')
+        last_idx = columns.get('last_name')
+        username_idx = columns.get('username')
+        phone_idx = columns.get('phone')
+        # Newer backups store type/status columns; older ones are classified from the name
+        type_idx = columns.get('type')
+        status_idx = columns.get('status')
+        has_flags = type_idx is not None and status_idx is not None
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            first_name = row[first_idx] if first_idx is not None else ''
+            last_name = row[last_idx] if last_idx is not None else ''
+            username = row[username_idx] if username_idx is not None else ''
+
+            # Determine type and status ('' -> None in the API response)
+            if has_flags:
+                c_type, c_status = row[type_idx], row[status_idx]
+            else:
+                c_type, c_status = _classify_contact(first_name)
+            c_type = c_type or None
+            c_status = c_status or None
+
+            # Clean display name (remove emoji prefixes for display)
+            clean_name = _EMOJI_STRIP_RE.sub('', first_name).strip()
+
+            records.append((
+                c_type,
+                c_status,
+                clean_name or username or 'Unknown',
+                f"{first_name} {last_name}".strip(),
+                username,
+                (row[phone_idx] if phone_idx is not None else '') or username or '',
+                # Lowercased name + username for search; NUL keeps matches from spanning both
+                f"{first_name}\x00{username}".lower(),
+            ))
+
+    return tuple(records)
 
 
 @app.route('/api/contacts', methods=['GET'])
@@ -4177,124 +5481,86 @@ def get_contacts():
         offset = request.args.get('offset', 0, type=int)
 
         # Find the backup file
-        log_dir = Path(__file__).parent.parent / "logs"
-        latest_backup = None
-
-        if phone:
-            # Look for account-specific backup
-            clean_phone = normalize_phone(phone)
-            conn = get_db_connection()
-            cursor = conn.cursor()
-
-            # Try different phone formats
-            for phone_format in [clean_phone, f'+{clean_phone}']:
-                cursor.execute(
-                    'SELECT filepath FROM backups WHERE phone = ? ORDER BY created_at DESC LIMIT 1',
-                    (phone_format,)
-                )
-                row = cursor.fetchone()
-                if row:
-                    latest_backup = row['filepath']
-                    break
-            conn.close()
+        latest_backup = _latest_backup_cached(phone)
 
-        if not latest_backup:
-            # Fall back to most recent backup file
-            backup_files = list(log_dir.glob("contacts_backup_*.csv"))
-            if backup_files:
-                latest_backup = str(max(backup_files, key=os.path.getctime))
+        try:
+            mtime = os.path.getmtime(latest_backup) if latest_backup else None
+        except OSError:
+            mtime = None
 
-        if not latest_backup or not os.path.exists(latest_backup):
+        if mtime is None:
             return jsonify({
                 'contacts': [],
                 'total': 0,
                 'message': 'No backup file found. Please create a backup first.'
             })
 
-        # Read contacts from backup
-        contacts = []
-        with open(latest_backup, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                first_name = row.get('first_name', '')
-                last_name = row.get('last_name', '')
-                username = row.get('username', '')
-
-                # Determine type and status from emoji
-                c_type = None
-                c_status = None
-                display_name = first_name
-
-                if '💻' in first_name:
-                    c_type = 'dev'
-                    if '🔵' in first_name:
-                        c_status = 'blue'
-                    elif '🟡' in first_name:
-                        c_status = 'yellow'
-                elif '📢' in first_name:
-                    c_type = 'kol'
-                    if '🔵' in first_name:
-                        c_status = 'blue'
-                    elif '🟡' in first_name:
-                        c_status = 'yellow'
-
-                # Apply filters
-                if contact_type != 'all' and c_type != contact_type:
-                    continue
-                if status != 'all' and c_status != status:
-                    continue
-                if search and search not in first_name.lower() and search not in (username or '').lower():
-                    continue
-
-                # Clean display name (remove emoji prefixes for display)
-                clean_name = first_name
-                for emoji in ['🔵💻', '🟡💻', '🔵📢', '🟡📢', '🔵', '🟡', '💻', '📢']:
-                    clean_name = clean_name.replace(emoji, '').strip()
-
-                contacts.append({
-                    'id': len(contacts) + 1,
-                    'name': clean_name or username or 'Unknown',
-                    'full_name': f"{first_name} {last_name}".strip(),
-                    'username': username,
-                    'type': c_type,
-                    'status': c_status,
-                    'details': row.get('phone', '') or username or ''
-                })
-
-        total = len(contacts)
-        # Apply pagination
-        paginated = contacts[offset:offset + limit]
+        tag = _etag(latest_backup, mtime, request.query_string)
+        cached = _not_modified(tag)
+        if cached:
+            return cached
+
+        # Parsed contacts are cached until the backup file changes
+        records = _load_contacts(latest_backup, mtime)
+
+        # Apply filters
+        if contact_type != 'all' or status != 'all' or search:
+            matches = [
+                r for r in records
+                if (contact_type == 'all' or r[0] == contact_type)
+                and (status == 'all' or r[1] == status)
+                and (not search or search in r[6])
+            ]
+        else:
+            matches = records
+
+        total = len(matches)
+        # Apply pagination (ids are positions in the filtered list, as before)
+        paginated = [
+            {
+                'id': offset + i + 1,
+                'name': name,
+                'full_name': full_name,
+                'username': username,
+                'type': c_type,
+                'status': c_status,
+                'details': details,
+            }
+            for i, (c_type, c_status, name, full_name, username, details, _) in enumerate(matches[offset:offset + limit])
+        ]
 
         logger.info(f"📋 Retrieved {len(paginated)}/{total} contacts")
-        return jsonify({
+        return _with_etag(jsonify({
             'contacts': paginated,
             'total': total,
             'limit': limit,
             'offset': offset,
             'backup_file': os.path.basename(latest_backup)
-        })
+        }), tag)
 
     except Exception as e:
         logger.error(f"❌ Error getting contacts: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
 # CONTACT IMPORT ENDPOINTS
 # ============================================================================
 
-@app.route('/api/import/devs', methods=['POST'])
-def import_devs():
-    """Import dev contacts from CSV with real-time WebSocket progress updates.
+def _start_import(spec: ImportSpec):
+    """Start a single-account DEV/KOL import from CSV with real-time WebSocket progress updates.
 
     Supports specifying which account to use via 'phone' parameter.
     If 'phone' is not provided, uses the default account.
+    Optional 'auto_backup' (default true) and 'auto_backup_threshold' (default
+    AUTO_BACKUP_MIN_ADDED) control the full contact backup taken after the import.
 
     Returns immediately with operation_id. Subscribe to WebSocket for progress updates.
 
     WebSocket Events:
-    - 'operation_progress': Real-time progress for each contact
-    - 'operation_log': Log messages
+    - 'operation_batch': Batched 'operation_progress' / 'operation_log' /
+      'operation_log_batch' events (see WSBatcher)
+    - 'batch_delay_start': Countdown for the delay between contact batches
     - 'operation_complete': Final results when done
     """
     try:
@@ -4302,13 +5568,20 @@ def import_devs():
         csv_path = data.get('csv_path')
         dry_run = data.get('dry_run', False)
         phone = data.get('phone')  # Optional: specific account to use
+        auto_backup = data.get('auto_backup', True)
 
         if not csv_path:
             return jsonify({'error': 'csv_path required'}), 400
+        if not os.path.isfile(csv_path) or not os.access(csv_path, os.R_OK):
+            return jsonify({'error': f'CSV file not found or not readable: {csv_path}'}), 400
+        try:
+            auto_backup_threshold = int(data.get('auto_backup_threshold', AUTO_BACKUP_MIN_ADDED))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'auto_backup_threshold must be an integer'}), 400
 
         # Get manager for specific account or default
-        # IMPORTANT: use_shared_connection=False because Flask endpoints run in request threads
-        # with their own event loops, which are different from InboxManager's background loop.
+        # IMPORTANT: use_shared_connection=False because Flask endpoints run their coroutines on the
+        # shared event loop (async_loop.py), which is different from InboxManager's background loop.
         if phone:
             mgr = get_manager_for_account(phone, use_shared_connection=False)
             if not mgr:
@@ -4319,250 +5592,163 @@ def import_devs():
                 return jsonify({'error': 'Manager not initialized. No default account configured.'}), 500
             mgr._conn_manager = None  # Clear to avoid loop conflicts
 
-        account_phone = normalize_phone(mgr.phone_number)
-
-        # Create operation for WebSocket tracking
-        operation_id = create_operation('import_devs', [account_phone], {
-            'csv_path': csv_path,
-            'dry_run': dry_run
-        })
-
-        # Progress callback that emits via WebSocket
-        def progress_callback(processed, total, message, contact_info=None):
-            status = 'running'
-            stats = None
-            if contact_info:
-                contact_status = contact_info.get('status', '')
-                if contact_status in ['added', 'skipped', 'failed']:
-                    status = 'running'
-                # Extract stats for real-time frontend updates
-                stats = contact_info.get('stats')
-            update_account_progress(operation_id, account_phone, processed, total, status, message, stats=stats)
-            if contact_info:
-                add_account_log(operation_id, account_phone, message,
-                               level='success' if contact_info.get('status') == 'added' else 'info')
-
-        # Run import in background thread
-        def run_import():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                # Disconnect from GlobalConnectionManager to release session file lock
-                clean_phone = normalize_phone(mgr.phone_number)
-                global_conn_manager = GlobalConnectionManager.get_instance()
-                if global_conn_manager.is_connected(clean_phone):
-                    logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager...")
-                    try:
-                        loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
-                    except Exception as e:
-                        logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
-
-                # Initialize Telegram client BEFORE importing
-                connected = loop.run_until_complete(mgr.init_client(mgr.phone_number))
-                if not connected:
-                    logger.error(f"❌ Failed to connect to Telegram for {account_phone}")
-                    complete_operation(operation_id, error="Failed to connect to Telegram. Please check your session.")
-                    return
-
-                result = loop.run_until_complete(
-                    mgr.import_dev_contacts(
-                        csv_path,
-                        dry_run=dry_run,
-                        interactive=False,
-                        operation_id=operation_id,
-                        progress_callback=progress_callback
-                    )
-                )
-                # Complete the operation
-                complete_operation(operation_id, results={
-                    'added': mgr.stats.get('dev_added', 0),
-                    'skipped': mgr.stats.get('dev_skipped', 0),
-                    'failed': mgr.stats.get('dev_failed', 0),
-                    'dry_run': dry_run
-                })
-                logger.info(f"✅ Dev import completed for {account_phone}: {result}")
-
-                # Auto-backup after import (only if not dry_run and contacts were added)
-                if not dry_run and mgr.stats.get('dev_added', 0) > 0:
-                    try:
-                        logger.info(f"📦 Auto-backing up contacts after import...")
-                        backup_result = loop.run_until_complete(mgr.export_all_contacts_backup())
-                        logger.info(f"✅ Auto-backup completed: {backup_result}")
-                    except Exception as backup_error:
-                        logger.warning(f"⚠️ Auto-backup failed: {backup_error}")
-            except Exception as e:
-                logger.error(f"❌ Error in import thread: {str(e)}")
-                complete_operation(operation_id, error=str(e))
-            finally:
-                # Disconnect client to release session file lock
-                try:
-                    if mgr.client:
-                        disconnect_coro = mgr.client.disconnect()
-                        if asyncio.iscoroutine(disconnect_coro):
-                            loop.run_until_complete(disconnect_coro)
-                except Exception as disconnect_error:
-                    logger.warning(f"⚠️ Error disconnecting client: {disconnect_error}")
-                finally:
-                    loop.close()
-
-        # Start background thread
-        import_thread = threading.Thread(target=run_import, daemon=True)
-        import_thread.start()
+        account_phone = mgr.normalized_phone
 
-        # Return immediately with operation_id
-        return jsonify({
-            'success': True,
-            'operation_id': operation_id,
-            'operation': 'import_devs',
-            'phone': account_phone,
-            'dry_run': dry_run,
-            'message': 'Import started. Subscribe to WebSocket for real-time progress.'
-        })
-
-    except Exception as e:
-        logger.error(f"❌ Error starting import: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
-
-
-@app.route('/api/import/kols', methods=['POST'])
-def import_kols():
-    """Import KOL contacts from CSV with real-time WebSocket progress updates.
-
-    Supports specifying which account to use via 'phone' parameter.
-    If 'phone' is not provided, uses the default account.
-
-    Returns immediately with operation_id. Subscribe to WebSocket for progress updates.
-
-    WebSocket Events:
-    - 'operation_progress': Real-time progress for each contact
-    - 'operation_log': Log messages
-    - 'operation_complete': Final results when done
-    """
-    try:
-        data = request.get_json()
-        csv_path = data.get('csv_path')
-        dry_run = data.get('dry_run', False)
-        phone = data.get('phone')  # Optional: specific account to use
-
-        if not csv_path:
-            return jsonify({'error': 'csv_path required'}), 400
-
-        # Get manager for specific account or default
-        # IMPORTANT: use_shared_connection=False because Flask endpoints run in request threads
-        # with their own event loops, which are different from InboxManager's background loop.
-        if phone:
-            mgr = get_manager_for_account(phone, use_shared_connection=False)
-            if not mgr:
-                return jsonify({'error': f'Account {phone} not found or not configured'}), 404
-        else:
-            mgr = get_manager()
-            if not mgr:
-                return jsonify({'error': 'Manager not initialized. No default account configured.'}), 500
-            mgr._conn_manager = None  # Clear to avoid loop conflicts
+        # Reject a second import of the same CSV into the same account while one is running
+        import_key = (account_phone, os.path.realpath(csv_path))
+        with _IN_FLIGHT_LOCK:
+            running_id = _IN_FLIGHT_IMPORTS.get(import_key)
+            if running_id:
+                return jsonify({
+                    'error': 'An import of this CSV is already running for this account',
+                    'operation_id': running_id
+                }), 409
+
+            # Create operation for WebSocket tracking
+            operation_id = create_operation(spec.operation, [account_phone], {
+                'csv_path': csv_path,
+                'dry_run': dry_run
+            })
+            _IN_FLIGHT_IMPORTS[import_key] = operation_id
 
-        account_phone = normalize_phone(mgr.phone_number)
+        # Bound once - the flush below runs for every batch of contacts
+        account_state = get_account_state(operation_id, account_phone)
 
-        # Create operation for WebSocket tracking
-        operation_id = create_operation('import_kols', [account_phone], {
-            'csv_path': csv_path,
-            'dry_run': dry_run
-        })
+        # Progress events are coalesced and emitted via WebSocket in batches
+        def flush_progress(events):
+            # Progress is cumulative - only the latest event matters
+            processed, total, message, contact_info = events[-1]
+            stats = contact_info.get('stats') if contact_info else None
+            update_account_progress(operation_id, account_phone, processed, total, 'running', message,
+                                    stats=stats, account_state=account_state)
+            add_account_logs(operation_id, account_phone, [
+                (msg, _STATUS_TO_LEVEL.get(info.get('status'), 'info'))
+                for _, _, msg, info in events if info
+            ], account_state=account_state)
 
-        # Progress callback that emits via WebSocket
-        def progress_callback(processed, total, message, contact_info=None):
-            status = 'running'
-            stats = None
-            if contact_info:
-                contact_status = contact_info.get('status', '')
-                if contact_status in ['added', 'skipped', 'failed']:
-                    status = 'running'
-                # Extract stats for real-time frontend updates
-                stats = contact_info.get('stats')
-            update_account_progress(operation_id, account_phone, processed, total, status, message, stats=stats)
-            if contact_info:
-                add_account_log(operation_id, account_phone, message,
-                               level='success' if contact_info.get('status') == 'added' else 'info')
+        progress = ProgressCoalescer(flush_progress)
 
         # Run import in background thread
         def run_import():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            checked_out = import_ok = False
             try:
                 # Disconnect from GlobalConnectionManager to release session file lock
-                clean_phone = normalize_phone(mgr.phone_number)
+                clean_phone = account_phone
                 global_conn_manager = GlobalConnectionManager.get_instance()
                 if global_conn_manager.is_connected(clean_phone):
                     logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager...")
                     try:
-                        loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
+                        run_coroutine_sync(global_conn_manager.disconnect_account(clean_phone))
                     except Exception as e:
                         logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
 
-                # Initialize Telegram client BEFORE importing
-                connected = loop.run_until_complete(mgr.init_client(mgr.phone_number))
+                # Borrow a connected client BEFORE importing (reused from client_pool when one is parked)
+                connected = client_pool.checkout(mgr)
+                checked_out = True
                 if not connected:
                     logger.error(f"❌ Failed to connect to Telegram for {account_phone}")
                     complete_operation(operation_id, error="Failed to connect to Telegram. Please check your session.")
                     return
 
-                result = loop.run_until_complete(
-                    mgr.import_kol_contacts(
-                        csv_path,
-                        dry_run=dry_run,
-                        interactive=False,
-                        operation_id=operation_id,
-                        progress_callback=progress_callback
-                    )
-                )
+                # Open once with a large buffer and stream rows from the handle
+                with open(csv_path, 'r', encoding='utf-8-sig', newline='', buffering=CSV_READ_BUFFER) as csv_file:
+                    result = run_coroutine_sync(_cancellable(
+                        operation_id,
+                        getattr(mgr, spec.import_fn_name)(
+                            csv_file,
+                            dry_run=dry_run,
+                            interactive=False,
+                            operation_id=operation_id,
+                            progress_callback=progress.submit
+                        )
+                    ))
+                progress.flush()
                 # Complete the operation
                 complete_operation(operation_id, results={
-                    'added': mgr.stats.get('kol_added', 0),
-                    'skipped': mgr.stats.get('kol_skipped', 0),
-                    'failed': mgr.stats.get('kol_failed', 0),
+                    'added': mgr.stats.get(f'{spec.stats_prefix}_added', 0),
+                    'skipped': mgr.stats.get(f'{spec.stats_prefix}_skipped', 0),
+                    'failed': mgr.stats.get(f'{spec.stats_prefix}_failed', 0),
                     'dry_run': dry_run
                 })
-                logger.info(f"✅ KOL import completed for {account_phone}: {result}")
+                logger.info(f"✅ {spec.label} import completed for {account_phone}: {result}")
 
-                # Auto-backup after import (only if not dry_run and contacts were added)
-                if not dry_run and mgr.stats.get('kol_added', 0) > 0:
+                # Auto-backup after import (re-downloads the whole contact list, so only
+                # when enabled and enough contacts were added to be worth it)
+                added = mgr.stats.get(f'{spec.stats_prefix}_added', 0)
+                if not dry_run and auto_backup and added > 0 and added >= auto_backup_threshold:
                     try:
                         logger.info(f"📦 Auto-backing up contacts after import...")
-                        backup_result = loop.run_until_complete(mgr.export_all_contacts_backup())
+                        backup_result = run_coroutine_sync(mgr.export_all_contacts_backup())
                         logger.info(f"✅ Auto-backup completed: {backup_result}")
                     except Exception as backup_error:
                         logger.warning(f"⚠️ Auto-backup failed: {backup_error}")
+                import_ok = True
+            except OperationCancelled:
+                logger.info(f"🛑 {spec.label} import {operation_id} cancelled for {account_phone}")
+                progress.flush()
+                complete_operation(operation_id, results={
+                    'added': mgr.stats.get(f'{spec.stats_prefix}_added', 0),
+                    'skipped': mgr.stats.get(f'{spec.stats_prefix}_skipped', 0),
+                    'failed': mgr.stats.get(f'{spec.stats_prefix}_failed', 0),
+                    'dry_run': dry_run,
+                    'cancelled': True
+                })
             except Exception as e:
-                logger.error(f"❌ Error in KOL import thread: {str(e)}")
+                logger.error(f"❌ Error in {spec.label} import thread: {str(e)}")
+                progress.flush()
                 complete_operation(operation_id, error=str(e))
             finally:
-                # Disconnect client to release session file lock
-                try:
-                    if mgr.client:
-                        disconnect_coro = mgr.client.disconnect()
-                        if asyncio.iscoroutine(disconnect_coro):
-                            loop.run_until_complete(disconnect_coro)
-                except Exception as disconnect_error:
-                    logger.warning(f"⚠️ Error disconnecting client: {disconnect_error}")
-                finally:
-                    loop.close()
+                # Park the client for reuse, or drop it after a failure (the pool only
+                # disconnects once no other operation is using the account's client)
+                if checked_out:
+                    (client_pool.checkin if import_ok else client_pool.discard)(mgr)
 
-        # Start background thread
-        import_thread = threading.Thread(target=run_import, daemon=True)
-        import_thread.start()
+        def release_import(_):
+            with _IN_FLIGHT_LOCK:
+                _IN_FLIGHT_IMPORTS.pop(import_key, None)
+
+        # Run on the import worker pool (the in-flight slot is freed when it finishes or is cancelled)
+        future = _IMPORT_POOL.submit(run_import)
+        future.add_done_callback(release_import)
+        track_operation_future(operation_id, future)
 
         # Return immediately with operation_id
         return jsonify({
             'success': True,
             'operation_id': operation_id,
-            'operation': 'import_kols',
+            'operation': spec.operation,
             'phone': account_phone,
             'dry_run': dry_run,
             'message': 'Import started. Subscribe to WebSocket for real-time progress.'
         })
 
     except Exception as e:
-        logger.error(f"❌ Error starting KOL import: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        logger.error(f"❌ Error starting {spec.label} import: {str(e)}")
+        return _error_json(str(e)), 500
+
+
+@app.route('/api/import/devs', methods=['POST'])
+def import_devs():
+    """Import dev contacts from CSV (see _start_import)."""
+    return _start_import(DEV_IMPORT_SPEC)
+
+
+@app.route('/api/import/kols', methods=['POST'])
+def import_kols():
+    """Import KOL contacts from CSV (see _start_import)."""
+    return _start_import(KOL_IMPORT_SPEC)
+
+
+@lru_cache(maxsize=4)
+def _multi_import_manager(api_id: int, api_hash: str) -> UnifiedContactManager:
+    """
+    Shared driver manager for multi-account imports, keyed by API credentials.
+
+    The driver never connects a client of its own, so it is reused across
+    requests instead of being built (cache/rate-limiter lookups) and closed
+    every time.
+    """
+    return UnifiedContactManager(api_id, api_hash, '', conn_manager=GlobalConnectionManager.get_instance())
 
 
 @app.route('/api/import/devs/multi', methods=['POST'])
@@ -4576,6 +5762,8 @@ def import_devs_multi():
 
         if not csv_path:
             return jsonify({'error': 'csv_path required'}), 400
+        if not os.path.isfile(csv_path) or not os.access(csv_path, os.R_OK):
+            return jsonify({'error': f'CSV file not found or not readable: {csv_path}'}), 400
         if not account_phones:
             return jsonify({'error': 'account_phones array required'}), 400
 
@@ -4586,46 +5774,32 @@ def import_devs_multi():
         if not api_id or not api_hash:
             return jsonify({'error': 'API credentials not configured'}), 500
 
-        # Run async multi-account import
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Create a manager with API credentials and shared connection pool
-            # The multi-account method will get account-specific credentials from database
-            temp_mgr = UnifiedContactManager(
-                api_id, api_hash, account_phones[0] if account_phones else '',
-                conn_manager=GlobalConnectionManager.get_instance()
-            )
-            results = loop.run_until_complete(
-                temp_mgr.import_dev_contacts_multi_account(csv_path, account_phones, dry_run=dry_run, interactive=False)
-            )
-            
-            # Export results CSV
-            import_results_csv = None
-            if results:
-                import_results_csv = temp_mgr.export_import_results_csv(results)
-            
-            # Clean up
-            try:
-                loop.run_until_complete(temp_mgr.close())
-            except:
-                pass
+        # The multi-account driver only splits the CSV; per-account managers
+        # (with account-specific credentials from the database) are created inside it
+        driver = _multi_import_manager(api_id, api_hash)
+        # Run async multi-account import on the shared event loop
+        results = run_coroutine_sync(
+            driver.import_dev_contacts_multi_account(csv_path, account_phones, dry_run=dry_run, interactive=False)
+        )
+        
+        # Export results CSV
+        import_results_csv = None
+        if results:
+            import_results_csv = driver.export_import_results_csv(results)
 
-            reset_operation_state()
-            logger.info(f"✅ Multi-account dev import completed for {len(account_phones)} accounts")
-            return jsonify({
-                'success': True,
-                'operation': 'import_devs_multi',
-                'dry_run': dry_run,
-                'results': results,
-                'import_results_csv': import_results_csv
-            })
-        finally:
-            loop.close()
+        reset_operation_state()
+        logger.info(f"✅ Multi-account dev import completed for {len(account_phones)} accounts")
+        return jsonify({
+            'success': True,
+            'operation': 'import_devs_multi',
+            'dry_run': dry_run,
+            'results': results,
+            'import_results_csv': import_results_csv
+        })
     except Exception as e:
         logger.error(f"❌ Error importing devs to multiple accounts: {str(e)}")
         reset_operation_state()
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/import/kols/multi', methods=['POST'])
@@ -4639,6 +5813,8 @@ def import_kols_multi():
 
         if not csv_path:
             return jsonify({'error': 'csv_path required'}), 400
+        if not os.path.isfile(csv_path) or not os.access(csv_path, os.R_OK):
+            return jsonify({'error': f'CSV file not found or not readable: {csv_path}'}), 400
         if not account_phones:
             return jsonify({'error': 'account_phones array required'}), 400
 
@@ -4649,46 +5825,32 @@ def import_kols_multi():
         if not api_id or not api_hash:
             return jsonify({'error': 'API credentials not configured'}), 500
 
-        # Run async multi-account import
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Create a manager with API credentials and shared connection pool
-            # The multi-account method will get account-specific credentials from database
-            temp_mgr = UnifiedContactManager(
-                api_id, api_hash, account_phones[0] if account_phones else '',
-                conn_manager=GlobalConnectionManager.get_instance()
-            )
-            results = loop.run_until_complete(
-                temp_mgr.import_kol_contacts_multi_account(csv_path, account_phones, dry_run=dry_run, interactive=False)
-            )
-            
-            # Export results CSV
-            import_results_csv = None
-            if results:
-                import_results_csv = temp_mgr.export_import_results_csv(results)
-            
-            # Clean up
-            try:
-                loop.run_until_complete(temp_mgr.close())
-            except:
-                pass
+        # The multi-account driver only splits the CSV; per-account managers
+        # (with account-specific credentials from the database) are created inside it
+        driver = _multi_import_manager(api_id, api_hash)
+        # Run async multi-account import on the shared event loop
+        results = run_coroutine_sync(
+            driver.import_kol_contacts_multi_account(csv_path, account_phones, dry_run=dry_run, interactive=False)
+        )
+        
+        # Export results CSV
+        import_results_csv = None
+        if results:
+            import_results_csv = driver.export_import_results_csv(results)
 
-            reset_operation_state()
-            logger.info(f"✅ Multi-account KOL import completed for {len(account_phones)} accounts")
-            return jsonify({
-                'success': True,
-                'operation': 'import_kols_multi',
-                'dry_run': dry_run,
-                'results': results,
-                'import_results_csv': import_results_csv
-            })
-        finally:
-            loop.close()
+        reset_operation_state()
+        logger.info(f"✅ Multi-account KOL import completed for {len(account_phones)} accounts")
+        return jsonify({
+            'success': True,
+            'operation': 'import_kols_multi',
+            'dry_run': dry_run,
+            'results': results,
+            'import_results_csv': import_results_csv
+        })
     except Exception as e:
         logger.error(f"❌ Error importing KOLs to multiple accounts: {str(e)}")
         reset_operation_state()
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
@@ -4716,7 +5878,8 @@ def start_multi_account_operation():
             "dialog_limit": 100,  // For scan
             "hours": 48,          // For scan
             "csv_path": "...",    // For import operations
-            "dry_run": false      // For import operations
+            "dry_run": false,     // For import operations
+            "concurrency": 1      // Accounts run at once (default 1 = one after another)
         }
     }
 
@@ -4728,8 +5891,7 @@ def start_multi_account_operation():
     }
 
     WebSocket Events (subscribe with operation_id):
-    - operation_progress: Per-account progress updates
-    - operation_log: Per-account log messages
+    - operation_batch: Batched per-account operation_progress / operation_log events (see WSBatcher)
     - operation_complete: Final results when operation finishes
     """
     try:
@@ -4742,16 +5904,25 @@ def start_multi_account_operation():
         params = data.get('params', {})
 
         # Validate operation type
-        valid_operations = ['scan', 'backup', 'folders', 'import_devs', 'import_kols']
-        if operation not in valid_operations:
+        if operation not in OPERATION_RUNNERS:
             return jsonify({
-                'error': f"Invalid operation '{operation}'. Valid: {valid_operations}"
+                'error': f"Invalid operation '{operation}'. Valid: {list(OPERATION_RUNNERS)}"
             }), 400
 
         # Validate phones
         if not phones or not isinstance(phones, list):
             return jsonify({'error': 'phones must be a non-empty list'}), 400
 
+        if not isinstance(params, dict):
+            return jsonify({'error': 'params must be an object'}), 400
+
+        # Validate concurrency here - a bad value would otherwise only fail in the worker
+        if 'concurrency' in params:
+            try:
+                params['concurrency'] = int(params['concurrency'])
+            except (TypeError, ValueError):
+                return jsonify({'error': 'params.concurrency must be an integer'}), 400
+
         # Normalize all phone numbers
         phones = [normalize_phone(p) for p in phones]
 
@@ -4778,7 +5949,15 @@ def start_multi_account_operation():
                 logger.error(f"❌ Operation {operation_id} failed: {e}")
                 complete_operation(operation_id, error=str(e))
 
-        operation_executor.submit(run_operation)
+        try:
+            track_operation_future(operation_id, operation_executor.submit(run_operation))
+        except queue.Full:
+            logger.warning(f"⚠️  Operation queue full, rejecting {operation_id}")
+            complete_operation(operation_id, error='Server busy: too many queued operations')
+            return jsonify({
+                'error': 'Too many operations queued. Please retry shortly.',
+                'error_type': 'server_busy'
+            }), 503
 
         return jsonify({
             'success': True,
@@ -4790,7 +5969,7 @@ def start_multi_account_operation():
 
     except Exception as e:
         logger.error(f"❌ Error starting operation: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/operations/<operation_id>', methods=['GET'])
@@ -4815,10 +5994,32 @@ def cancel_operation(operation_id):
 
         op['status'] = 'cancelled'
 
+        # Drop it from the worker pool queue if it hasn't started yet
+        future = _operation_futures.get(operation_id)
+        never_started = future is not None and future.cancel()
+
+        if never_started:
+            # complete_operation will never run for it - clean up here
+            _forget_cancel_event(operation_id)
+            del active_operations[operation_id]
+        else:
+            # Flag it, and wake any coroutine awaiting through _cancellable() so it stops now
+            event = _cancel_events.get(operation_id)
+            if event is not None:
+                event.set()
+                AsyncEventLoopThread.instance().loop.call_soon_threadsafe(_wake_cancel_waiter, operation_id)
+
         # Release all account locks
         for phone in op['phones']:
             account_locks.release(phone)
 
+    if never_started:
+        try:
+            db_update_operation_status(operation_id, 'cancelled')
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to persist cancellation to DB: {e}")
+        _history_cache.clear()
+
     logger.info(f"🛑 Operation {operation_id} marked for cancellation")
     return jsonify({'success': True, 'message': 'Operation cancellation requested'})
 
@@ -4836,14 +6037,13 @@ def get_active_operations_endpoint():
 
     # Also check database for any running operations not in memory
     try:
-        db_ops = db_get_active_operations()
-        for op in db_ops:
-            if op['id'] not in memory_ops:
-                memory_ops[op['id']] = op
-                # Restore to memory for tracking
-                with operations_lock:
-                    if op['id'] not in active_operations:
-                        active_operations[op['id']] = op
+        missing = {op['id']: op for op in db_get_active_operations() if op['id'] not in memory_ops}
+        if missing:
+            memory_ops.update(missing)
+            # Restore to memory for tracking (one lock round-trip for all of them)
+            with operations_lock:
+                for op_id, op in missing.items():
+                    active_operations.setdefault(op_id, op)
     except Exception as e:
         logger.warning(f"⚠️ Failed to get active ops from DB: {e}")
 
@@ -4859,7 +6059,7 @@ def get_operations_history():
     """
     try:
         limit = min(int(request.args.get('limit', 20)), 100)
-        operations = db_get_recent_operations(limit)
+        operations = _get_recent_operations_cached(limit)
         return jsonify({'operations': operations})
     except Exception as e:
         logger.error(f"❌ Failed to get operations history: {e}")
@@ -4868,16 +6068,24 @@ def get_operations_history():
 
 def _execute_multi_account_operation(operation_id: str, operation: str, phones: List[str], params: Dict):
     """
-    Execute an operation across multiple accounts in parallel.
-    Runs in a background thread.
+    Execute an operation across multiple accounts.
+    Runs in a background thread; the account coroutines run on the shared event loop.
+
+    params['concurrency'] sets how many accounts run at once (default 1 - one
+    account completes before the next starts, which keeps Telegram rate limit
+    risk lowest). Per-account delays are unchanged either way.
     """
-    results = {}
+    concurrency = max(1, int(params.get('concurrency', 1)))
+    runner = OPERATION_RUNNERS.get(operation)
+    if runner is None:
+        raise Exception(f"Unknown operation: {operation}")
 
-    def run_for_account(phone: str):
+    async def run_for_account(phone: str):
         """Run operation for a single account"""
         try:
-            # Acquire lock
-            if not account_locks.acquire(phone, blocking=True, timeout=60):
+            # Acquire lock (blocking wait runs off the loop so other accounts keep going)
+            acquired = await asyncio.get_running_loop().run_in_executor(None, account_locks.acquire, phone, True, 60)
+            if not acquired:
                 add_account_log(operation_id, phone, "Failed to acquire lock (timeout)", "error")
                 update_account_progress(operation_id, phone, 0, 0, 'error', error="Lock timeout")
                 return None
@@ -4886,14 +6094,13 @@ def _execute_multi_account_operation(operation_id: str, operation: str, phones:
             update_account_progress(operation_id, phone, 0, 100, 'running', 'Initializing...')
 
             # Check if cancelled
-            op = get_operation(operation_id)
-            if op and op.get('status') == 'cancelled':
+            if _cancel_requested(operation_id):
                 account_locks.release(phone)
                 return None
 
             # Get manager for this account
-            # IMPORTANT: use_shared_connection=False because this runs in a worker thread
-            # with its own event loop, different from InboxManager's background loop.
+            # IMPORTANT: use_shared_connection=False because this runs on the shared
+            # event loop, different from InboxManager's background loop.
             mgr = get_manager_for_account(phone, use_shared_connection=False)
             if not mgr:
                 add_account_log(operation_id, phone, f"Account not found", "error")
@@ -4901,59 +6108,48 @@ def _execute_multi_account_operation(operation_id: str, operation: str, phones:
                 account_locks.release(phone)
                 return None
 
-            # Create event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
+            checked_out = succeeded = False
             try:
                 # Disconnect from GlobalConnectionManager to release session file lock
-                clean_phone = normalize_phone(phone)
+                clean_phone = phone  # Already normalized by start_multi_account_operation
                 global_conn_manager = GlobalConnectionManager.get_instance()
                 if global_conn_manager.is_connected(clean_phone):
                     add_account_log(operation_id, phone, "Releasing session lock...", "info")
                     try:
-                        loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
+                        await global_conn_manager.disconnect_account(clean_phone)
                     except Exception as e:
                         logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
 
-                # Initialize client
+                # Borrow a connected client (reused from client_pool when one is parked)
                 add_account_log(operation_id, phone, "Connecting to Telegram...", "info")
-                connected = loop.run_until_complete(mgr.init_client(phone))
+                connected = await client_pool.acheckout(mgr)
+                checked_out = True
                 if not connected:
                     raise Exception("Failed to connect to Telegram")
 
                 update_account_progress(operation_id, phone, 10, 100, 'running', 'Connected')
 
-                # Execute the operation
-                if operation == 'scan':
-                    result = _run_scan_operation(loop, mgr, phone, operation_id, params)
-                elif operation == 'backup':
-                    result = _run_backup_operation(loop, mgr, phone, operation_id, params)
-                elif operation == 'folders':
-                    result = _run_folders_operation(loop, mgr, phone, operation_id, params)
-                elif operation == 'import_devs':
-                    result = _run_import_operation(loop, mgr, phone, operation_id, params, 'devs')
-                elif operation == 'import_kols':
-                    result = _run_import_operation(loop, mgr, phone, operation_id, params, 'kols')
-                else:
-                    raise Exception(f"Unknown operation: {operation}")
+                # Execute the operation (stops early if the operation is cancelled)
+                step = runner(mgr, phone, operation_id, params)
+                result = await _cancellable(operation_id, step)
 
                 update_account_progress(operation_id, phone, 100, 100, 'completed', 'Done')
                 add_account_log(operation_id, phone, f"Operation completed successfully", "success")
+                succeeded = True
                 return result
 
+            except OperationCancelled:
+                add_account_log(operation_id, phone, "Operation cancelled", "warning")
+                update_account_progress(operation_id, phone, 0, 0, 'cancelled', 'Cancelled')
+                return None
             except Exception as e:
                 add_account_log(operation_id, phone, f"Error: {str(e)}", "error")
                 update_account_progress(operation_id, phone, 0, 0, 'error', error=str(e))
                 return {'error': str(e)}
             finally:
-                # Disconnect client
-                if mgr.client and mgr.client.is_connected():
-                    try:
-                        loop.run_until_complete(mgr.client.disconnect())
-                    except:
-                        pass
-                loop.close()
+                # Park the client for reuse, or drop it after a failure/cancel
+                if checked_out:
+                    (client_pool.checkin if succeeded else client_pool.discard)(mgr)
                 account_locks.release(phone)
 
         except Exception as e:
@@ -4962,22 +6158,31 @@ def _execute_multi_account_operation(operation_id: str, operation: str, phones:
             account_locks.release(phone)
             return {'error': str(e)}
 
-    # Run operations SEQUENTIALLY (one account completes before next starts)
-    # This reduces Telegram rate limit risk compared to parallel execution
-    for phone in phones:
-        add_account_log(operation_id, phone, f"Starting operation for account...", "info")
-        try:
-            result = run_for_account(phone)
-            results[phone] = result
-        except Exception as e:
-            results[phone] = {'error': str(e)}
-            add_account_log(operation_id, phone, f"Account failed: {str(e)}", "error")
+    async def run_all() -> Dict:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def guarded(phone: str):
+            async with sem:
+                add_account_log(operation_id, phone, f"Starting operation for account...", "info")
+                return await run_for_account(phone)
+
+        outcomes = await asyncio.gather(*(guarded(phone) for phone in phones), return_exceptions=True)
+        for phone, outcome in zip(phones, outcomes):
+            if isinstance(outcome, BaseException):
+                add_account_log(operation_id, phone, f"Account failed: {str(outcome)}", "error")
+        return dict(zip(phones, (
+            {'error': str(outcome)} if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        )))
+
+    # All accounts run on the shared event loop (no per-account loops)
+    results = run_coroutine_sync(run_all())
 
     # Complete operation
     complete_operation(operation_id, results)
 
 
-def _run_scan_operation(loop, mgr, phone: str, operation_id: str, params: Dict) -> Dict:
+async def _run_scan_operation(mgr, phone: str, operation_id: str, params: Dict) -> Dict:
     """Run scan for replies operation"""
     dialog_limit = params.get('dialog_limit', 100)
     hours = params.get('hours', 48)
@@ -4986,30 +6191,33 @@ def _run_scan_operation(loop, mgr, phone: str, operation_id: str, params: Dict)
     add_account_log(operation_id, phone, f"Checking seen-no-reply (last {hours}h)...", "info")
     update_account_progress(operation_id, phone, 30, 100, 'running', 'Checking seen-no-reply...')
 
-    seen_no_reply = loop.run_until_complete(
-        mgr.check_seen_no_reply(hours=hours, dialog_limit=dialog_limit, export_csv=export_csv)
-    )
+    seen_no_reply = await mgr.check_seen_no_reply(hours=hours, dialog_limit=dialog_limit, export_csv=export_csv)
 
     add_account_log(operation_id, phone, f"Scanning for replies...", "info")
     update_account_progress(operation_id, phone, 60, 100, 'running', 'Scanning for replies...')
 
-    reply_statuses = loop.run_until_complete(
-        mgr.scan_for_replies(dialog_limit=dialog_limit, hours=hours)
-    )
+    scan_result = await mgr.scan_for_replies(dialog_limit=dialog_limit)
+    id_statuses = scan_result.get('id_statuses', {})
+    reply_statuses = scan_result.get('name_statuses', {})
+
+    if id_statuses:
+        update_account_progress(operation_id, phone, 80, 100, 'running', 'Updating statuses...')
+        # interactive=False: a confirmation input() here would block the shared event loop
+        await mgr.update_statuses(id_statuses, interactive=False)
 
     return {
         'seen_no_reply': seen_no_reply or [],
-        'reply_statuses': reply_statuses or [],
-        'reply_count': len(reply_statuses) if reply_statuses else 0
+        'reply_statuses': reply_statuses,
+        'reply_count': len(reply_statuses)
     }
 
 
-def _run_backup_operation(loop, mgr, phone: str, operation_id: str, params: Dict) -> Dict:
+async def _run_backup_operation(mgr, phone: str, operation_id: str, params: Dict) -> Dict:
     """Run backup contacts operation"""
     add_account_log(operation_id, phone, "Backing up contacts...", "info")
     update_account_progress(operation_id, phone, 30, 100, 'running', 'Backing up contacts...')
 
-    result = loop.run_until_complete(mgr.backup_contacts())
+    result = await mgr.backup_contacts()
 
     return {
         'backed_up': result.get('backed_up', 0) if result else 0,
@@ -5017,17 +6225,17 @@ def _run_backup_operation(loop, mgr, phone: str, operation_id: str, params: Dict
     }
 
 
-def _run_folders_operation(loop, mgr, phone: str, operation_id: str, params: Dict) -> Dict:
+async def _run_folders_operation(mgr, phone: str, operation_id: str, params: Dict) -> Dict:
     """Run organize folders operation"""
     add_account_log(operation_id, phone, "Organizing folders...", "info")
     update_account_progress(operation_id, phone, 30, 100, 'running', 'Organizing folders...')
 
-    result = loop.run_until_complete(mgr.organize_folders())
+    result = await mgr.organize_folders(interactive=False)
 
     return {'organized': True, 'result': result}
 
 
-def _run_import_operation(loop, mgr, phone: str, operation_id: str, params: Dict, contact_type: str) -> Dict:
+async def _run_import_operation(mgr, phone: str, operation_id: str, params: Dict, contact_type: str) -> Dict:
     """Run import contacts operation"""
     csv_path = params.get('csv_path')
     dry_run = params.get('dry_run', False)
@@ -5039,14 +6247,11 @@ def _run_import_operation(loop, mgr, phone: str, operation_id: str, params: Dict
     add_account_log(operation_id, phone, f"Importing {contact_type}...", "info")
     update_account_progress(operation_id, phone, 20, 100, 'running', f'Importing {contact_type}...')
 
+    # interactive=False: a confirmation input() here would block the shared event loop
     if contact_type == 'devs':
-        result = loop.run_until_complete(
-            mgr.import_dev_contacts(csv_path=csv_path, dry_run=dry_run)
-        )
+        result = await mgr.import_dev_contacts(csv_path=csv_path, dry_run=dry_run, interactive=False)
     else:
-        result = loop.run_until_complete(
-            mgr.import_kol_contacts(csv_path=csv_path, dry_run=dry_run)
-        )
+        result = await mgr.import_kol_contacts(csv_path=csv_path, dry_run=dry_run, interactive=False)
 
     return {
         'imported': result.get('added_count', 0) if result else 0,
@@ -5055,6 +6260,16 @@ def _run_import_operation(loop, mgr, phone: str, operation_id: str, params: Dict
     }
 
 
+# Multi-account operation name -> per-account runner coroutine function
+OPERATION_RUNNERS: Dict[str, Callable] = {
+    'scan': _run_scan_operation,
+    'backup': _run_backup_operation,
+    'folders': _run_folders_operation,
+    'import_devs': partial(_run_import_operation, contact_type='devs'),
+    'import_kols': partial(_run_import_operation, contact_type='kols'),
+}
+
+
 @app.route('/api/scan-replies', methods=['POST'])
 def scan_replies():
     """Scan for replied contacts and auto-update status
@@ -5063,15 +6278,15 @@ def scan_replies():
     If 'phone' is not provided, uses the default account.
     """
     try:
-        data = request.get_json() if request.get_json() else {}
+        data = request.get_json() or {}
         dialog_limit = data.get('dialog_limit', 100)
         hours = data.get('hours', 48)  # 24, 48, or 168 (7 days)
         export_csv = data.get('export_csv', True)
         phone = data.get('phone')  # Optional: specific account to use
 
         # Get manager for specific account or default
-        # IMPORTANT: use_shared_connection=False because Flask endpoints run in request threads
-        # with their own event loops, which are different from InboxManager's background loop.
+        # IMPORTANT: use_shared_connection=False because Flask endpoints run their coroutines on the
+        # shared event loop (async_loop.py), which is different from InboxManager's background loop.
         if phone:
             mgr = get_manager_for_account(phone, use_shared_connection=False)
             if not mgr:
@@ -5105,143 +6320,104 @@ def scan_replies():
 
         update_operation_state('scan_replies', 0, 0, 'starting', f'Scanning dialogs for {mgr.phone_number}...')
 
-        # Create new event loop for this request
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        client_to_cleanup = None
-
         try:
-            # STEP 1: Disconnect from GlobalConnectionManager to release session file lock
-            clean_phone = normalize_phone(mgr.phone_number)
-            global_conn_manager = GlobalConnectionManager.get_instance()
-            if global_conn_manager.is_connected(clean_phone):
-                logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager...")
-                try:
-                    loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
-
-            # Also disconnect mgr.client if it exists (legacy path)
-            if mgr.client and mgr.client.is_connected():
-                logger.info("Temporarily disconnecting to release session lock...")
-                try:
-                    disconnect_coro = mgr.client.disconnect()
-                    if disconnect_coro:
-                        loop.run_until_complete(disconnect_coro)
-                    mgr.client = None
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting: {e}")
-
-            # STEP 2: Connect fresh client for scan operation
-            logger.info("Connecting fresh client for scan operation...")
-            connected = loop.run_until_complete(mgr.init_client(mgr.phone_number))
-            if not connected:
-                reset_operation_state()
-                return jsonify({'error': 'Failed to connect to Telegram'}), 500
-
-            client_to_cleanup = mgr.client
+            # STEP 1-2: Release the inbox connection and borrow a connected client
+            # (parked again for the next request when the block exits)
+            with prepared_client(mgr) as connected:
+                if not connected:
+                    reset_operation_state()
+                    return jsonify({'error': 'Failed to connect to Telegram'}), 500
+
+                # STEP 3: Run scan operations
+                update_operation_state('scan_replies', 10, 100, 'running', 'Checking seen-no-reply...')
+                # CSV export is done here (not inside check_seen_no_reply) so the files are written
+                # once, on the IO pool, while the reply scan below talks to Telegram
+                seen_no_reply = run_coroutine_sync(
+                    mgr.check_seen_no_reply(hours=hours, dialog_limit=dialog_limit, export_csv=False)
+                )
 
-            # STEP 3: Run scan operations
-            update_operation_state('scan_replies', 10, 100, 'running', 'Checking seen-no-reply...')
-            seen_no_reply = loop.run_until_complete(
-                mgr.check_seen_no_reply(hours=hours, dialog_limit=dialog_limit, export_csv=export_csv)
-            )
+                csv_future = None
+                if export_csv and seen_no_reply:
+                    csv_future = _IO_POOL.submit(mgr.export_noreply_csv_by_type, seen_no_reply, hours)
 
-            # Get CSV file paths if exported
-            csv_files = {}
-            if export_csv and seen_no_reply:
-                csv_files = mgr.export_noreply_csv_by_type(seen_no_reply, hours)
+                update_operation_state('scan_replies', 50, 100, 'running', 'Scanning for replies...')
 
-            update_operation_state('scan_replies', 50, 100, 'running', 'Scanning for replies...')
+                # Create callback to send real-time logs to frontend
+                def log_callback(message):
+                    if _LOG_KEEP_RE.search(message):
+                        add_operation_log(message)
 
-            # Create callback to send real-time logs to frontend
-            def log_callback(message):
-                if '✅ REPLY DETECTED' in message or '📧 Dialog' in message or '📊' in message or 'blue contacts' in message.lower():
-                    add_operation_log(message)
+                scan_result = run_coroutine_sync(
+                    mgr.scan_for_replies(dialog_limit=dialog_limit, log_callback=log_callback)
+                )
 
-            scan_result = loop.run_until_complete(
-                mgr.scan_for_replies(dialog_limit=dialog_limit, log_callback=log_callback)
-            )
+                # Get CSV file paths if exported
+                csv_files = csv_future.result() if csv_future else {}
+                for file_type, file_path in csv_files.items():
+                    logger.info(f"📁 No-reply CSV ({file_type.upper()}): {file_path}")
 
-            # Extract id_statuses (for update_statuses) and name_statuses (for frontend)
-            id_statuses = scan_result.get('id_statuses', {})
-            name_statuses = scan_result.get('name_statuses', {})
+                # Extract id_statuses (for update_statuses) and name_statuses (for frontend)
+                id_statuses = scan_result.get('id_statuses', {})
+                name_statuses = scan_result.get('name_statuses', {})
 
-            # STEP 4: Update statuses if replies found
-            if id_statuses:
-                update_operation_state('scan_replies', 70, 100, 'running', 'Updating statuses...')
-                update_result = loop.run_until_complete(
-                    mgr.update_statuses(id_statuses, interactive=False)
-                )
-            else:
-                update_result = {}
+                # STEP 4: Update statuses if replies found
+                if id_statuses:
+                    update_operation_state('scan_replies', 70, 100, 'running', 'Updating statuses...')
+                    update_result = run_coroutine_sync(
+                        mgr.update_statuses(id_statuses, interactive=False)
+                    )
+                else:
+                    update_result = {}
 
-            # STEP 5: Auto-backup contacts to update dashboard stats
-            backup_info = {}
-            try:
-                update_operation_state('scan_replies', 90, 100, 'running', 'Backing up contacts for dashboard...')
-                logger.info("Auto-backing up contacts after scan...")
+                # STEP 5: Auto-backup contacts to update dashboard stats
+                backup_info = {}
+                try:
+                    update_operation_state('scan_replies', 90, 100, 'running', 'Backing up contacts for dashboard...')
+                    logger.info("Auto-backing up contacts after scan...")
 
-                backup_result = loop.run_until_complete(
-                    mgr.export_all_contacts_backup()
-                )
+                    backup_result = run_coroutine_sync(
+                        mgr.export_all_contacts_backup()
+                    )
 
-                if backup_result:
-                    backup_path, contacts_count = backup_result
-                    if backup_path:
-                        # Log backup to database
-                        try:
-                            from account_manager import init_backups_table, log_backup
-                            init_backups_table()
-                            log_backup(
-                                phone=mgr.phone_number,
-                                filename=Path(backup_path).name,
-                                filepath=str(backup_path),
-                                contacts_count=contacts_count
-                            )
-                            backup_info = {
-                                'path': str(backup_path),
-                                'filename': Path(backup_path).name,
-                                'contacts_count': contacts_count
-                            }
-                            logger.info(f"✅ Auto-backup completed: {backup_path} ({contacts_count} contacts)")
-                        except Exception as db_err:
-                            logger.warning(f"⚠️  Failed to log backup to database: {db_err}")
-            except Exception as backup_err:
-                logger.warning(f"⚠️  Auto-backup failed (non-critical): {backup_err}")
-
-            # STEP 6: Clean up client before closing loop
-            if client_to_cleanup and client_to_cleanup.is_connected():
-                logger.info("Disconnecting client after scan...")
-                try:
-                    loop.run_until_complete(client_to_cleanup.disconnect())
-                    mgr.client = None
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting after scan: {e}")
+                    if backup_result:
+                        backup_path, contacts_count = backup_result
+                        if backup_path:
+                            # Log backup to database
+                            try:
+                                init_backups_table()
+                                log_backup(
+                                    phone=mgr.phone_number,
+                                    filename=Path(backup_path).name,
+                                    filepath=str(backup_path),
+                                    contacts_count=contacts_count
+                                )
+                                _resolve_latest_backup.cache_clear()
+                                backup_info = {
+                                    'path': str(backup_path),
+                                    'filename': Path(backup_path).name,
+                                    'contacts_count': contacts_count
+                                }
+                                logger.info(f"✅ Auto-backup completed: {backup_path} ({contacts_count} contacts)")
+                            except Exception as db_err:
+                                logger.warning(f"⚠️  Failed to log backup to database: {db_err}")
+                except Exception as backup_err:
+                    logger.warning(f"⚠️  Auto-backup failed (non-critical): {backup_err}")
 
-            reset_operation_state()
-            logger.info(f"✅ Scan completed for {mgr.phone_number}: {len(name_statuses)} replies found")
+                reset_operation_state()
+                logger.info(f"✅ Scan completed for {mgr.phone_number}: {len(name_statuses)} replies found")
 
-            return jsonify({
-                'success': True,
-                'operation': 'scan_replies',
-                'phone': mgr.phone_number,
-                'scan_results': name_statuses,  # {contact_name: True} for frontend display
-                'update_results': update_result,
-                'seen_no_reply': seen_no_reply,
-                'csv_files': csv_files,
-                'backup_info': backup_info
-            })
+                return jsonify({
+                    'success': True,
+                    'operation': 'scan_replies',
+                    'phone': mgr.phone_number,
+                    'scan_results': name_statuses,  # {contact_name: True} for frontend display
+                    'update_results': update_result,
+                    'seen_no_reply': seen_no_reply,
+                    'csv_files': csv_files,
+                    'backup_info': backup_info
+                })
 
         finally:
-            # STEP 6: Ensure client is disconnected before closing loop
-            if client_to_cleanup:
-                try:
-                    if client_to_cleanup.is_connected():
-                        loop.run_until_complete(client_to_cleanup.disconnect())
-                except Exception as e:
-                    logger.warning(f"⚠️  Cleanup error: {e}")
-            loop.close()
             # Release account lock
             account_locks.release(account_phone)
             logger.info(f"Released lock for account {account_phone}")
@@ -5276,8 +6452,7 @@ def scan_replies():
 
         # Check for FloodWaitError string in case it wasn't caught by TelegramRateLimitError
         if 'FloodWaitError' in error_str or 'FLOOD' in error_str.upper() or 'rate limit' in error_str.lower():
-            import re
-            wait_match = re.search(r'(\d+)\s*(?:seconds?|s)', error_str)
+            wait_match = _FLOODWAIT_RE.search(error_str)
             wait_seconds = int(wait_match.group(1)) if wait_match else 300
 
             set_rate_limit(wait_seconds, 'Telegram rate limit during scan')
@@ -5303,7 +6478,7 @@ def scan_replies():
             logger.info(f"Released lock for account {account_phone} after error")
         except:
             pass
-        return jsonify({'error': error_str, 'traceback': traceback.format_exc()}), 500
+        return _error_json(error_str), 500
 
 
 @app.route('/api/organize-folders', methods=['POST'])
@@ -5314,12 +6489,12 @@ def organize_folders():
     If 'phone' is not provided, uses the default account.
     """
     try:
-        data = request.get_json() if request.get_json() else {}
+        data = request.get_json() or {}
         phone = data.get('phone')  # Optional: specific account to use
 
         # Get manager for specific account or default
-        # IMPORTANT: use_shared_connection=False because Flask endpoints run in request threads
-        # with their own event loops, which are different from InboxManager's background loop.
+        # IMPORTANT: use_shared_connection=False because Flask endpoints run their coroutines on the
+        # shared event loop (async_loop.py), which is different from InboxManager's background loop.
         if phone:
             mgr = get_manager_for_account(phone, use_shared_connection=False)
             if not mgr:
@@ -5333,26 +6508,12 @@ def organize_folders():
         update_operation_state('organize_folders', 0, 100, 'starting', f'Creating folders for {mgr.phone_number}...')
 
         # Run async organize (non-interactive mode for API)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Disconnect from GlobalConnectionManager to release session file lock
-            clean_phone = normalize_phone(mgr.phone_number)
-            global_conn_manager = GlobalConnectionManager.get_instance()
-            if global_conn_manager.is_connected(clean_phone):
-                logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager...")
-                try:
-                    loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting: {e}")
-
-            # Initialize Telegram client
-            connected = loop.run_until_complete(mgr.init_client(mgr.phone_number))
+        with prepared_client(mgr) as connected:
             if not connected:
                 reset_operation_state()
                 return jsonify({'error': 'Failed to connect to Telegram'}), 500
 
-            result = loop.run_until_complete(
+            result = run_coroutine_sync(
                 mgr.organize_folders(interactive=False)
             )
 
@@ -5362,7 +6523,7 @@ def organize_folders():
             # Auto-backup after organize
             try:
                 logger.info(f"📦 Auto-backing up contacts after organize...")
-                backup_result = loop.run_until_complete(mgr.export_all_contacts_backup())
+                backup_result = run_coroutine_sync(mgr.export_all_contacts_backup())
                 logger.info(f"✅ Auto-backup completed: {backup_result}")
             except Exception as backup_error:
                 logger.warning(f"⚠️ Auto-backup failed: {backup_error}")
@@ -5373,21 +6534,10 @@ def organize_folders():
                 'phone': mgr.phone_number,
                 'result': result
             })
-        finally:
-            # Disconnect client to release session file lock
-            try:
-                if mgr.client:
-                    disconnect_coro = mgr.client.disconnect()
-                    if asyncio.iscoroutine(disconnect_coro):
-                        loop.run_until_complete(disconnect_coro)
-            except Exception as disconnect_error:
-                logger.warning(f"⚠️ Error disconnecting client: {disconnect_error}")
-            finally:
-                loop.close()
     except Exception as e:
         logger.error(f"❌ Error organizing folders: {str(e)}")
         reset_operation_state()
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/backup-contacts', methods=['POST'])
@@ -5398,12 +6548,12 @@ def backup_contacts():
     If 'phone' is not provided, uses the default account.
     """
     try:
-        data = request.get_json() if request.get_json() else {}
+        data = request.get_json() or {}
         phone = data.get('phone')  # Optional: specific account to use
 
         # Get manager for specific account or default
-        # IMPORTANT: use_shared_connection=False because Flask endpoints run in request threads
-        # with their own event loops, which are different from InboxManager's background loop.
+        # IMPORTANT: use_shared_connection=False because Flask endpoints run their coroutines on the
+        # shared event loop (async_loop.py), which is different from InboxManager's background loop.
         # Using shared connections would cause "asyncio event loop must not change" errors.
         if phone:
             mgr = get_manager_for_account(phone, use_shared_connection=False)
@@ -5419,42 +6569,12 @@ def backup_contacts():
         update_operation_state('backup_contacts', 0, 100, 'starting', f'Backing up contacts for {mgr.phone_number}...')
 
         # Run async backup
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        client_to_cleanup = None
-        try:
-            # Disconnect from GlobalConnectionManager to release session file lock
-            # This is necessary because InboxManager may have a client connected to this account
-            clean_phone = normalize_phone(mgr.phone_number)
-            global_conn_manager = GlobalConnectionManager.get_instance()
-            if global_conn_manager.is_connected(clean_phone):
-                logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager to release session lock...")
-                try:
-                    loop.run_until_complete(global_conn_manager.disconnect_account(clean_phone))
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting from GlobalConnectionManager: {e}")
-
-            # Also disconnect mgr.client if it exists (legacy path)
-            if mgr.client and mgr.client.is_connected():
-                logger.info("Temporarily disconnecting to release session lock...")
-                try:
-                    disconnect_coro = mgr.client.disconnect()
-                    if disconnect_coro:
-                        loop.run_until_complete(disconnect_coro)
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting: {e}")
-
-            # Connect fresh client for backup
-            logger.info("Connecting fresh client for backup...")
-            connected = loop.run_until_complete(mgr.init_client(mgr.phone_number))
+        with prepared_client(mgr) as connected:
             if not connected:
                 reset_operation_state()
                 return jsonify({'error': 'Failed to connect to Telegram'}), 500
 
-            # Save reference to client for cleanup
-            client_to_cleanup = mgr.client
-
-            backup_result = loop.run_until_complete(
+            backup_result = run_coroutine_sync(
                 mgr.export_all_contacts_backup()
             )
 
@@ -5466,7 +6586,6 @@ def backup_contacts():
 
             # Log backup to database
             try:
-                from account_manager import init_backups_table, log_backup
                 init_backups_table()  # Ensure table exists
                 log_backup(
                     phone=mgr.phone_number,
@@ -5474,6 +6593,7 @@ def backup_contacts():
                     filepath=str(backup_path),
                     contacts_count=contacts_count
                 )
+                _resolve_latest_backup.cache_clear()
             except Exception as e:
                 logger.warning(f"⚠️  Failed to log backup to database: {str(e)}")
 
@@ -5486,15 +6606,6 @@ def backup_contacts():
             reset_operation_state()
             logger.info(f"✅ Backup completed for {mgr.phone_number}: {backup_path} ({contacts_count} contacts)")
 
-            # Clean up client before closing loop
-            if client_to_cleanup and client_to_cleanup.is_connected():
-                logger.info("Disconnecting client after backup...")
-                try:
-                    loop.run_until_complete(client_to_cleanup.disconnect())
-                    mgr.client = None
-                except Exception as e:
-                    logger.warning(f"⚠️  Error disconnecting after backup: {e}")
-
             return jsonify({
                 'success': True,
                 'operation': 'backup_contacts',
@@ -5504,19 +6615,10 @@ def backup_contacts():
                 'contacts_count': contacts_count,
                 'download_url': download_url
             })
-        finally:
-            # Ensure client is disconnected before closing loop
-            if client_to_cleanup:
-                try:
-                    if client_to_cleanup.is_connected():
-                        loop.run_until_complete(client_to_cleanup.disconnect())
-                except Exception as e:
-                    logger.warning(f"⚠️  Cleanup error: {e}")
-            loop.close()
     except Exception as e:
         logger.error(f"❌ Error backing up contacts: {str(e)}")
         reset_operation_state()
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/backup-history', methods=['GET'])
@@ -5526,7 +6628,6 @@ def get_backup_history_endpoint():
         phone = request.args.get('phone')
         limit = int(request.args.get('limit', 10))
 
-        from account_manager import init_backups_table, get_backup_history
         init_backups_table()  # Ensure table exists
 
         backups = get_backup_history(phone=phone, limit=limit)
@@ -5538,7 +6639,7 @@ def get_backup_history_endpoint():
         })
     except Exception as e:
         logger.error(f"❌ Error getting backup history: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
@@ -5569,7 +6670,7 @@ def list_sessions():
         })
     except Exception as e:
         logger.error(f"❌ Error listing sessions: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/sessions/select', methods=['POST'])
@@ -5588,7 +6689,7 @@ def select_session():
             return jsonify({'error': 'phone required'}), 400
 
         # Clean phone number (remove +, -, spaces)
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
         
         # Verify account exists in database
         account = get_account_by_phone(clean_phone)
@@ -5619,7 +6720,7 @@ def select_session():
         })
     except Exception as e:
         logger.error(f"❌ Error selecting session: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
@@ -5641,68 +6742,62 @@ def trigger_auto_backup(phone: str):
         try:
             logger.info(f"📦 Auto-backup starting for {phone}...")
 
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                # Get account from database
-                account = get_account_by_phone(phone)
-                if not account:
-                    logger.warning(f"⚠️ Auto-backup: Account {phone} not found in database")
-                    return
-
-                # Get API credentials
-                api_id = account.get('api_id')
-                api_hash = account.get('api_hash')
-                proxy = account.get('proxy')
+            # Get account from database
+            account = get_account_by_phone(phone)
+            if not account:
+                logger.warning(f"⚠️ Auto-backup: Account {phone} not found in database")
+                return
 
-                # Fall back to global credentials if not set
-                if not api_id or not api_hash:
-                    config = load_config()
-                    api_id = config.get('api_id')
-                    api_hash = config.get('api_hash')
+            # Get API credentials
+            api_id = account.get('api_id')
+            api_hash = account.get('api_hash')
+            proxy = account.get('proxy')
 
-                if not api_id or not api_hash:
-                    logger.warning(f"⚠️ Auto-backup: No API credentials for {phone}")
-                    return
+            # Fall back to global credentials if not set
+            if not api_id or not api_hash:
+                config = load_config()
+                api_id = config.get('api_id')
+                api_hash = config.get('api_hash')
 
-                # Create manager WITHOUT shared connection pool
-                # (running in new thread with new event loop - can't reuse pool clients)
-                mgr = UnifiedContactManager(
-                    api_id, api_hash, phone, proxy=proxy,
-                    conn_manager=None  # Don't use shared pool in background thread
-                )
+            if not api_id or not api_hash:
+                logger.warning(f"⚠️ Auto-backup: No API credentials for {phone}")
+                return
 
-                async def do_backup():
-                    # Disconnect from GlobalConnectionManager if connected (release session lock)
-                    clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
-                    global_conn_manager = GlobalConnectionManager.get_instance()
-                    if global_conn_manager.is_connected(clean_phone):
-                        logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager for auto-backup...")
-                        await global_conn_manager.disconnect_account(clean_phone)
+            # Create manager WITHOUT GlobalConnectionManager (runs on the shared event
+            # loop, not the inbox loop); its client comes from client_pool
+            mgr = UnifiedContactManager(
+                api_id, api_hash, phone, proxy=proxy,
+                conn_manager=None  # Don't use the inbox connections in background thread
+            )
 
-                    connected = await mgr.init_client(phone)
-                    if not connected:
-                        logger.warning(f"⚠️ Auto-backup: Could not connect for {phone}")
-                        return None, 0
+            async def do_backup():
+                # Disconnect from GlobalConnectionManager if connected (release session lock)
+                clean_phone = _clean_phone(phone)
+                global_conn_manager = GlobalConnectionManager.get_instance()
+                if global_conn_manager.is_connected(clean_phone):
+                    logger.info(f"Disconnecting {clean_phone} from GlobalConnectionManager for auto-backup...")
+                    await global_conn_manager.disconnect_account(clean_phone)
 
-                    try:
-                        filename, count = await mgr.export_all_contacts_backup()
-                        return filename, count
-                    finally:
-                        # Don't disconnect - shared pool manages connections
-                        pass
+                connected = await client_pool.acheckout(mgr)
+                if not connected:
+                    client_pool.discard(mgr)
+                    logger.warning(f"⚠️ Auto-backup: Could not connect for {phone}")
+                    return None, 0
 
-                filename, count = loop.run_until_complete(do_backup())
+                try:
+                    filename, count = await mgr.export_all_contacts_backup()
+                except BaseException:
+                    client_pool.discard(mgr)
+                    raise
+                client_pool.checkin(mgr)
+                return filename, count
 
-                if filename:
-                    logger.info(f"✅ Auto-backup complete for {phone}: {count} contacts saved to {filename}")
-                else:
-                    logger.warning(f"⚠️ Auto-backup failed for {phone}")
+            filename, count = run_coroutine_sync(do_backup())
 
-            finally:
-                loop.close()
+            if filename:
+                logger.info(f"✅ Auto-backup complete for {phone}: {count} contacts saved to {filename}")
+            else:
+                logger.warning(f"⚠️ Auto-backup failed for {phone}")
 
         except Exception as e:
             logger.error(f"❌ Auto-backup error for {phone}: {str(e)}")
@@ -5750,7 +6845,7 @@ def send_auth_code():
             logger.info(f"📱 Using global API credentials for {phone}")
 
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
         phone_number = f"+{clean_phone}"
 
         # Clear any existing auth state for this phone (prevents stale state issues)
@@ -5820,7 +6915,7 @@ def send_auth_code():
 
     except Exception as e:
         logger.error(f"❌ Error sending auth code: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/auth/start', methods=['POST'])
@@ -5843,7 +6938,7 @@ def verify_auth_code():
             return jsonify({'error': 'phone and code required'}), 400
 
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
 
         # Get auth state
         with auth_state_lock:
@@ -5923,7 +7018,7 @@ def verify_auth_code():
             except:
                 pass
         logger.error(f"❌ Error verifying code: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/auth/submit-code', methods=['POST'])
@@ -5946,7 +7041,7 @@ def verify_auth_password():
             return jsonify({'error': 'phone and password required'}), 400
 
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
 
         # Get auth state
         with auth_state_lock:
@@ -6007,7 +7102,7 @@ def verify_auth_password():
             except:
                 pass
         logger.error(f"❌ Error verifying password: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/auth/submit-password', methods=['POST'])
@@ -6033,7 +7128,7 @@ def list_accounts():
         })
     except Exception as e:
         logger.error(f"❌ Error listing accounts: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/active', methods=['GET'])
@@ -6048,7 +7143,7 @@ def list_active_accounts():
         })
     except Exception as e:
         logger.error(f"❌ Error listing active accounts: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/add', methods=['POST'])
@@ -6066,7 +7161,7 @@ def add_account_endpoint():
             return jsonify({'error': 'phone required'}), 400
 
         # Construct session path
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
         sessions_dir = Path(__file__).parent.parent / "sessions"
         session_path = str(sessions_dir / f"session_{clean_phone}.session")
 
@@ -6078,6 +7173,8 @@ def add_account_endpoint():
             session_path=session_path,
             notes=notes
         )
+        _cached_account_by_phone.cache_clear()
+        invalidate_manager(phone)
 
         if success:
             logger.info(f"✅ Added account: {phone}")
@@ -6090,7 +7187,7 @@ def add_account_endpoint():
             return jsonify({'error': 'Account already exists'}), 400
     except Exception as e:
         logger.error(f"❌ Error adding account: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/validate', methods=['POST'])
@@ -6105,31 +7202,26 @@ def validate_account_endpoint():
         if not phone:
             return jsonify({'error': 'phone required'}), 400
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            is_valid, message = loop.run_until_complete(
-                validate_account(phone, api_id, api_hash)
-            )
-            
-            response = {
-                'success': True,
-                'phone': phone,
-                'is_valid': is_valid,
-                'message': message
-            }
-            
-            # If session is expired, suggest re-authentication
-            if not is_valid and 'needs authentication' in message.lower():
-                response['needs_reauth'] = True
-                response['suggestion'] = 'Session expired. Please re-authenticate using the Authentication page (/auth)'
-            
-            return jsonify(response)
-        finally:
-            loop.close()
+        is_valid, message = run_coroutine_sync(
+            validate_account(phone, api_id, api_hash)
+        )
+        
+        response = {
+            'success': True,
+            'phone': phone,
+            'is_valid': is_valid,
+            'message': message
+        }
+        
+        # If session is expired, suggest re-authentication
+        if not is_valid and 'needs authentication' in message.lower():
+            response['needs_reauth'] = True
+            response['suggestion'] = 'Session expired. Please re-authenticate using the Authentication page (/auth)'
+        
+        return jsonify(response)
     except Exception as e:
         logger.error(f"❌ Error validating account: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/validate-batch', methods=['POST'])
@@ -6142,22 +7234,17 @@ def validate_accounts_batch_endpoint():
         if not phones:
             return jsonify({'error': 'phones array required'}), 400
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            results = loop.run_until_complete(
-                validate_accounts_batch(phones)
-            )
-            return jsonify({
-                'success': True,
-                'results': {phone: {'is_valid': valid, 'message': msg} 
-                           for phone, (valid, msg) in results.items()}
-            })
-        finally:
-            loop.close()
+        results = run_coroutine_sync(
+            validate_accounts_batch(phones)
+        )
+        return jsonify({
+            'success': True,
+            'results': {phone: {'is_valid': valid, 'message': msg} 
+                       for phone, (valid, msg) in results.items()}
+        })
     except Exception as e:
         logger.error(f"❌ Error validating accounts batch: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/<phone>', methods=['DELETE'])
@@ -6165,18 +7252,13 @@ def delete_account_endpoint(phone):
     """Delete an account and clean up session file"""
     try:
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
 
         # First disconnect from GlobalConnectionManager if connected
         conn_manager = GlobalConnectionManager.get_instance()
         if conn_manager.is_connected(clean_phone):
             logger.info(f"🔌 Disconnecting account {clean_phone} from shared pool...")
-            # Run async disconnect in a new event loop
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(conn_manager.disconnect_account(clean_phone))
-            finally:
-                loop.close()
+            run_coroutine_sync(conn_manager.disconnect_account(clean_phone))
             logger.info(f"✅ Disconnected from shared pool")
 
         # Delete session file to ensure clean state
@@ -6190,6 +7272,8 @@ def delete_account_endpoint(phone):
 
         # Delete from database
         success = delete_account(phone)
+        _cached_account_by_phone.cache_clear()
+        invalidate_manager(phone)
         if success:
             logger.info(f"✅ Deleted account: {phone}")
             return jsonify({
@@ -6200,7 +7284,7 @@ def delete_account_endpoint(phone):
             return jsonify({'error': 'Account not found'}), 404
     except Exception as e:
         logger.error(f"❌ Error deleting account: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/<phone>/status', methods=['PUT'])
@@ -6214,21 +7298,19 @@ def update_account_status_endpoint(phone):
             return jsonify({'error': 'status required'}), 400
 
         # Clean phone number
-        clean_phone = phone.replace('+', '').replace('-', '').replace(' ', '')
+        clean_phone = _clean_phone(phone)
 
         # If deactivating, disconnect from GlobalConnectionManager first
         if status in ['inactive', 'disabled', 'error']:
             conn_manager = GlobalConnectionManager.get_instance()
             if conn_manager.is_connected(clean_phone):
                 logger.info(f"🔌 Disconnecting account {clean_phone} (status -> {status})...")
-                loop = asyncio.new_event_loop()
-                try:
-                    loop.run_until_complete(conn_manager.disconnect_account(clean_phone))
-                finally:
-                    loop.close()
+                run_coroutine_sync(conn_manager.disconnect_account(clean_phone))
                 logger.info(f"✅ Disconnected from shared pool")
 
         success = update_account_status(phone, status)
+        _cached_account_by_phone.cache_clear()
+        invalidate_manager(phone)
         if success:
             return jsonify({
                 'success': True,
@@ -6238,7 +7320,7 @@ def update_account_status_endpoint(phone):
             return jsonify({'error': 'Account not found'}), 404
     except Exception as e:
         logger.error(f"❌ Error updating account status: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/accounts/<phone>/proxy', methods=['PUT'])
@@ -6258,7 +7340,7 @@ def update_account_proxy_endpoint(phone):
         Success message with re-authentication required notice
     """
     try:
-        data = request.get_json() if request.get_json() else {}
+        data = request.get_json() or {}
         proxy = data.get('proxy')  # Can be None to remove proxy
 
         # Validate proxy format if provided
@@ -6278,6 +7360,8 @@ def update_account_proxy_endpoint(phone):
 
         # Update proxy and invalidate session
         success, message = update_account_proxy(phone, proxy)
+        _cached_account_by_phone.cache_clear()
+        invalidate_manager(phone)
 
         if success:
             # Reset global manager if this was the default account
@@ -6298,15 +7382,13 @@ def update_account_proxy_endpoint(phone):
 
     except Exception as e:
         logger.error(f"❌ Error updating account proxy: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
 # LOG ENDPOINTS
 # ============================================================================
 
-import re
-
 def parse_log_line(line: str, log_id: int) -> Optional[Dict[str, Any]]:
     """Parse a raw log line into a structured log object"""
     try:
@@ -6416,7 +7498,7 @@ def get_logs():
         })
     except Exception as e:
         logger.error(f"❌ Error getting logs: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
@@ -6467,7 +7549,7 @@ def upload_csv():
         })
     except Exception as e:
         logger.error(f"❌ Error uploading CSV: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 @app.route('/api/uploads', methods=['GET'])
@@ -6495,7 +7577,7 @@ def list_uploads():
         })
     except Exception as e:
         logger.error(f"❌ Error listing uploads: {str(e)}")
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+        return _error_json(str(e)), 500
 
 
 # ============================================================================
@@ -7061,6 +8143,13 @@ if __name__ == '__main__':
     except Exception as e:
         logger.warning(f"⚠️  Could not initialize operations tables: {str(e)}")
 
+    # Initialize backups tables (backup history + cached stats)
+    try:
+        init_backups_table()
+        logger.info("✅ Backups tables ready")
+    except Exception as e:
+        logger.warning(f"⚠️  Could not initialize backups tables: {str(e)}")
+
     # Initialize inbox tables for real-time message management
     try:
         init_inbox_tables()
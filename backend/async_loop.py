@@ -0,0 +1,96 @@
+"""
+MATRIX Shared Background Event Loop
+===================================
+One persistent asyncio loop on a daemon thread, shared by the synchronous
+Flask endpoints and worker threads.
+
+Endpoints used to create, set and close a fresh event loop per request.
+Running everything on one long-lived loop removes that setup/teardown and lets
+TGClient instances (which are bound to the loop that created them) be reused
+across requests.
+
+Usage:
+    from async_loop import AsyncEventLoopThread
+
+    result = AsyncEventLoopThread.instance().run_coroutine(mgr.init_client(phone)).result()
+
+Note: the inbox manager / GlobalConnectionManager keep their own loop.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEventLoopThread(threading.Thread):
+    """
+    Daemon thread running a single asyncio event loop forever.
+
+    Use AsyncEventLoopThread.instance() to get the process-wide loop thread
+    (started on first use).
+    """
+
+    _instance: Optional['AsyncEventLoopThread'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, name: str = "async_loop"):
+        super().__init__(daemon=True, name=name)
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+
+    @classmethod
+    def instance(cls) -> 'AsyncEventLoopThread':
+        """Get the shared loop thread, starting it if needed (thread-safe)"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                thread = cls()
+                thread.start()
+                thread._started.wait()
+                cls._instance = thread
+                logger.info("🔁 Shared asyncio loop thread started")
+            return cls._instance
+
+    def run(self):
+        """Thread body: run the loop until stop() is called"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def run_coroutine(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the shared loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future with the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Stop the loop (pending coroutines are abandoned)"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def run_coroutine_sync(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared loop and block until it finishes.
+
+    Must not be called from the shared loop's own thread (it would deadlock).
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait (None = no limit)
+
+    Returns:
+        The coroutine's result (its exception is re-raised)
+    """
+    return AsyncEventLoopThread.instance().run_coroutine(coro).result(timeout=timeout)
@@ -101,6 +101,7 @@ class GlobalConnectionManager:
         self._event_processor = None  # Set by InboxManager
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._shutting_down = False
+        self._acquire_listeners: List[Callable[[str], None]] = []  # Called before connecting an account
 
         GlobalConnectionManager._initialized = True
         logger.info("🔧 GlobalConnectionManager initialized (StringSession mode)")
@@ -129,6 +130,15 @@ class GlobalConnectionManager:
         """Set the asyncio event loop."""
         self._loop = loop
 
+    def add_acquire_listener(self, callback: Callable[[str], None]):
+        """
+        Register a callback run with the clean phone before this manager connects an account.
+
+        Lets other owners of the account's session (e.g. the API server's client pool)
+        let go of it first. The callback must not block.
+        """
+        self._acquire_listeners.append(callback)
+
     def _normalize_phone(self, phone: str) -> str:
         """Normalize phone number (remove + prefix)."""
         return phone.lstrip('+').strip()
@@ -217,6 +227,12 @@ class GlobalConnectionManager:
         proxy_tuple = self._parse_proxy(proxy) if isinstance(proxy, str) else proxy
 
         async with self._get_lock(clean_phone):
+            for listener in self._acquire_listeners:
+                try:
+                    listener(clean_phone)
+                except Exception as e:
+                    logger.warning(f"Acquire listener failed for {clean_phone}: {e}")
+
             try:
                 logger.info(f"Connecting account {clean_phone} via TGClient (StringSession)...")
 
@@ -73,8 +73,7 @@ export function useWebSocket() {
     });
 
     // Handle progress updates
-    socket.on('operation_progress', (data) => {
-      console.log('Progress update:', data);
+    const handleProgress = (data) => {
       setOperationProgress((prev) => {
         if (!prev) return null;
         return {
@@ -93,7 +92,8 @@ export function useWebSocket() {
           },
         };
       });
-    });
+    };
+    socket.on('operation_progress', handleProgress);
 
     // Handle batch delay countdown events
     socket.on('batch_delay_start', (data) => {
@@ -132,9 +132,41 @@ export function useWebSocket() {
     });
 
     // Handle log messages
-    socket.on('operation_log', (data) => {
-      console.log('Log message:', data);
+    const handleLog = (data) => {
       setLogs((prev) => [...prev, { ...data.log, phone: data.phone }]);
+    };
+    socket.on('operation_log', handleLog);
+
+    // Handle batched log messages (coalesced import progress)
+    const handleLogBatch = (data) => {
+      setLogs((prev) => [
+        ...prev,
+        ...data.logs.map((log) => ({ ...log, phone: data.phone })),
+      ]);
+    };
+    socket.on('operation_log_batch', handleLogBatch);
+
+    // Handle time-window batches of the events above (one message per ~50ms)
+    const batchHandlers = {
+      operation_progress: handleProgress,
+      operation_log: handleLog,
+      operation_log_batch: handleLogBatch,
+    };
+    socket.on('operation_batch', (data) => {
+      // Server queue overflowed: oldest events were dropped before this batch
+      if (data.dropped) {
+        setLogs((prev) => [
+          ...prev,
+          {
+            timestamp: new Date().toISOString(),
+            level: 'warning',
+            message: `${data.dropped} older log messages were skipped (too many to stream)`,
+          },
+        ]);
+      }
+      data.events.forEach(({ event, data: payload }) => {
+        batchHandlers[event]?.(payload);
+      });
     });
 
     // Handle operation completion